@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""benchmarks for Visitor / Plugin.run and module import
+
+    python benchmarks/bench.py --save before.json
+    # ... make changes ...
+    python benchmarks/bench.py --compare before.json
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+REGRESSION = os.path.join(os.path.dirname(HERE), 'testing', 'corpus')
+REGRESSION_FILES = sorted(
+    os.path.join(REGRESSION, f)
+    for f in os.listdir(REGRESSION) if f.endswith('.py')
+)
+
+from flake8_typing_imports import Plugin  # noqa: E402
+
+NAMES = (
+    'Any', 'AsyncContextManager', 'Awaitable', 'Callable', 'ClassVar', 'Dict',
+    'Final', 'List', 'Literal', 'NoReturn', 'Optional', 'OrderedDict',
+    'Protocol', 'Tuple', 'Type', 'TypedDict', 'Union', 'overload',
+)
+
+
+def _no_typing(i: int) -> str:
+    return ''.join(
+        f'def f{j}(x, y={j}):\n'
+        f'    return [v * {i} for v in range(x) if v % y]\n\n\n'
+        for j in range(50)
+    )
+
+
+def _from_imports(i: int) -> str:
+    imports = ''.join(f'from typing import {name}\n' for name in NAMES)
+    return imports + ''.join(
+        f'def f{j}(x: {NAMES[j % len(NAMES)]}) -> None:\n    pass\n\n\n'
+        for j in range(50)
+    )
+
+
+def _attributes(i: int) -> str:
+    return 'import typing\n' + ''.join(
+        f'x{j}: typing.{NAMES[j % len(NAMES)]}[typing.Any] = None\n'
+        for j in range(2000)
+    )
+
+
+def _nested(i: int) -> str:
+    # every level is a node of its own (redundant parentheses are not)
+    union = 'int'
+    call = f'{i}'
+    for _ in range(25):
+        union = f'Union[List[{union}], Pattern]'
+        call = f'f({call}, typing.Any)'
+    parts = [
+        'import typing\n'
+        'from typing import List, Match, NamedTuple, Pattern, Union\n',
+    ]
+    for j in range(20):
+        parts.append(f'class NT{j}(NamedTuple):\n')
+        parts.append('    x: Union[Pattern, Match, int] = 1\n')
+        parts.append(f'    def f(self) -> {union}:\n')
+        parts.append(f'        return {call}\n')
+    for depth in range(20):
+        parts.append(f'{"    " * depth}class C{depth}(NamedTuple):\n')
+    parts.append(f'{"    " * 20}x: {union} = {call}\n')
+    return ''.join(parts)
+
+
+def _regression(i: int) -> str:
+    with open(REGRESSION_FILES[i % len(REGRESSION_FILES)]) as f:
+        return f.read()
+
+
+CORPORA: Dict[str, Tuple[Callable[[int], str], int]] = {
+    'no_typing': (_no_typing, 200),
+    'from_imports': (_from_imports, 200),
+    'attributes': (_attributes, 20),
+    'nested': (_nested, 100),
+    'regression': (_regression, 10 * len(REGRESSION_FILES)),
+}
+
+
+def _corpus(name: str) -> List[Tuple[ast.AST, List[str]]]:
+    func, n = CORPORA[name]
+    ret: List[Tuple[ast.AST, List[str]]] = []
+    for i in range(n):
+        src = func(i)
+        ret.append((ast.parse(src), src.splitlines(True)))
+    return ret
+
+
+def _check(corpus: List[Tuple[ast.AST, List[str]]]) -> List[float]:
+    times = []
+    for tree, lines in corpus:
+        t0 = time.perf_counter()
+        for _ in Plugin(tree, lines).run():
+            pass
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def bench_corpus(name: str, repeat: int) -> Dict[str, float]:
+    corpus = _corpus(name)
+    _check(corpus)  # warm up
+
+    best = min((_check(corpus) for _ in range(repeat)), key=sum)
+
+    tracemalloc.start()
+    _check(corpus)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'per_file_us': statistics.median(best) * 1e6,
+        'files_per_s': len(best) / sum(best),
+        'peak_kib': peak / 1024,
+    }
+
+
+def bench_import(repeat: int) -> Dict[str, float]:
+    cmd = (sys.executable, '-X', 'importtime', '-c', f'import {Plugin.name}')
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(HERE))
+        env['PYTHONPYCACHEPREFIX'] = tmpdir
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        # the first run populates the bytecode cache
+        subprocess.run(cmd, env=env, stderr=subprocess.DEVNULL, check=True)
+
+        self_us = []
+        cumulative_us = []
+        for _ in range(repeat):
+            proc = subprocess.run(
+                cmd, env=env, stderr=subprocess.PIPE, check=True,
+                universal_newlines=True,
+            )
+            line = proc.stderr.splitlines()[-1]
+            self_s, cumulative_s, _ = line[len('import time:'):].split('|')
+            self_us.append(int(self_s))
+            cumulative_us.append(int(cumulative_s))
+
+    return {
+        'self_us': float(min(self_us)),
+        'cumulative_us': float(min(cumulative_us)),
+    }
+
+
+# metric => True if bigger is better
+HIGHER_IS_BETTER = {
+    'per_file_us': False,
+    'files_per_s': True,
+    'peak_kib': False,
+    'self_us': False,
+    'cumulative_us': False,
+}
+
+
+def compare(
+        old: Dict[str, Dict[str, float]],
+        new: Dict[str, Dict[str, float]],
+        tolerance: float,
+) -> int:
+    ret = 0
+    for bench, metrics in new.items():
+        for metric, value in metrics.items():
+            if metric not in old.get(bench, {}):
+                continue
+            before = old[bench][metric]
+            change = (value - before) / before if before else 0.
+            if HIGHER_IS_BETTER[metric]:
+                change = -change
+            if change > tolerance:
+                status = 'REGRESSED'
+                ret = 1
+            else:
+                status = 'ok'
+            print(
+                f'{bench:<14} {metric:<14} {before:>12.1f} -> {value:>12.1f} '
+                f'({change:+.1%} cost) {status}',
+            )
+    return ret
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--only', action='append', choices=(*CORPORA, 'import'),
+    )
+    parser.add_argument('--save', metavar='JSON', help='write results here')
+    parser.add_argument(
+        '--compare', metavar='JSON', help='compare against these results',
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=.1,
+        help='allowed relative cost increase (default: %(default)s)',
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for name in CORPORA:
+        if not args.only or name in args.only:
+            results[name] = bench_corpus(name, args.repeat)
+    if not args.only or 'import' in args.only:
+        results['import'] = bench_import(args.repeat)
+
+    print(json.dumps(results, indent=2, sort_keys=True))
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    if args.compare:
+        with open(args.compare) as f:
+            return compare(json.load(f), results, args.tolerance)
+    else:
+        return 0
+
+
+if __name__ == '__main__':
+    exit(main())
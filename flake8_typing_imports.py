@@ -1,21 +1,42 @@
+import array
 import ast
+import bisect
 import collections
 import configparser
+import fnmatch
+import functools
+import hashlib
+import io
+import json
 import os.path
+import re
+import stat
 import sys
+import time
+import tokenize
 from typing import Any
+from typing import BinaryIO
+from typing import Callable
 from typing import Dict
 from typing import Generator
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
 from typing import Set
+from typing import TYPE_CHECKING
 from typing import Tuple
 from typing import Type
+from typing import TypeVar
+from typing import Union
 
-if sys.version_info < (3, 8):  # pragma: no cover (<PY38)
-    import importlib_metadata
-else:  # pragma: no cover (PY38+)
-    import importlib.metadata as importlib_metadata
+if TYPE_CHECKING:
+    # only needed by the command line and the daemon, which import them
+    # when they run: every flake8 worker imports this module
+    import argparse
+    import socketserver
 
 
 class Version(NamedTuple):
@@ -32,600 +53,403 @@ class Version(NamedTuple):
 
 
 # GENERATED BY ./bin/build-generated
-SYMBOLS = (
-    (
-        Version(3, 5, 0), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'BinaryIO', 'ByteString',
-            'Callable', 'Container', 'Dict', 'FrozenSet', 'Generator',
-            'Generic', 'Hashable', 'IO', 'ItemsView', 'Iterable', 'Iterator',
-            'KeysView', 'List', 'Mapping', 'MappingView', 'Match',
-            'MutableMapping', 'MutableSequence', 'MutableSet', 'NamedTuple',
-            'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized',
-            'SupportsAbs', 'SupportsBytes', 'SupportsComplex', 'SupportsFloat',
-            'SupportsInt', 'SupportsRound', 'TextIO', 'Tuple', 'TypeVar',
-            'Union', 'ValuesView', 'cast', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 5, 1), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'BinaryIO', 'ByteString',
-            'Callable', 'Container', 'Dict', 'FrozenSet', 'Generator',
-            'Generic', 'Hashable', 'IO', 'ItemsView', 'Iterable', 'Iterator',
-            'KeysView', 'List', 'Mapping', 'MappingView', 'Match',
-            'MutableMapping', 'MutableSequence', 'MutableSet', 'NamedTuple',
-            'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized',
-            'SupportsAbs', 'SupportsBytes', 'SupportsComplex', 'SupportsFloat',
-            'SupportsInt', 'SupportsRound', 'TextIO', 'Tuple', 'TypeVar',
-            'Union', 'ValuesView', 'cast', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 5, 2), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncIterable', 'AsyncIterator',
-            'Awaitable', 'BinaryIO', 'ByteString', 'Callable', 'Container',
-            'DefaultDict', 'Dict', 'FrozenSet', 'Generator', 'Generic',
-            'Hashable', 'IO', 'ItemsView', 'Iterable', 'Iterator', 'KeysView',
-            'List', 'Mapping', 'MappingView', 'Match', 'MutableMapping',
-            'MutableSequence', 'MutableSet', 'NamedTuple', 'NewType',
-            'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized',
-            'SupportsAbs', 'SupportsBytes', 'SupportsComplex', 'SupportsFloat',
-            'SupportsInt', 'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO',
-            'Tuple', 'Type', 'TypeVar', 'Union', 'ValuesView', 'cast',
-            'get_type_hints', 'no_type_check', 'no_type_check_decorator',
-            'overload',
-        )),
-    ),
-    (
-        Version(3, 5, 3), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncIterable', 'AsyncIterator',
-            'Awaitable', 'BinaryIO', 'ByteString', 'Callable', 'ClassVar',
-            'Container', 'Coroutine', 'DefaultDict', 'Dict', 'FrozenSet',
-            'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView', 'Iterable',
-            'Iterator', 'KeysView', 'List', 'Mapping', 'MappingView', 'Match',
-            'MutableMapping', 'MutableSequence', 'MutableSet', 'NamedTuple',
-            'NewType', 'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set',
-            'Sized', 'SupportsAbs', 'SupportsBytes', 'SupportsComplex',
-            'SupportsFloat', 'SupportsInt', 'SupportsRound', 'TYPE_CHECKING',
-            'Text', 'TextIO', 'Tuple', 'Type', 'TypeVar', 'Union',
-            'ValuesView', 'cast', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 5, 4), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncIterable', 'AsyncIterator', 'Awaitable', 'BinaryIO',
-            'ByteString', 'Callable', 'ChainMap', 'ClassVar', 'Container',
-            'ContextManager', 'Coroutine', 'Counter', 'DefaultDict', 'Deque',
-            'Dict', 'FrozenSet', 'Generator', 'Generic', 'GenericMeta',
-            'Hashable', 'IO', 'ItemsView', 'Iterable', 'Iterator', 'KeysView',
-            'List', 'Mapping', 'MappingView', 'Match', 'MutableMapping',
-            'MutableSequence', 'MutableSet', 'NamedTuple', 'NewType',
-            'NoReturn', 'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set',
-            'Sized', 'SupportsAbs', 'SupportsBytes', 'SupportsComplex',
-            'SupportsFloat', 'SupportsInt', 'SupportsRound', 'TYPE_CHECKING',
-            'Text', 'TextIO', 'Tuple', 'Type', 'TypeVar', 'Union',
-            'ValuesView', 'cast', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 5, 5), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncIterable', 'AsyncIterator', 'Awaitable', 'BinaryIO',
-            'ByteString', 'Callable', 'ChainMap', 'ClassVar', 'Container',
-            'ContextManager', 'Coroutine', 'Counter', 'DefaultDict', 'Deque',
-            'Dict', 'FrozenSet', 'Generator', 'Generic', 'GenericMeta',
-            'Hashable', 'IO', 'ItemsView', 'Iterable', 'Iterator', 'KeysView',
-            'List', 'Mapping', 'MappingView', 'Match', 'MutableMapping',
-            'MutableSequence', 'MutableSet', 'NamedTuple', 'NewType',
-            'NoReturn', 'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set',
-            'Sized', 'SupportsAbs', 'SupportsBytes', 'SupportsComplex',
-            'SupportsFloat', 'SupportsInt', 'SupportsRound', 'TYPE_CHECKING',
-            'Text', 'TextIO', 'Tuple', 'Type', 'TypeVar', 'Union',
-            'ValuesView', 'cast', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 5, 6), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncIterable', 'AsyncIterator', 'Awaitable', 'BinaryIO',
-            'ByteString', 'Callable', 'ChainMap', 'ClassVar', 'Container',
-            'ContextManager', 'Coroutine', 'Counter', 'DefaultDict', 'Deque',
-            'Dict', 'FrozenSet', 'Generator', 'Generic', 'GenericMeta',
-            'Hashable', 'IO', 'ItemsView', 'Iterable', 'Iterator', 'KeysView',
-            'List', 'Mapping', 'MappingView', 'Match', 'MutableMapping',
-            'MutableSequence', 'MutableSet', 'NamedTuple', 'NewType',
-            'NoReturn', 'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set',
-            'Sized', 'SupportsAbs', 'SupportsBytes', 'SupportsComplex',
-            'SupportsFloat', 'SupportsInt', 'SupportsRound', 'TYPE_CHECKING',
-            'Text', 'TextIO', 'Tuple', 'Type', 'TypeVar', 'Union',
-            'ValuesView', 'cast', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 5, 7), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncIterable', 'AsyncIterator', 'Awaitable', 'BinaryIO',
-            'ByteString', 'Callable', 'ChainMap', 'ClassVar', 'Container',
-            'ContextManager', 'Coroutine', 'Counter', 'DefaultDict', 'Deque',
-            'Dict', 'FrozenSet', 'Generator', 'Generic', 'GenericMeta',
-            'Hashable', 'IO', 'ItemsView', 'Iterable', 'Iterator', 'KeysView',
-            'List', 'Mapping', 'MappingView', 'Match', 'MutableMapping',
-            'MutableSequence', 'MutableSet', 'NamedTuple', 'NewType',
-            'NoReturn', 'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set',
-            'Sized', 'SupportsAbs', 'SupportsBytes', 'SupportsComplex',
-            'SupportsFloat', 'SupportsInt', 'SupportsRound', 'TYPE_CHECKING',
-            'Text', 'TextIO', 'Tuple', 'Type', 'TypeVar', 'Union',
-            'ValuesView', 'cast', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 5, 8), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncIterable', 'AsyncIterator', 'Awaitable', 'BinaryIO',
-            'ByteString', 'Callable', 'ChainMap', 'ClassVar', 'Container',
-            'ContextManager', 'Coroutine', 'Counter', 'DefaultDict', 'Deque',
-            'Dict', 'FrozenSet', 'Generator', 'Generic', 'GenericMeta',
-            'Hashable', 'IO', 'ItemsView', 'Iterable', 'Iterator', 'KeysView',
-            'List', 'Mapping', 'MappingView', 'Match', 'MutableMapping',
-            'MutableSequence', 'MutableSet', 'NamedTuple', 'NewType',
-            'NoReturn', 'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set',
-            'Sized', 'SupportsAbs', 'SupportsBytes', 'SupportsComplex',
-            'SupportsFloat', 'SupportsInt', 'SupportsRound', 'TYPE_CHECKING',
-            'Text', 'TextIO', 'Tuple', 'Type', 'TypeVar', 'Union',
-            'ValuesView', 'cast', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 5, 9), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncIterable', 'AsyncIterator', 'Awaitable', 'BinaryIO',
-            'ByteString', 'Callable', 'ChainMap', 'ClassVar', 'Container',
-            'ContextManager', 'Coroutine', 'Counter', 'DefaultDict', 'Deque',
-            'Dict', 'FrozenSet', 'Generator', 'Generic', 'GenericMeta',
-            'Hashable', 'IO', 'ItemsView', 'Iterable', 'Iterator', 'KeysView',
-            'List', 'Mapping', 'MappingView', 'Match', 'MutableMapping',
-            'MutableSequence', 'MutableSet', 'NamedTuple', 'NewType',
-            'NoReturn', 'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set',
-            'Sized', 'SupportsAbs', 'SupportsBytes', 'SupportsComplex',
-            'SupportsFloat', 'SupportsInt', 'SupportsRound', 'TYPE_CHECKING',
-            'Text', 'TextIO', 'Tuple', 'Type', 'TypeVar', 'Union',
-            'ValuesView', 'cast', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 6, 0), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncIterable', 'AsyncIterator',
-            'Awaitable', 'BinaryIO', 'ByteString', 'Callable', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'DefaultDict', 'Dict', 'FrozenSet', 'Generator', 'Generic',
-            'Hashable', 'IO', 'ItemsView', 'Iterable', 'Iterator', 'KeysView',
-            'List', 'Mapping', 'MappingView', 'Match', 'MutableMapping',
-            'MutableSequence', 'MutableSet', 'NamedTuple', 'NewType',
-            'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized',
-            'SupportsAbs', 'SupportsBytes', 'SupportsComplex', 'SupportsFloat',
-            'SupportsInt', 'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO',
-            'Tuple', 'Type', 'TypeVar', 'Union', 'ValuesView', 'cast',
-            'get_type_hints', 'no_type_check', 'no_type_check_decorator',
-            'overload',
-        )),
-    ),
-    (
-        Version(3, 6, 1), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncGenerator', 'AsyncIterable',
-            'AsyncIterator', 'Awaitable', 'BinaryIO', 'ByteString', 'Callable',
-            'ChainMap', 'ClassVar', 'Collection', 'Container',
-            'ContextManager', 'Coroutine', 'Counter', 'DefaultDict', 'Deque',
-            'Dict', 'FrozenSet', 'Generator', 'Generic', 'GenericMeta',
-            'Hashable', 'IO', 'ItemsView', 'Iterable', 'Iterator', 'KeysView',
-            'List', 'Mapping', 'MappingView', 'Match', 'MutableMapping',
-            'MutableSequence', 'MutableSet', 'NamedTuple', 'NewType',
-            'Optional', 'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized',
-            'SupportsAbs', 'SupportsBytes', 'SupportsComplex', 'SupportsFloat',
-            'SupportsInt', 'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO',
-            'Tuple', 'Type', 'TypeVar', 'Union', 'ValuesView', 'cast',
-            'get_type_hints', 'no_type_check', 'no_type_check_decorator',
-            'overload',
-        )),
-    ),
-    (
-        Version(3, 6, 2), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'FrozenSet',
-            'Generator', 'Generic', 'GenericMeta', 'Hashable', 'IO',
-            'ItemsView', 'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized', 'SupportsAbs',
-            'SupportsBytes', 'SupportsComplex', 'SupportsFloat', 'SupportsInt',
-            'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple',
-            'Type', 'TypeVar', 'Union', 'ValuesView', 'cast', 'get_type_hints',
-            'no_type_check', 'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 6, 3), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'FrozenSet',
-            'Generator', 'Generic', 'GenericMeta', 'Hashable', 'IO',
-            'ItemsView', 'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized', 'SupportsAbs',
-            'SupportsBytes', 'SupportsComplex', 'SupportsFloat', 'SupportsInt',
-            'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple',
-            'Type', 'TypeVar', 'Union', 'ValuesView', 'cast', 'get_type_hints',
-            'no_type_check', 'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 6, 4), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'FrozenSet',
-            'Generator', 'Generic', 'GenericMeta', 'Hashable', 'IO',
-            'ItemsView', 'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized', 'SupportsAbs',
-            'SupportsBytes', 'SupportsComplex', 'SupportsFloat', 'SupportsInt',
-            'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple',
-            'Type', 'TypeVar', 'Union', 'ValuesView', 'cast', 'get_type_hints',
-            'no_type_check', 'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 6, 5), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'FrozenSet',
-            'Generator', 'Generic', 'GenericMeta', 'Hashable', 'IO',
-            'ItemsView', 'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized', 'SupportsAbs',
-            'SupportsBytes', 'SupportsComplex', 'SupportsFloat', 'SupportsInt',
-            'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple',
-            'Type', 'TypeVar', 'Union', 'ValuesView', 'cast', 'get_type_hints',
-            'no_type_check', 'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 6, 6), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'FrozenSet',
-            'Generator', 'Generic', 'GenericMeta', 'Hashable', 'IO',
-            'ItemsView', 'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized', 'SupportsAbs',
-            'SupportsBytes', 'SupportsComplex', 'SupportsFloat', 'SupportsInt',
-            'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple',
-            'Type', 'TypeVar', 'Union', 'ValuesView', 'cast', 'get_type_hints',
-            'no_type_check', 'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 6, 7), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'FrozenSet',
-            'Generator', 'Generic', 'GenericMeta', 'Hashable', 'IO',
-            'ItemsView', 'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized', 'SupportsAbs',
-            'SupportsBytes', 'SupportsComplex', 'SupportsFloat', 'SupportsInt',
-            'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple',
-            'Type', 'TypeVar', 'Union', 'ValuesView', 'cast', 'get_type_hints',
-            'no_type_check', 'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 6, 8), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'FrozenSet',
-            'Generator', 'Generic', 'GenericMeta', 'Hashable', 'IO',
-            'ItemsView', 'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized', 'SupportsAbs',
-            'SupportsBytes', 'SupportsComplex', 'SupportsFloat', 'SupportsInt',
-            'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple',
-            'Type', 'TypeVar', 'Union', 'ValuesView', 'cast', 'get_type_hints',
-            'no_type_check', 'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 6, 9), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'FrozenSet',
-            'Generator', 'Generic', 'GenericMeta', 'Hashable', 'IO',
-            'ItemsView', 'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized', 'SupportsAbs',
-            'SupportsBytes', 'SupportsComplex', 'SupportsFloat', 'SupportsInt',
-            'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple',
-            'Type', 'TypeVar', 'Union', 'ValuesView', 'cast', 'get_type_hints',
-            'no_type_check', 'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 6, 10), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'FrozenSet',
-            'Generator', 'Generic', 'GenericMeta', 'Hashable', 'IO',
-            'ItemsView', 'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized', 'SupportsAbs',
-            'SupportsBytes', 'SupportsComplex', 'SupportsFloat', 'SupportsInt',
-            'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple',
-            'Type', 'TypeVar', 'Union', 'ValuesView', 'cast', 'get_type_hints',
-            'no_type_check', 'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 7, 0), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'ForwardRef',
-            'FrozenSet', 'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView',
-            'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized', 'SupportsAbs',
-            'SupportsBytes', 'SupportsComplex', 'SupportsFloat', 'SupportsInt',
-            'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple',
-            'Type', 'TypeVar', 'Union', 'ValuesView', 'cast', 'get_type_hints',
-            'no_type_check', 'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 7, 1), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'ForwardRef',
-            'FrozenSet', 'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView',
-            'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized', 'SupportsAbs',
-            'SupportsBytes', 'SupportsComplex', 'SupportsFloat', 'SupportsInt',
-            'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple',
-            'Type', 'TypeVar', 'Union', 'ValuesView', 'cast', 'get_type_hints',
-            'no_type_check', 'no_type_check_decorator', 'overload',
-        )),
-    ),
-    (
-        Version(3, 7, 2), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'ForwardRef',
-            'FrozenSet', 'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView',
-            'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'OrderedDict', 'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized',
-            'SupportsAbs', 'SupportsBytes', 'SupportsComplex', 'SupportsFloat',
-            'SupportsInt', 'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO',
-            'Tuple', 'Type', 'TypeVar', 'Union', 'ValuesView', 'cast',
-            'get_type_hints', 'no_type_check', 'no_type_check_decorator',
-            'overload',
-        )),
-    ),
-    (
-        Version(3, 7, 3), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'ForwardRef',
-            'FrozenSet', 'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView',
-            'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'OrderedDict', 'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized',
-            'SupportsAbs', 'SupportsBytes', 'SupportsComplex', 'SupportsFloat',
-            'SupportsInt', 'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO',
-            'Tuple', 'Type', 'TypeVar', 'Union', 'ValuesView', 'cast',
-            'get_type_hints', 'no_type_check', 'no_type_check_decorator',
-            'overload',
-        )),
-    ),
-    (
-        Version(3, 7, 4), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'ForwardRef',
-            'FrozenSet', 'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView',
-            'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'OrderedDict', 'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized',
-            'SupportsAbs', 'SupportsBytes', 'SupportsComplex', 'SupportsFloat',
-            'SupportsInt', 'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO',
-            'Tuple', 'Type', 'TypeVar', 'Union', 'ValuesView', 'cast',
-            'get_type_hints', 'no_type_check', 'no_type_check_decorator',
-            'overload',
-        )),
-    ),
-    (
-        Version(3, 7, 5), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'ForwardRef',
-            'FrozenSet', 'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView',
-            'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'OrderedDict', 'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized',
-            'SupportsAbs', 'SupportsBytes', 'SupportsComplex', 'SupportsFloat',
-            'SupportsInt', 'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO',
-            'Tuple', 'Type', 'TypeVar', 'Union', 'ValuesView', 'cast',
-            'get_type_hints', 'no_type_check', 'no_type_check_decorator',
-            'overload',
-        )),
-    ),
-    (
-        Version(3, 7, 6), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'ForwardRef',
-            'FrozenSet', 'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView',
-            'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'OrderedDict', 'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized',
-            'SupportsAbs', 'SupportsBytes', 'SupportsComplex', 'SupportsFloat',
-            'SupportsInt', 'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO',
-            'Tuple', 'Type', 'TypeVar', 'Union', 'ValuesView', 'cast',
-            'get_type_hints', 'no_type_check', 'no_type_check_decorator',
-            'overload',
-        )),
-    ),
-    (
-        Version(3, 7, 7), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'ForwardRef',
-            'FrozenSet', 'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView',
-            'Iterable', 'Iterator', 'KeysView', 'List', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'OrderedDict', 'Pattern', 'Reversible', 'Sequence', 'Set', 'Sized',
-            'SupportsAbs', 'SupportsBytes', 'SupportsComplex', 'SupportsFloat',
-            'SupportsInt', 'SupportsRound', 'TYPE_CHECKING', 'Text', 'TextIO',
-            'Tuple', 'Type', 'TypeVar', 'Union', 'ValuesView', 'cast',
-            'get_type_hints', 'no_type_check', 'no_type_check_decorator',
-            'overload',
-        )),
-    ),
-    (
-        Version(3, 8, 0), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'Final', 'ForwardRef',
-            'FrozenSet', 'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView',
-            'Iterable', 'Iterator', 'KeysView', 'List', 'Literal', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'OrderedDict', 'Pattern', 'Protocol', 'Reversible', 'Sequence',
-            'Set', 'Sized', 'SupportsAbs', 'SupportsBytes', 'SupportsComplex',
-            'SupportsFloat', 'SupportsIndex', 'SupportsInt', 'SupportsRound',
-            'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple', 'Type', 'TypeVar',
-            'TypedDict', 'Union', 'ValuesView', 'cast', 'final', 'get_args',
-            'get_origin', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload', 'runtime_checkable',
-        )),
-    ),
-    (
-        Version(3, 8, 1), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'Final', 'ForwardRef',
-            'FrozenSet', 'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView',
-            'Iterable', 'Iterator', 'KeysView', 'List', 'Literal', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'OrderedDict', 'Pattern', 'Protocol', 'Reversible', 'Sequence',
-            'Set', 'Sized', 'SupportsAbs', 'SupportsBytes', 'SupportsComplex',
-            'SupportsFloat', 'SupportsIndex', 'SupportsInt', 'SupportsRound',
-            'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple', 'Type', 'TypeVar',
-            'TypedDict', 'Union', 'ValuesView', 'cast', 'final', 'get_args',
-            'get_origin', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload', 'runtime_checkable',
-        )),
-    ),
-    (
-        Version(3, 8, 2), frozenset((
-            'AbstractSet', 'Any', 'AnyStr', 'AsyncContextManager',
-            'AsyncGenerator', 'AsyncIterable', 'AsyncIterator', 'Awaitable',
-            'BinaryIO', 'ByteString', 'Callable', 'ChainMap', 'ClassVar',
-            'Collection', 'Container', 'ContextManager', 'Coroutine',
-            'Counter', 'DefaultDict', 'Deque', 'Dict', 'Final', 'ForwardRef',
-            'FrozenSet', 'Generator', 'Generic', 'Hashable', 'IO', 'ItemsView',
-            'Iterable', 'Iterator', 'KeysView', 'List', 'Literal', 'Mapping',
-            'MappingView', 'Match', 'MutableMapping', 'MutableSequence',
-            'MutableSet', 'NamedTuple', 'NewType', 'NoReturn', 'Optional',
-            'OrderedDict', 'Pattern', 'Protocol', 'Reversible', 'Sequence',
-            'Set', 'Sized', 'SupportsAbs', 'SupportsBytes', 'SupportsComplex',
-            'SupportsFloat', 'SupportsIndex', 'SupportsInt', 'SupportsRound',
-            'TYPE_CHECKING', 'Text', 'TextIO', 'Tuple', 'Type', 'TypeVar',
-            'TypedDict', 'Union', 'ValuesView', 'cast', 'final', 'get_args',
-            'get_origin', 'get_type_hints', 'no_type_check',
-            'no_type_check_decorator', 'overload', 'runtime_checkable',
-        )),
-    ),
+# every version of python with `typing`, in order
+VERSION_TUPLES = (
+    (3, 5, 0), (3, 5, 1), (3, 5, 2), (3, 5, 3), (3, 5, 4), (3, 5, 5),
+    (3, 5, 6), (3, 5, 7), (3, 5, 8), (3, 5, 9), (3, 6, 0), (3, 6, 1),
+    (3, 6, 2), (3, 6, 3), (3, 6, 4), (3, 6, 5), (3, 6, 6), (3, 6, 7),
+    (3, 6, 8), (3, 6, 9), (3, 6, 10), (3, 7, 0), (3, 7, 1), (3, 7, 2),
+    (3, 7, 3), (3, 7, 4), (3, 7, 5), (3, 7, 6), (3, 7, 7), (3, 8, 0),
+    (3, 8, 1), (3, 8, 2),
 )
+# name => the versions which added it, removed it, re-added it, ...
+SYMBOL_CHANGES = {
+    'AbstractSet': ((3, 5, 0),),
+    'Any': ((3, 5, 0),),
+    'AnyStr': ((3, 5, 0),),
+    'AsyncContextManager': ((3, 5, 4), (3, 6, 0), (3, 6, 2)),
+    'AsyncGenerator': ((3, 6, 1),),
+    'AsyncIterable': ((3, 5, 2),),
+    'AsyncIterator': ((3, 5, 2),),
+    'Awaitable': ((3, 5, 2),),
+    'BinaryIO': ((3, 5, 0),),
+    'ByteString': ((3, 5, 0),),
+    'Callable': ((3, 5, 0),),
+    'ChainMap': ((3, 5, 4), (3, 6, 0), (3, 6, 1)),
+    'ClassVar': ((3, 5, 3),),
+    'Collection': ((3, 6, 0),),
+    'Container': ((3, 5, 0),),
+    'ContextManager': ((3, 5, 4),),
+    'Coroutine': ((3, 5, 3),),
+    'Counter': ((3, 5, 4), (3, 6, 0), (3, 6, 1)),
+    'DefaultDict': ((3, 5, 2),),
+    'Deque': ((3, 5, 4), (3, 6, 0), (3, 6, 1)),
+    'Dict': ((3, 5, 0),),
+    'Final': ((3, 8, 0),),
+    'ForwardRef': ((3, 7, 0),),
+    'FrozenSet': ((3, 5, 0),),
+    'Generator': ((3, 5, 0),),
+    'Generic': ((3, 5, 0),),
+    'GenericMeta': ((3, 5, 4), (3, 6, 0), (3, 6, 1), (3, 7, 0)),
+    'Hashable': ((3, 5, 0),),
+    'IO': ((3, 5, 0),),
+    'ItemsView': ((3, 5, 0),),
+    'Iterable': ((3, 5, 0),),
+    'Iterator': ((3, 5, 0),),
+    'KeysView': ((3, 5, 0),),
+    'List': ((3, 5, 0),),
+    'Literal': ((3, 8, 0),),
+    'Mapping': ((3, 5, 0),),
+    'MappingView': ((3, 5, 0),),
+    'Match': ((3, 5, 0),),
+    'MutableMapping': ((3, 5, 0),),
+    'MutableSequence': ((3, 5, 0),),
+    'MutableSet': ((3, 5, 0),),
+    'NamedTuple': ((3, 5, 0),),
+    'NewType': ((3, 5, 2),),
+    'NoReturn': ((3, 5, 4), (3, 6, 0), (3, 6, 2)),
+    'Optional': ((3, 5, 0),),
+    'OrderedDict': ((3, 7, 2),),
+    'Pattern': ((3, 5, 0),),
+    'Protocol': ((3, 8, 0),),
+    'Reversible': ((3, 5, 0),),
+    'Sequence': ((3, 5, 0),),
+    'Set': ((3, 5, 0),),
+    'Sized': ((3, 5, 0),),
+    'SupportsAbs': ((3, 5, 0),),
+    'SupportsBytes': ((3, 5, 0),),
+    'SupportsComplex': ((3, 5, 0),),
+    'SupportsFloat': ((3, 5, 0),),
+    'SupportsIndex': ((3, 8, 0),),
+    'SupportsInt': ((3, 5, 0),),
+    'SupportsRound': ((3, 5, 0),),
+    'TYPE_CHECKING': ((3, 5, 2),),
+    'Text': ((3, 5, 2),),
+    'TextIO': ((3, 5, 0),),
+    'Tuple': ((3, 5, 0),),
+    'Type': ((3, 5, 2),),
+    'TypeVar': ((3, 5, 0),),
+    'TypedDict': ((3, 8, 0),),
+    'Union': ((3, 5, 0),),
+    'ValuesView': ((3, 5, 0),),
+    'cast': ((3, 5, 0),),
+    'final': ((3, 8, 0),),
+    'get_args': ((3, 8, 0),),
+    'get_origin': ((3, 8, 0),),
+    'get_type_hints': ((3, 5, 0),),
+    'no_type_check': ((3, 5, 0),),
+    'no_type_check_decorator': ((3, 5, 0),),
+    'overload': ((3, 5, 0),),
+    'runtime_checkable': ((3, 8, 0),),
+}
 # END GENERATED
-VERSIONS = frozenset(version for version, _ in SYMBOLS)
+VERSIONS = frozenset(Version(*v) for v in VERSION_TUPLES)
 
 
-class Visitor(ast.NodeVisitor):
-    def __init__(self) -> None:
-        self._level = -1
-        self.imports: Dict[str, List[Tuple[int, int]]]
-        self.imports = collections.defaultdict(list)
-        self.attributes: Dict[str, List[Tuple[int, int]]]
-        self.attributes = collections.defaultdict(list)
+class SymbolTable(NamedTuple):
+    # ordered so that bit `i` of a mask refers to `versions[i]`
+    versions: Tuple[Version, ...]
+    # name => bitmask of the versions which have that name
+    masks: Dict[str, int]
+
+
+@functools.lru_cache(maxsize=1)
+def _symbol_table() -> SymbolTable:
+    versions = tuple(sorted(VERSIONS))
+    # each change toggles the name's availability from that version onwards
+    # which is `~0 << i` (every later version) as a bitmask
+    index = {version: i for i, version in enumerate(VERSION_TUPLES)}
+    everything = (1 << len(versions)) - 1
+    masks = {}
+    for name, changes in SYMBOL_CHANGES.items():
+        mask = 0
+        for version in changes:
+            mask ^= everything & (~0 << index[version])
+        masks[name] = mask
+    return SymbolTable(versions, masks)
+
+
+def _min_version_mask(min_version: Version) -> int:
+    """bitmask of the versions >= min_version"""
+    versions = _symbol_table().versions
+    skip = bisect.bisect_left(versions, min_version)
+    return ((1 << len(versions)) - 1) & ~((1 << skip) - 1)
+
+
+def _mask_versions(mask: int) -> Tuple[Version, ...]:
+    versions = _symbol_table().versions
+    ret = []
+    while mask:
+        low = mask & -mask
+        ret.append(versions[low.bit_length() - 1])
+        mask ^= low
+    return tuple(ret)
+
+
+def _mask_ranges(mask: int) -> Tuple[Tuple[Version, Version], ...]:
+    """the runs of consecutive (known) versions in the mask"""
+    versions = _symbol_table().versions
+    ret = []
+    while mask:
+        start = (mask & -mask).bit_length() - 1
+        run = mask >> start
+        length = (run ^ (run + 1)).bit_length() - 1
+        ret.append((versions[start], versions[start + length - 1]))
+        mask &= ~(((1 << length) - 1) << start)
+    return tuple(ret)
+
+
+@functools.lru_cache(maxsize=None)
+def _missing_message(msg: str, name: str, missing: int, ranges: bool) -> str:
+    # shared by every occurrence of `name` in every file
+    if ranges:
+        versions_s = ', '.join(
+            str(start) if start == end else f'{start}-{end}'
+            for start, end in _mask_ranges(missing)
+        )
+    else:
+        versions_s = ', '.join(str(v) for v in _mask_versions(missing))
+    return msg.format(name, versions_s)
+
+
+@functools.lru_cache(maxsize=1)
+def _plugin_version() -> str:
+    # importlib.metadata is slow to import and to query, only do so if
+    # flake8 actually asks for our version
+    if sys.version_info < (3, 8):  # pragma: no cover (<PY38)
+        import importlib_metadata
+    else:  # pragma: no cover (PY38+)
+        import importlib.metadata as importlib_metadata
+    return importlib_metadata.version(__name__)
+
+
+class _LazyVersion:
+    def __get__(self, instance: Any, owner: Any) -> str:
+        return _plugin_version()
+
+
+@functools.lru_cache(maxsize=1)
+def _symbol_table_hash() -> str:
+    table = [VERSION_TUPLES, sorted(SYMBOL_CHANGES.items())]
+    return hashlib.sha256(json.dumps(table).encode()).hexdigest()
+
+
+def _cache_key(
+        lines: Sequence[str],
+        min_version: Version,
+        version_ranges: bool,
+) -> str:
+    h = hashlib.sha256()
+    parts = (
+        str(min_version), str(version_ranges),
+        _plugin_version(), _symbol_table_hash(),
+    )
+    for part in parts:
+        h.update(part.encode())
+        h.update(b'\0')
+    h.update(''.join(lines).encode('UTF-8', 'surrogateescape'))
+    return h.hexdigest()
+
+
+# (msg, name, missing) => the message of a version specific finding
+_FormatMissing = Callable[[str, str, int], str]
+
+
+class _Finding(NamedTuple):
+    line: int
+    col: int
+    msg: str
+    # what the finding is about (a `typing` name, `overload`, ...) and the
+    # versions from the minimum version it does not work in
+    symbol: Optional[str]
+    missing: int
+
+
+def _cache_path(cache_dir: str, key: str) -> str:
+    return os.path.join(cache_dir, key[:2], key[2:])
+
+
+def _cache_get(cache_dir: str, key: str) -> Optional[List[_Finding]]:
+    path = _cache_path(cache_dir, key)
+    try:
+        with open(path, encoding='UTF-8') as f:
+            contents = json.load(f)
+        results = [_Finding(*finding) for finding in contents]
+    except (OSError, ValueError, TypeError):  # TypeError: an older format
+        return None
+    # refresh the mtime, eviction removes the least recently used first
+    try:
+        os.utime(path)
+    except OSError:  # best-effort, a read only cache still has its hits
+        pass
+    return results
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_file_mode() -> int:
+    """the mode `open()` would create files with, mkstemp's are private"""
+    # reading the umask sets it: done once, before any threads are started
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _write_atomic(
+        path: str,
+        contents: bytes,
+        mode: int,
+        owner: Optional[Tuple[int, int]] = None,
+) -> None:
+    """write then rename so `path` is never seen partially written"""
+    import tempfile
+
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with open(fd, 'wb') as f:
+            f.write(contents)
+        if owner is not None:
+            try:
+                os.chown(tmp, *owner)
+            except PermissionError:  # giving files away needs privileges
+                pass
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def _cache_set(cache_dir: str, key: str, results: List[_Finding]) -> None:
+    path = _cache_path(cache_dir, key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # shared caches need the entries readable by the other users
+        _write_atomic(path, json.dumps(results).encode(), _cache_file_mode())
+    except OSError:  # caching is best-effort (read only or full disk)
+        pass
+
+
+# the cache is scanned for eviction at most this often, in seconds
+CACHE_EVICT_INTERVAL = 10 * 60
+# its mtime is the time of the last eviction
+CACHE_EVICT_MARKER = 'last-evicted'
+
+
+def _cache_entry_size(st: os.stat_result) -> int:
+    """the space an entry takes on disk, small files take whole blocks"""
+    if sys.platform == 'win32':  # pragma: no cover (windows)
+        return st.st_size
+    return st.st_blocks * 512
+
+
+def _cache_evict(cache_dir: str, max_size: int) -> None:
+    # scanning the whole cache would cost more than most runs it speeds up
+    marker = os.path.join(cache_dir, CACHE_EVICT_MARKER)
+    try:
+        if time.time() - os.stat(marker).st_mtime < CACHE_EVICT_INTERVAL:
+            return
+    except OSError:  # never evicted
+        pass
+    try:
+        # claimed before scanning, concurrent runs skip this round
+        open(marker, 'a').close()
+        os.utime(marker)
+    except OSError:  # read only, nothing could be evicted either
+        return
+
+    entries = []
+    total = 0
+    for shard in os.scandir(cache_dir):
+        if not shard.is_dir():
+            continue
+        for entry in os.scandir(shard.path):
+            try:
+                st = os.stat(entry.path)
+            except OSError:  # removed by a concurrent eviction
+                continue
+            size = _cache_entry_size(st)
+            entries.append((st.st_mtime, size, entry.path))
+            total += size
+
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:  # removed by a concurrent eviction
+            pass
+        total -= size
+
+
+# nodes which cannot contain anything the Visitor is interested in
+_LEAF_NODES = frozenset((
+    ast.Name, ast.Constant, ast.Import, ast.ImportFrom, ast.alias,
+    ast.Pass, ast.Break, ast.Continue, ast.Global, ast.Nonlocal,
+    *ast.expr_context.__subclasses__(),
+    *ast.boolop.__subclasses__(),
+    *ast.operator.__subclasses__(),
+    *ast.unaryop.__subclasses__(),
+    *ast.cmpop.__subclasses__(),
+))
+
+
+def _subscript_slice(node: ast.Subscript) -> ast.AST:
+    if sys.version_info < (3, 9):  # pragma: no cover (<PY39)
+        if isinstance(node.slice, ast.Index):
+            return node.slice.value
+    return node.slice
+
+
+def _new_positions() -> 'array.array[int]':
+    """(line, col) pairs, flattened into a single array"""
+    return array.array('i')
+
+
+def _add_position(
+        positions: 'array.array[int]',
+        node: Union[ast.expr, ast.stmt],
+) -> None:
+    positions.append(node.lineno)
+    positions.append(node.col_offset)
+
+
+def _iter_positions(
+        positions: 'array.array[int]',
+) -> Iterator[Tuple[int, int]]:
+    it = iter(positions)
+    return zip(it, it)
+
+
+class Visitor:
+    __slots__ = (
+        'imports', 'attributes', 'defined_overload', 'unions_pattern_or_match',
+        'from_imported_names', '_in_namedtuple', 'namedtuple_methods',
+        'namedtuple_defaults', '_dispatch', '_track_overload',
+    )
+
+    def __init__(self, min_version: Optional[Version] = None) -> None:
+        """only visit what the rules active for min_version need
+
+        everything is visited without a min_version.
+        """
+        if min_version is None:
+            self._dispatch = self._handlers
+            self._track_overload = True
+        else:
+            checks = _checks(min_version)
+            self._dispatch = checks.dispatch
+            self._track_overload = 'TYP002' in checks.codes
+        self.imports: Dict[str, 'array.array[int]']
+        self.imports = collections.defaultdict(_new_positions)
+        self.attributes: Dict[str, 'array.array[int]']
+        self.attributes = collections.defaultdict(_new_positions)
         self.defined_overload = False
-        self.unions_pattern_or_match: List[Tuple[int, int]] = []
+        self.unions_pattern_or_match = _new_positions()
         self.from_imported_names: Set[str] = set()
         self._in_namedtuple = False
-        self.namedtuple_methods: List[Tuple[int, int]] = []
-        self.namedtuple_defaults: List[Tuple[int, int]] = []
+        self.namedtuple_methods = _new_positions()
+        self.namedtuple_defaults = _new_positions()
 
     def _is_typing(self, node: ast.AST, names: Tuple[str, ...]) -> bool:
         return (
@@ -639,70 +463,644 @@ class Visitor(ast.NodeVisitor):
             node.attr in names
         )
 
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-        if node.level == 0 and node.module == 'typing' and self._level == 0:
+    def visit(self, node: ast.AST) -> None:
+        """visit a module: only its body can hold guard-free imports"""
+        for stmt in ast.iter_child_nodes(node):
+            if isinstance(stmt, ast.ImportFrom):
+                self._visit_top_level_ImportFrom(stmt)
+                continue
+
+            # an `overload` definition nested one level (for instance in a
+            # `if sys.version_info < (3, 5, 2):` block) fixes TYP002
+            if self._track_overload:
+                for child in ast.iter_child_nodes(stmt):
+                    if (
+                            isinstance(child, ast.FunctionDef) and
+                            child.name == 'overload'
+                    ):
+                        self.defined_overload = True
+
+            self._visit(stmt)
+
+    def _visit(self, node: ast.AST) -> None:
+        tp = type(node)
+        if tp in _LEAF_NODES:
+            return
+        visit_func = self._dispatch.get(tp)
+        if visit_func is not None:
+            visit_func(self, node)
+        else:
+            self._visit_children(node)
+
+    def _visit_children(self, node: ast.AST) -> None:
+        for child in ast.iter_child_nodes(node):
+            self._visit(child)
+
+    def _visit_top_level_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.level == 0 and node.module == 'typing':
             for name in node.names:
-                self.imports[name.name].append((node.lineno, node.col_offset))
+                _add_position(self.imports[name.name], node)
                 if not name.asname:
                     self.from_imported_names.add(name.name)
 
-        self.generic_visit(node)
+    def _visit_Attribute(self, node: ast.Attribute) -> None:
+        # `typing.X` is never nested inside another attribute we care about
+        if isinstance(node.value, ast.Name) and node.value.id == 'typing':
+            _add_position(self.attributes[node.attr], node)
 
-    def visit_Attribute(self, node: ast.Attribute) -> None:
-        if (
-                isinstance(node, ast.Attribute) and
-                isinstance(node.value, ast.Name) and
-                node.value.id == 'typing'
-        ):
-            self.attributes[node.attr].append((node.lineno, node.col_offset))
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        if self._level == 1 and node.name == 'overload':
-            self.defined_overload = True
+    def _visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         if self._in_namedtuple:
-            self.namedtuple_methods.append((node.lineno, node.col_offset))
-        self.generic_visit(node)
+            _add_position(self.namedtuple_methods, node)
+        self._visit_children(node)
 
-    def visit_Subscript(self, node: ast.Subscript) -> None:
-        if (
-            self._is_typing(node.value, ('Union',)) and
-            isinstance(node.slice, ast.Index) and
-            isinstance(node.slice.value, ast.Tuple) and
-            len(node.slice.value.elts) > 1 and
-            any(
-                self._is_typing(x, ('Pattern', 'Match'))
-                for x in node.slice.value.elts
-            )
-        ):
-            self.unions_pattern_or_match.append((node.lineno, node.col_offset))
-        self.generic_visit(node)
+    def _visit_Subscript(self, node: ast.Subscript) -> None:
+        if self._is_typing(node.value, ('Union',)):
+            slice_ = _subscript_slice(node)
+            if (
+                    isinstance(slice_, ast.Tuple) and
+                    len(slice_.elts) > 1 and
+                    any(
+                        self._is_typing(x, ('Pattern', 'Match'))
+                        for x in slice_.elts
+                    )
+            ):
+                _add_position(self.unions_pattern_or_match, node)
+        self._visit_children(node)
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+    def _visit_ClassDef(self, node: ast.ClassDef) -> None:
         if any(self._is_typing(base, ('NamedTuple',)) for base in node.bases):
             self._in_namedtuple = True
             try:
-                self.generic_visit(node)
+                self._visit_children(node)
             finally:
                 self._in_namedtuple = False
         else:
-            self.generic_visit(node)
+            self._visit_children(node)
 
-    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+    def _visit_AnnAssign(self, node: ast.AnnAssign) -> None:
         if self._in_namedtuple and node.value is not None:
-            self.namedtuple_defaults.append((node.lineno, node.col_offset))
-        self.generic_visit(node)
+            _add_position(self.namedtuple_defaults, node)
+        self._visit_children(node)
+
+    _handlers: Dict[Type[ast.AST], Callable[['Visitor', Any], None]] = {
+        ast.Attribute: _visit_Attribute,
+        ast.FunctionDef: _visit_FunctionDef,
+        ast.Subscript: _visit_Subscript,
+        ast.ClassDef: _visit_ClassDef,
+        ast.AnnAssign: _visit_AnnAssign,
+    }
+
+
+class _NeedsAST(Exception):
+    """the tokens alone are not enough to match the ast"""
+
+
+# never significant, f-string parts (3.12+) are only a wrapper around their
+# replacement fields which are tokenized as usual
+_STREAM_SKIP = frozenset(
+    tp for tp, name in tokenize.tok_name.items()
+    if name in {
+        'NL', 'COMMENT', 'FSTRING_START', 'FSTRING_MIDDLE', 'FSTRING_END',
+    }
+)
+_STREAM_STATEMENT = frozenset((
+    tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT, tokenize.ENCODING,
+    tokenize.ENDMARKER,
+))
+# before 3.12 an f-string is a single token, hiding any `typing.X` inside
+_OLD_FSTRING_RE = re.compile('[a-zA-Z]*[fF]')
+
+
+def _token_start(tok: tokenize.TokenInfo) -> Tuple[int, int]:
+    # tokenize's columns are characters, the ast's are utf-8 byte offsets
+    line, col = tok.start
+    return line, len(tok.line[:col].encode())
+
+
+def _stream_import(
+        visitor: Visitor,
+        stmt: List[tokenize.TokenInfo],
+        top_level: Optional[bool],
+) -> None:
+    if (
+            stmt[0].string != 'from' or
+            len(stmt) < 3 or
+            stmt[1].string != 'typing' or
+            stmt[2].string != 'import'
+    ):
+        return
+    elif top_level is None:
+        raise _NeedsAST('`from typing import ...` after `;`')
+    elif not top_level:
+        return
+
+    line, col = _token_start(stmt[0])
+    names: List[List[str]] = [[]]
+    for tok in stmt[3:]:
+        if tok.string == ',':
+            names.append([])
+        elif tok.string not in '()':
+            names[-1].append(tok.string)
+    for name in names:
+        if name:
+            positions = visitor.imports[name[0]]
+            positions.append(line)
+            positions.append(col)
+            if len(name) == 1:
+                visitor.from_imported_names.add(name[0])
+
+
+# the rules which only need what _stream_visit finds
+_STREAM_CODES = frozenset(('TYP001', 'TYP006'))
+
+
+def _stream_visit(tokens: Iterable[tokenize.TokenInfo]) -> Visitor:
+    """the imports and attributes of Visitor, from a single pass of tokens
+
+    only what TYP001 and TYP006 need: the other checks need the ast.  the
+    tokens are not kept, so this runs in constant memory.
+    """
+    visitor = Visitor()
+    depth = 0
+    prev = ''  # the previous token, or '' at the start of a statement
+    stmt: Optional[List[tokenize.TokenInfo]] = None  # an import statement
+    top_level: Optional[bool] = False
+    after_typing: Optional[Tuple[int, int]] = None
+    attribute_of: Optional[Tuple[int, int]] = None
+    # the `typing.X` attributes (name, line, col) of the current primary
+    # expression -- the visitor does not look inside the value of another
+    # attribute, which they are if the primary continues with `.`
+    pending: List[Tuple[str, int, int]] = []
+    # those of the finished primaries in the current brackets, they are
+    # still part of the primary containing the brackets
+    held: List[Tuple[str, int, int]] = []
+    brackets: List[Tuple[List[Tuple[str, int, int]], ...]] = []
+
+    for tok in tokens:
+        tp, s = tok.type, tok.string
+        if tp in _STREAM_SKIP:
+            continue
+        elif tp == tokenize.ERRORTOKEN:
+            raise _NeedsAST(f'invalid token {s!r}')
+        elif (
+                tp == tokenize.STRING and
+                'typing' in s and
+                _OLD_FSTRING_RE.match(s)
+        ):
+            raise _NeedsAST('f-string')
+
+        if stmt is not None:
+            if tp not in _STREAM_STATEMENT and s != ';':
+                stmt.append(tok)
+                continue
+            _stream_import(visitor, stmt, top_level)
+            stmt = None
+        elif tp == tokenize.NAME and s in {'from', 'import'} and (
+                prev in {'', ';', ':'}
+        ):
+            stmt = [tok]
+            if depth == 0 and prev == '':
+                top_level = True
+            elif depth == 0 and prev == ';':
+                top_level = None  # maybe after an inline block
+            else:
+                top_level = False
+            prev = s
+            continue
+
+        if attribute_of is not None:
+            pending.append((s, *attribute_of))
+            attribute_of = None
+            prev = s
+            continue
+        elif after_typing is not None:
+            if s == '.':
+                attribute_of, after_typing = after_typing, None
+                prev = s
+                continue
+            after_typing = None
+
+        if s == '.':
+            pending.clear()
+        elif s in {'(', '[', '{'}:
+            brackets.append((pending, held))
+            pending, held = [], []
+        elif s in {')', ']', '}'}:
+            if not brackets:
+                raise _NeedsAST(f'unmatched {s!r}')
+            inner = held + pending
+            pending, held = brackets.pop()
+            pending.extend(inner)
+        else:
+            if brackets:
+                held.extend(pending)
+            else:
+                for name, line, col in pending:
+                    positions = visitor.attributes[name]
+                    positions.append(line)
+                    positions.append(col)
+            pending.clear()
+
+            if tp == tokenize.NAME and s == 'typing' and prev != '.':
+                after_typing = _token_start(tok)
+
+        if tp in _STREAM_STATEMENT:
+            if tp == tokenize.INDENT:
+                depth += 1
+            elif tp == tokenize.DEDENT:
+                depth -= 1
+            prev = ''
+        else:
+            prev = s
+
+    return visitor
 
-    def generic_visit(self, node: ast.AST) -> None:
-        self._level += 1
-        super().generic_visit(node)
-        self._level -= 1
+
+class _Rule(NamedTuple):
+    code: str
+    # the rule only applies to minimum versions before this one
+    before: Optional[Version]
+    # the nodes Visitor must handle for this rule, top-level imports and
+    # `def overload` are always found by Visitor.visit
+    node_types: Tuple[Type[ast.AST], ...]
+
+
+RULES = (
+    _Rule('TYP001', None, ()),
+    _Rule('TYP002', Version(3, 5, 2), ()),
+    _Rule('TYP003', Version(3, 5, 2), (ast.Subscript,)),
+    _Rule('TYP004', Version(3, 6, 1), (ast.ClassDef, ast.FunctionDef)),
+    _Rule('TYP005', Version(3, 6, 1), (ast.ClassDef, ast.AnnAssign)),
+    _Rule('TYP006', None, (ast.Attribute,)),
+)
+
+
+class _Checks(NamedTuple):
+    """everything about the checks which depends only on the min version"""
+    min_mask: int
+    typ001: str
+    # the active rules, in order
+    codes: Tuple[str, ...]
+    # the Visitor handlers needed by those rules
+    dispatch: Dict[Type[ast.AST], Callable[[Visitor, Any], None]]
+    # the versions each rule which only applies before a version is about
+    missing: Dict[str, int]
+
+
+@functools.lru_cache(maxsize=None)
+def _checks(min_version: Version) -> _Checks:
+    if min_version < Version(3, 5, 2):
+        guard = '`if False:  # TYPE_CHECKING`'
+    else:
+        guard = '`if TYPE_CHECKING:`'
+    rules = [
+        rule for rule in RULES
+        if rule.before is None or min_version < rule.before
+    ]
+    min_mask = _min_version_mask(min_version)
+    return _Checks(
+        min_mask=min_mask,
+        typ001=f'TYP001 guard import by {guard}: {{}} (not in {{}})',
+        codes=tuple(rule.code for rule in rules),
+        dispatch={
+            tp: Visitor._handlers[tp]
+            for rule in rules
+            for tp in rule.node_types
+        },
+        missing={
+            rule.code: min_mask & ~_min_version_mask(rule.before)
+            for rule in rules
+            if rule.before is not None
+        },
+    )
+
+
+def _validate_min_version(v: Version) -> Version:
+    v = max(v, Version(*VERSION_TUPLES[0]))
+    if v not in VERSIONS:
+        raise ValueError(f'min-python-version ({v}): unknown version')
+    return v
+
+
+def _parse_floors(s: str) -> Tuple[Version, ...]:
+    """comma separated min versions => the distinct ones, lowest first"""
+    return tuple(sorted({
+        _validate_min_version(Version.parse(part))
+        for part in s.split(',')
+        if part.strip()
+    }))
+
+
+@functools.lru_cache(maxsize=None)
+def _finding_floors(
+        floors: Tuple[Version, ...],
+        missing: int,
+) -> Tuple[Version, ...]:
+    """the floors a finding for the lowest of them applies to
+
+    a higher floor is missing the same versions from that floor on, a rule
+    which only applies before some version is no longer active once none
+    of those are left.
+    """
+    if not missing:
+        return floors
+    return tuple(v for v in floors if missing & _min_version_mask(v))
+
+
+@functools.lru_cache(maxsize=None)
+def _floors_suffix(floors: Tuple[Version, ...], missing: int) -> str:
+    floors_s = ', '.join(str(v) for v in _finding_floors(floors, missing))
+    return f' [floors: {floors_s}]'
+
+
+def _floors_message(
+        msg: str,
+        missing: int,
+        floors: Tuple[Version, ...],
+) -> str:
+    # E902 / E999 apply to every floor, they are left as they are
+    if not floors or not missing:
+        return msg
+    return msg + _floors_suffix(floors, missing)
+
+
+SPECIFIER_RE = re.compile(
+    r'^\s*(~=|===|==|!=|<=|>=|<|>)\s*(\d+(?:\.\d+)*)(\.\*)?\s*$',
+)
+
+
+def _specifier_min_version(requires: str) -> Version:
+    """the lowest known version satisfying a `python_requires` specifier
+
+    else the newest known version up to its lower bound.
+    """
+    clauses = []
+    for part in requires.split(','):
+        match = SPECIFIER_RE.match(part)
+        if match is None:  # not something we understand, ignore it
+            continue
+        op, version_s, wildcard = match.groups()
+        parts = tuple(int(p) for p in version_s.split('.'))
+        if op == '~=':  # ~=X.Y.Z means >=X.Y.Z, ==X.Y.*
+            clauses.append(('>=', parts, False))
+            op, parts, wildcard = '==', parts[:-1], '.*'
+        clauses.append((op, parts, bool(wildcard)))
+
+    def _matches(v: Version) -> bool:
+        for op, parts, wildcard in clauses:
+            if wildcard:
+                ok = v[:len(parts)] == parts
+                if op == '!=':
+                    ok = not ok
+            else:
+                other = Version(*parts[:3])
+                ok = {
+                    '===': v == other, '==': v == other, '!=': v != other,
+                    '<=': v <= other, '>=': v >= other,
+                    '<': v < other, '>': v > other,
+                }[op]
+            if not ok:
+                return False
+        return True
+
+    versions = _symbol_table().versions
+    for version in versions:
+        if _matches(version):
+            return version
+
+    # no known version satisfies it, usually as the requirement is newer
+    # than the versions we know about: nothing is missing from the newest
+    lower_bound = max(
+        (
+            Version(*parts[:3])
+            for op, parts, _ in clauses
+            if op in {'>=', '>', '==', '==='}
+        ),
+        default=Version(),
+    )
+    older = bisect.bisect_right(versions, lower_bound)
+    return versions[max(older - 1, 0)]
+
+
+def _read_pyproject_requires(path: str) -> Optional[str]:
+    if sys.version_info >= (3, 11):  # pragma: no cover (PY311+)
+        import tomllib
+    else:  # pragma: no cover (<PY311)
+        import tomli as tomllib
+
+    with open(path, 'rb') as f:
+        requires = tomllib.load(f).get('project', {}).get('requires-python')
+    return requires if isinstance(requires, str) else None
+
+
+def _read_setup_cfg_requires(path: str) -> Optional[str]:
+    cfg = configparser.ConfigParser()
+    cfg.read(path)
+    return cfg.get('options', 'python_requires', fallback=None)
+
+
+def _read_setup_py_requires(path: str) -> Optional[str]:
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    for node in ast.walk(tree):
+        if (
+                isinstance(node, ast.Call) and (
+                    isinstance(node.func, ast.Name) and
+                    node.func.id == 'setup' or
+                    isinstance(node.func, ast.Attribute) and
+                    node.func.attr == 'setup'
+                )
+        ):
+            for keyword in node.keywords:
+                if keyword.arg == 'python_requires':
+                    try:
+                        requires = ast.literal_eval(keyword.value)
+                    except ValueError:  # not static
+                        return None
+                    return requires if isinstance(requires, str) else None
+    return None
+
+
+# in order of precedence
+PROJECT_FILES = (
+    ('pyproject.toml', _read_pyproject_requires),
+    ('setup.cfg', _read_setup_cfg_requires),
+    ('setup.py', _read_setup_py_requires),
+)
+# directory => ((mtime of each project file, ...), resolved min version)
+_project_cache: Dict[str, Tuple[Tuple[Optional[int], ...], Optional[Version]]]
+_project_cache = {}
+# directory => (its mtime, whether it has project files or is the root of a
+# checkout), its mtime changes when files are created or removed in it
+_project_dir_cache: Dict[str, Tuple[Optional[int], Optional[bool]]] = {}
+# the root of a checkout, a project never extends above it
+VCS_DIRS = ('.git', '.hg', '.svn')
+
+
+def _project_min_version(directory: str) -> Optional[Version]:
+    """the min version declared by the project files in `directory`
+
+    memoized and re-read only when one of the project files changes.
+    """
+    mtimes: List[Optional[int]] = []
+    for filename, _ in PROJECT_FILES:
+        try:
+            st = os.stat(os.path.join(directory, filename))
+        except OSError:
+            mtimes.append(None)
+        else:
+            mtimes.append(st.st_mtime_ns)
+    key = tuple(mtimes)
+
+    cached = _project_cache.get(directory)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    ret = None
+    for (filename, read_func), mtime in zip(PROJECT_FILES, key):
+        if mtime is not None:
+            try:
+                requires = read_func(os.path.join(directory, filename))
+            except (OSError, SyntaxError, ValueError, configparser.Error):
+                # a broken file (including `TOMLDecodeError` and
+                # `UnicodeDecodeError`, both `ValueError`s) declares nothing
+                continue
+            if requires is not None:
+                ret = _validate_min_version(_specifier_min_version(requires))
+                break
+    _project_cache[directory] = (key, ret)
+    return ret
+
+
+def _is_project_dir(directory: str) -> Optional[bool]:
+    """True with project files, False at the root of a checkout, else None"""
+    try:
+        mtime: Optional[int] = os.stat(directory).st_mtime_ns
+    except OSError:  # does not exist (yet)
+        mtime = None
+    cached = _project_dir_cache.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    ret: Optional[bool]
+    if any(
+            os.path.exists(os.path.join(directory, filename))
+            for filename, _ in PROJECT_FILES
+    ):
+        ret = True
+    elif any(os.path.exists(os.path.join(directory, d)) for d in VCS_DIRS):
+        ret = False
+    else:
+        ret = None
+    _project_dir_cache[directory] = (mtime, ret)
+    return ret
+
+
+def _project_dir(directory: str) -> Optional[str]:
+    """the nearest directory at or above `directory` with project files
+
+    the search stops at the root of a checkout.
+    """
+    while True:
+        is_project_dir = _is_project_dir(directory)
+        if is_project_dir is not None:
+            return directory if is_project_dir else None
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def _file_min_version(filename: str) -> Optional[Version]:
+    """the min version declared by the nearest project of `filename`"""
+    project_dir = _project_dir(os.path.dirname(os.path.abspath(filename)))
+    if project_dir is None:
+        return None
+    return _project_min_version(project_dir)
+
+
+def _checked_min_version(filename: str) -> Version:
+    """the min version `filename` is checked against, as in Plugin.run"""
+    if not Plugin._floors:
+        min_version = _file_min_version(filename)
+        if min_version is not None:
+            return min_version
+    return Plugin._min_python_version
+
+
+class _CountingVisitor(Visitor):
+    __slots__ = ('nodes',)
+
+    def __init__(self, min_version: Optional[Version] = None) -> None:
+        super().__init__(min_version)
+        self.nodes = 0
+
+    def _visit(self, node: ast.AST) -> None:
+        self.nodes += 1
+        super()._visit(node)
+
+
+def _write_profile(path: str, record: Dict[str, Any]) -> None:
+    # a single append-mode write per file so flake8's worker processes can
+    # share the same profile without interleaving records
+    line = json.dumps(record) + '\n'
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+    try:
+        os.write(fd, line.encode())
+    finally:
+        os.close(fd)
+
+
+def profile_summary(path: str, top: int = 10) -> str:
+    records = []
+    with open(path) as f:
+        for line in f:
+            records.append(json.loads(line))
+
+    def _total(record: Dict[str, Any]) -> float:
+        return record['walk_s'] + record['errors_s'] + record['format_s']
+
+    codes: Dict[str, float] = collections.defaultdict(float)
+    for record in records:
+        for code, elapsed in record['codes'].items():
+            codes[code] += elapsed
+
+    phases = ('walk_s', 'errors_s', 'format_s')
+    parts = [
+        f'files: {len(records)}',
+        f'nodes: {sum(record["nodes"] for record in records)}',
+        *(
+            f'{phase}: {sum(record[phase] for record in records):.6f}'
+            for phase in phases
+        ),
+        '',
+        'cost per code:',
+        *(
+            f'    {code}: {elapsed:.6f}s'
+            for code, elapsed in sorted(codes.items())
+        ),
+        '',
+        'slowest files:',
+        *(
+            f'    {_total(record):.6f}s {record["filename"]} '
+            f'({record["nodes"]} nodes)'
+            for record in sorted(records, key=_total, reverse=True)[:top]
+        ),
+    ]
+    return '\n'.join(parts) + '\n'
 
 
 class Plugin:
     name = __name__
-    version = importlib_metadata.version(__name__)
+    version = _LazyVersion()
 
     _min_python_version = Version(3, 5, 0)
+    _cache_dir: Optional[str] = None
+    _profile: Optional[str] = None
+    _version_ranges = False
+    # checked at once from a single traversal, empty for only the min version
+    _floors: Tuple[Version, ...] = ()
 
     @staticmethod
     def add_options(option_manager: Any) -> None:
@@ -714,98 +1112,1219 @@ class Plugin:
                 '(default: %(default)s)'
             ),
         )
+        option_manager.add_option(
+            '--typing-imports-cache-dir', type='str', metavar='DIR',
+            default=None, parse_from_config=True,
+            help=(
+                'Cache the results of the typing imports checks in this '
+                'directory, keyed by file contents.  Safe to share between '
+                'processes and machines.  (default: no cache)'
+            ),
+        )
+        option_manager.add_option(
+            '--typing-imports-cache-size', type='int', metavar='BYTES',
+            default=64 * 1024 * 1024, parse_from_config=True,
+            help=(
+                'Evict the least recently used entries of '
+                '--typing-imports-cache-dir down to this size at startup '
+                '(default: %(default)s)'
+            ),
+        )
+        option_manager.add_option(
+            '--typing-imports-profile', type='str', metavar='FILE',
+            default=os.environ.get('FLAKE8_TYPING_IMPORTS_PROFILE'),
+            parse_from_config=True,
+            help=(
+                'Append per-file timings of the typing imports checks to '
+                f'FILE, summarize them with `python -m {__name__} '
+                '--profile-summary FILE`.  Also settable with '
+                'FLAKE8_TYPING_IMPORTS_PROFILE.  (default: disabled)'
+            ),
+        )
+        option_manager.add_option(
+            '--typing-imports-version-ranges', action='store_true',
+            default=False, parse_from_config=True,
+            help=(
+                'Abbreviate the missing versions in TYP001 / TYP006 as '
+                'ranges, `3.5.0-3.5.2` instead of `3.5.0, 3.5.1, 3.5.2`'
+            ),
+        )
+        option_manager.add_option(
+            '--typing-imports-floors', type='str', metavar='VERSIONS',
+            default=None, parse_from_config=True,
+            help=(
+                'Check against each of these comma separated minimum '
+                'versions of python at once, reporting which of them each '
+                'result applies to.  Takes precedence over '
+                '--min-python-version and the python requirement of the '
+                'project.  (default: only the minimum version)'
+            ),
+        )
 
     @classmethod
     def parse_options(cls, options: Any) -> None:
-        cfg = configparser.ConfigParser()
-        cfg.add_section('options')
-        cfg['options']['python_requires'] = f'>={options.min_python_version}'
-
-        if os.path.exists('setup.cfg'):
-            cfg.read('setup.cfg')
-
-        v = cls._min_python_version
-        for part in cfg['options']['python_requires'].split(','):
-            part = part.strip()
-            if part.startswith('>='):
-                v = Version.parse(part[2:])
-
-        v = max(v, SYMBOLS[0][0])
-        if v not in VERSIONS:
-            raise ValueError(f'min-python-version ({v}): unknown version')
+        cls._floors = ()
+        if options.typing_imports_floors:
+            cls._floors = _parse_floors(options.typing_imports_floors)
+
+        v: Optional[Version]
+        if cls._floors:
+            # every floor is checked from the findings for the lowest one
+            v = cls._floors[0]
+        else:
+            # the python requirement of the current project takes precedence
+            v = _project_min_version(os.getcwd())
+        if v is None:
+            v = _validate_min_version(
+                Version.parse(options.min_python_version),
+            )
         cls._min_python_version = v
+        # the rule set for the (usual) min version, shared by every file
+        _checks(v)
+
+        cls._profile = options.typing_imports_profile
+        cls._version_ranges = options.typing_imports_version_ranges
+        cls._cache_dir = options.typing_imports_cache_dir
+        if cls._cache_dir is not None:
+            _cache_file_mode()
+            if os.path.isdir(cls._cache_dir):
+                _cache_evict(cls._cache_dir, options.typing_imports_cache_size)
 
-    def __init__(self, tree: ast.AST):
+    def __init__(
+            self,
+            tree: ast.AST,
+            lines: Optional[Sequence[str]] = None,
+            filename: str = '-',
+    ) -> None:
         self._tree = tree
+        self._lines = lines
+        self._filename = filename
 
-    def _version_specific_errors(
+    def _version_specific_findings(
             self,
             msg: str,
-            name_positions: Dict[str, List[Tuple[int, int]]],
-    ) -> Generator[Tuple[int, int, str, Type[Any]], None, None]:
-        error_versions: Dict[Tuple[int, int, str], List[Version]]
-        error_versions = collections.defaultdict(list)
-
-        for version, symbols in SYMBOLS:
-            if version < self._min_python_version:
+            name_positions: Dict[str, 'array.array[int]'],
+            min_mask: int,
+            format_missing: _FormatMissing,
+    ) -> Generator[_Finding, None, None]:
+        masks = _symbol_table().masks
+        for k, positions in name_positions.items():
+            missing = min_mask & ~masks.get(k, 0)
+            if not missing:
                 continue
-            for k in set(name_positions) - symbols:
-                for line, col in name_positions[k]:
-                    error_versions[(line, col, k)].append(version)
+            msg_s = format_missing(msg, k, missing)
+            for line, col in _iter_positions(positions):
+                yield _Finding(line, col, msg_s, k, missing)
 
-        for (line, col, k), versions in error_versions.items():
-            versions_s = ', '.join(str(v) for v in versions)
-            yield line, col, msg.format(k, versions_s), type(self)
+    def _format_missing(self, msg: str, name: str, missing: int) -> str:
+        return _missing_message(msg, name, missing, self._version_ranges)
 
     def run(self) -> Generator[Tuple[int, int, str, Type[Any]], None, None]:
-        visitor = Visitor()
-        visitor.visit(self._tree)
+        for line, col, msg, _, missing in self._file_findings():
+            msg = _floors_message(msg, missing, self._floors)
+            yield line, col, msg, type(self)
 
-        if self._min_python_version < Version(3, 5, 2):
-            guard = '`if False:  # TYPE_CHECKING`'
+    def _file_findings(self) -> Generator[_Finding, None, None]:
+        # every check needs either `typing.X` or `from typing import X`
+        if self._lines is not None and 'typing' not in ''.join(self._lines):
+            return
+
+        # files are checked against the python requirement of their project,
+        # unless they are checked against several floors
+        if self._filename != '-' and not self._floors:
+            min_version = _file_min_version(self._filename)
+            if min_version is not None:
+                self._min_python_version = min_version
+
+        if self._profile is not None:
+            run = self._run_profiled
         else:
-            guard = '`if TYPE_CHECKING:`'
-        msg = f'TYP001 guard import by {guard}: {{}} (not in {{}})'
-        yield from self._version_specific_errors(msg, visitor.imports)
+            run = self._run
+
+        if self._cache_dir is None or self._lines is None:
+            yield from run()
+            return
 
+        key = _cache_key(
+            self._lines, self._min_python_version, self._version_ranges,
+        )
+        results = _cache_get(self._cache_dir, key)
+        if results is None:
+            results = list(run())
+            _cache_set(self._cache_dir, key, results)
+        yield from results
+
+    def _run(self) -> Generator[_Finding, None, None]:
+        visitor = Visitor(self._min_python_version)
+        visitor.visit(self._tree)
+        yield from self._findings(visitor, self._format_missing)
+
+    def _run_profiled(self) -> Generator[_Finding, None, None]:
+        assert self._profile is not None
+        format_s = 0.
+
+        def _timed_format_missing(msg: str, name: str, missing: int) -> str:
+            nonlocal format_s
+            t0 = time.perf_counter()
+            try:
+                return self._format_missing(msg, name, missing)
+            finally:
+                format_s += time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        visitor = _CountingVisitor(self._min_python_version)
+        visitor.visit(self._tree)
+        walk_s = time.perf_counter() - t0
+
+        results = []
+        codes: Dict[str, float] = collections.defaultdict(float)
+        findings = self._findings(visitor, _timed_format_missing)
+        while True:
+            t0 = time.perf_counter()
+            try:
+                result = next(findings)
+            except StopIteration:
+                break
+            finally:
+                elapsed = time.perf_counter() - t0
+            codes[result.msg[:6]] += elapsed
+            results.append(result)
+        # the rules format their messages as they go, that is reported apart
+        errors_s = sum(codes.values()) + elapsed - format_s
+
+        _write_profile(
+            self._profile,
+            {
+                'filename': self._filename,
+                'nodes': visitor.nodes,
+                'walk_s': walk_s,
+                'errors_s': errors_s,
+                'format_s': format_s,
+                'codes': codes,
+            },
+        )
+        yield from results
+
+    def _findings(
+            self,
+            visitor: Visitor,
+            format_missing: _FormatMissing,
+    ) -> Generator[_Finding, None, None]:
+        checks = _checks(self._min_python_version)
+        for code in checks.codes:
+            rule = self._rule_findings[code]
+            yield from rule(self, visitor, checks, format_missing)
+
+    def _typ001(
+            self,
+            visitor: Visitor,
+            checks: _Checks,
+            format_missing: _FormatMissing,
+    ) -> Generator[_Finding, None, None]:
+        yield from self._version_specific_findings(
+            checks.typ001, visitor.imports, checks.min_mask, format_missing,
+        )
+
+    def _typ002(
+            self,
+            visitor: Visitor,
+            checks: _Checks,
+            format_missing: _FormatMissing,
+    ) -> Generator[_Finding, None, None]:
         msg = (
             'TYP002 @overload is broken in <3.5.2, '
             'add `if sys.version_info < (3, 5, 2): def overload(f): return f`'
         )
-        if (
-                self._min_python_version < Version(3, 5, 2) and
-                'overload' in visitor.imports and
-                not visitor.defined_overload
-        ):
-            for line, col in visitor.imports['overload']:
-                yield line, col, msg, type(self)
+        if 'overload' in visitor.imports and not visitor.defined_overload:
+            missing = checks.missing['TYP002']
+            for line, col in _iter_positions(visitor.imports['overload']):
+                yield _Finding(line, col, msg, 'overload', missing)
 
+    def _typ003(
+            self,
+            visitor: Visitor,
+            checks: _Checks,
+            format_missing: _FormatMissing,
+    ) -> Generator[_Finding, None, None]:
         msg = (
             'TYP003 Union[Match, ...] or Union[Pattern, ...] '
             'must be quoted in <3.5.2'
         )
-        if (
-                self._min_python_version < Version(3, 5, 2) and
-                visitor.unions_pattern_or_match
-        ):
-            for line, col in visitor.unions_pattern_or_match:
-                yield line, col, msg, type(self)
+        missing = checks.missing['TYP003']
+        for line, col in _iter_positions(visitor.unions_pattern_or_match):
+            yield _Finding(line, col, msg, 'Union', missing)
 
+    def _typ004(
+            self,
+            visitor: Visitor,
+            checks: _Checks,
+            format_missing: _FormatMissing,
+    ) -> Generator[_Finding, None, None]:
         msg = 'TYP004 NamedTuple does not support methods in 3.6.0'
+        missing = checks.missing['TYP004']
+        for line, col in _iter_positions(visitor.namedtuple_methods):
+            yield _Finding(line, col, msg, 'NamedTuple', missing)
+
+    def _typ005(
+            self,
+            visitor: Visitor,
+            checks: _Checks,
+            format_missing: _FormatMissing,
+    ) -> Generator[_Finding, None, None]:
+        msg = 'TYP005 NamedTuple does not support defaults in 3.6.0'
+        missing = checks.missing['TYP005']
+        for line, col in _iter_positions(visitor.namedtuple_defaults):
+            yield _Finding(line, col, msg, 'NamedTuple', missing)
+
+    def _typ006(
+            self,
+            visitor: Visitor,
+            checks: _Checks,
+            format_missing: _FormatMissing,
+    ) -> Generator[_Finding, None, None]:
+        msg = 'TYP006 guard `typing` attribute by quoting: {} (not in {})'
+        yield from self._version_specific_findings(
+            msg, visitor.attributes, checks.min_mask, format_missing,
+        )
+
+    _rule_findings: Dict[
+        str,
+        Callable[
+            ['Plugin', Visitor, _Checks, _FormatMissing],
+            Iterator[_Finding],
+        ],
+    ] = {
+        'TYP001': _typ001,
+        'TYP002': _typ002,
+        'TYP003': _typ003,
+        'TYP004': _typ004,
+        'TYP005': _typ005,
+        'TYP006': _typ006,
+    }
+
+
+def check_many(
+        sources: Iterable[Union[str, bytes, ast.AST]],
+        min_version: Union[str, Version, None] = None,
+) -> Generator[List[Tuple[int, int, str]], None, None]:
+    """check many files at once, yielding the results for each in order
+
+    sources are either source code or already parsed trees, source code
+    which can't be parsed gets an E999 result.  min_version defaults to the
+    one resolved by flake8 / parse_options.
+    """
+    if min_version is None:
+        version = Plugin._min_python_version
+    elif isinstance(min_version, str):
+        version = _validate_min_version(Version.parse(min_version))
+    else:
+        version = _validate_min_version(min_version)
+
+    # built once, up front, and shared by every file
+    _symbol_table()
+    _checks(version)
+
+    for source in sources:
+        # skip parsing entirely, see the prefilter in Plugin.run
+        if isinstance(source, str) and 'typing' not in source:
+            yield []
+            continue
+        elif isinstance(source, bytes) and b'typing' not in source:
+            yield []
+            continue
+        elif isinstance(source, ast.AST):
+            plugin = Plugin(source)
+        else:
+            # one unparseable source does not end the batch
+            try:
+                tree = ast.parse(source)
+            except (SyntaxError, ValueError) as e:
+                yield [_parse_error(e)[:3]]
+                continue
+            plugin = Plugin(tree)
+        plugin._min_python_version = version
+        if min_version is not None:
+            plugin._floors = ()
+        yield [(line, col, msg) for line, col, msg, _ in plugin.run()]
+
+
+# same as flake8's default --exclude
+EXCLUDE = frozenset((
+    '.svn', 'CVS', '.bzr', '.hg', '.git', '__pycache__', '.tox', '.nox',
+    '.eggs', '*.egg',
+))
+
+
+def _is_excluded(name: str) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) for pattern in EXCLUDE)
+
+
+def _iter_filenames(paths: Sequence[str]) -> Generator[str, None, None]:
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not _is_excluded(d))
+            for filename in sorted(files):
+                if filename.endswith('.py') and not _is_excluded(filename):
+                    yield os.path.join(root, filename)
+
+
+# files which can change the resolved min version
+CONFIG_FILES = frozenset(filename for filename, _ in PROJECT_FILES)
+
+
+def _git(*cmd: str) -> str:
+    import subprocess
+
+    proc = subprocess.run(
+        ('git', *cmd), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        check=True,
+    )
+    return proc.stdout.decode()
+
+
+def _changed_filenames(base: str, paths: Sequence[str]) -> Optional[List[str]]:
+    """python files changed since `base`, or `None` to check everything
+
+    the paths may be anywhere in the checkout, the filenames are relative to
+    the current directory like theirs.
+    """
+    top = os.path.realpath(_git('rev-parse', '--show-toplevel').rstrip('\n'))
+    # relative to the root of the checkout, not the current directory
+    changed_s = _git('diff', '-z', '--name-only', base, '--')
+    changed_s += _git(
+        'ls-files', '-z', '--others', '--exclude-standard', '--full-name',
+        ':/',
+    )
+    changed = {os.path.normpath(p) for p in changed_s.split('\0') if p}
+    if any(os.path.basename(p) in CONFIG_FILES for p in changed):
+        return None
+
+    prefixes = []
+    for path in paths:
+        path = os.path.realpath(path)
+        if os.path.isdir(path):
+            prefixes.append(os.path.join(path, ''))
+        else:
+            prefixes.append(path)
+
+    ret = []
+    for name in sorted(changed):
+        filename = os.path.join(top, name)
         if (
-                self._min_python_version < Version(3, 6, 1) and
-                visitor.namedtuple_methods
+                name.endswith('.py') and
+                os.path.exists(filename) and  # not deleted
+                filename.startswith(tuple(prefixes)) and
+                not any(_is_excluded(part) for part in name.split(os.sep))
         ):
-            for line, col in visitor.namedtuple_methods:
-                yield line, col, msg, type(self)
+            ret.append(os.path.relpath(filename))
+    return ret
 
-        msg = 'TYP005 NamedTuple does not support defaults in 3.6.0'
+
+# files this big are checked from their tokens, their ast would dominate
+STREAM_THRESHOLD = 1024 * 1024
+
+
+def _file_contains(f: BinaryIO, s: bytes) -> bool:
+    tail = b''
+    for chunk in iter(functools.partial(f.read, 64 * 1024), b''):
+        if s in tail + chunk:
+            return True
+        tail = chunk[1 - len(s):]
+    return False
+
+
+def _check_file(filename: str) -> Tuple[str, List[_Finding]]:
+    try:
+        with open(filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= STREAM_THRESHOLD:
+                # the same prefilter as in _check_source, without reading
+                # the whole file
+                if not _file_contains(f, b'typing'):
+                    return filename, []
+                f.seek(0)
+                tokens = tokenize.tokenize(f.readline)
+                results = _check_tokens(filename, tokens)
+                if results is not None:
+                    return filename, results
+                f.seek(0)
+            contents = f.read()
+    except OSError as e:
+        return filename, [_os_error(e)]
+    return filename, _check_source(filename, contents, stream=False)
+
+
+def _os_error(e: OSError) -> _Finding:
+    return _Finding(1, 0, f'E902 {type(e).__name__}: {e}', None, 0)
+
+
+def _parse_error(e: Union[SyntaxError, ValueError]) -> _Finding:
+    if isinstance(e, SyntaxError):
+        line, col = e.lineno or 1, max((e.offset or 1) - 1, 0)
+        msg = e.msg
+    else:  # null bytes before python 3.11, unencodable surrogates
+        line, col, msg = 1, 0, str(e)
+    return _Finding(line, col, f'E999 {type(e).__name__}: {msg}', None, 0)
+
+
+def _check_source(
+        filename: str,
+        source: Union[str, bytes],
+        stream: bool = True,
+) -> List[_Finding]:
+    # same reasoning as the prefilter in Plugin.run, but before parsing
+    if isinstance(source, bytes):
+        if b'typing' not in source:
+            return []
+    elif 'typing' not in source:
+        return []
+
+    if stream and len(source) >= STREAM_THRESHOLD:
+        if isinstance(source, bytes):
+            tokens = tokenize.tokenize(io.BytesIO(source).readline)
+        else:
+            tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+        results = _check_tokens(filename, tokens)
+        if results is not None:
+            return results
+
+    try:
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError) as e:
+        return [_parse_error(e)]
+
+    if isinstance(source, bytes):
+        bio = io.BytesIO(source)
+        encoding, _ = tokenize.detect_encoding(bio.readline)
+        source = source.decode(encoding)
+    lines = source.splitlines(True)
+    results = list(Plugin(tree, lines, filename)._file_findings())
+    results.sort()
+    return results
+
+
+def _check_tokens(
+        filename: str,
+        tokens: Iterable[tokenize.TokenInfo],
+) -> Optional[List[_Finding]]:
+    """the results from the tokens alone, None if the ast is needed"""
+    min_version = _checked_min_version(filename)
+    if not _STREAM_CODES.issuperset(_checks(min_version).codes):
+        return None
+
+    try:
+        visitor = _stream_visit(tokens)
+    except (_NeedsAST, tokenize.TokenError, SyntaxError, UnicodeError):
+        # including undecodable bytes: the ast reports them as E999
+        return None
+
+    # the findings only need the visitor, the (empty) tree is never visited
+    plugin = Plugin(ast.Module(body=[], type_ignores=[]), filename=filename)
+    plugin._min_python_version = min_version
+    results = list(plugin._findings(visitor, plugin._format_missing))
+    results.sort()
+    return results
+
+
+# `# noqa` lines are left alone by --fix, whichever codes they name
+_NOQA_RE = re.compile(r'#\s*noqa\b', re.I)
+
+
+class _Alias(NamedTuple):
+    name: str
+    # the name bound by the import, differs from `name` with `as`
+    bound: str
+    start: int
+    end: int
+    # the line of a parenthesized alias alone on its line
+    line: Optional[Tuple[int, int]]
+
+
+class _ImportFrom(NamedTuple):
+    start: int
+    # after the NEWLINE token
+    end: int
+    aliases: Tuple[_Alias, ...]
+
+
+class _Edit(NamedTuple):
+    start: int
+    end: int
+    text: str
+
+
+def _line_offsets(lines: Sequence[str]) -> List[int]:
+    """the offset in the source of the start of each (1 based) line"""
+    ret = [0, 0]
+    for line in lines:
+        ret.append(ret[-1] + len(line))
+    return ret
+
+
+def _char_col(line: str, col: int) -> int:
+    # the ast's columns are utf-8 byte offsets, tokenize's are characters
+    return len(line.encode()[:col].decode())
+
+
+def _closing_bracket(tokens: Sequence[tokenize.TokenInfo], i: int) -> int:
+    depth = 0
+    for j in range(i, len(tokens)):
+        if tokens[j].type != tokenize.OP:
+            continue
+        elif tokens[j].string in {'(', '[', '{'}:
+            depth += 1
+        elif tokens[j].string in {')', ']', '}'}:
+            depth -= 1
+            if not depth:
+                return j
+    raise AssertionError('unbalanced brackets in a parsed source')
+
+
+def _expression_end(tokens: Sequence[tokenize.TokenInfo], i: int) -> int:
+    """the last token of the name at `i` with its `.x` / `[...]` trailers"""
+    while True:
+        tok = tokens[i + 1]
+        if tok.string == '.' and tokens[i + 2].type == tokenize.NAME:
+            i += 2
+        elif tok.string == '[':
+            i = _closing_bracket(tokens, i + 1)
+        else:
+            return i
+
+
+def _quote_edit(
+        source: str,
+        offsets: Sequence[int],
+        tokens: Sequence[tokenize.TokenInfo],
+        i: int,
+) -> Optional[_Edit]:
+    (start_line, start_col) = tokens[i].start
+    (end_line, end_col) = tokens[_expression_end(tokens, i)].end
+    if start_line != end_line:
+        return None
+    start = offsets[start_line] + start_col
+    end = offsets[end_line] + end_col
+    text = source[start:end]
+    if '\\' in text:
+        return None
+    for quote in ("'", '"'):
+        if quote not in text:
+            return _Edit(start, end, f'{quote}{text}{quote}')
+    return None
+
+
+def _statement_end(tokens: Sequence[tokenize.TokenInfo], i: int) -> int:
+    """the NEWLINE token of the statement at token `i`"""
+    for j in range(i, len(tokens)):
+        if tokens[j].type == tokenize.NEWLINE:
+            return j
+    raise AssertionError('unterminated statement in a parsed source')
+
+
+def _import_from(
+        offsets: Sequence[int],
+        tokens: Sequence[tokenize.TokenInfo],
+        i: int,
+) -> Optional[_ImportFrom]:
+    """the `from typing import ...` statement starting at token `i`
+
+    None when it shares its line with another statement.
+    """
+    newline = _statement_end(tokens, i)
+    if (
+            tokens[i].start[1] != 0 or
+            any(tok.string == ';' for tok in tokens[i:newline])
+    ):
+        return None
+
+    def _offset(pos: Tuple[int, int]) -> int:
+        return offsets[pos[0]] + pos[1]
+
+    aliases = []
+    first = None
+    # after `from typing import`
+    for j in range(i + 3, newline + 1):
+        tok = tokens[j]
+        if tok.type == tokenize.NAME:
+            first = j if first is None else first
+            continue
+        elif first is None:
+            continue
+
+        # `NAME [as NAME] [,] [# comment]` between two NL tokens
+        after = j + (tok.string == ',')
+        after += tokens[after].type == tokenize.COMMENT
         if (
-                self._min_python_version < Version(3, 6, 1) and
-                visitor.namedtuple_defaults
+                tokens[first - 1].type == tokenize.NL and
+                tokens[after].type == tokenize.NL
         ):
-            for line, col in visitor.namedtuple_defaults:
-                yield line, col, msg, type(self)
+            line: Optional[Tuple[int, int]]
+            line = offsets[tokens[first].start[0]], _offset(tokens[after].end)
+        else:
+            line = None
 
-        msg = 'TYP006 guard `typing` attribute by quoting: {} (not in {})'
-        yield from self._version_specific_errors(msg, visitor.attributes)
+        aliases.append(
+            _Alias(
+                tokens[first].string, tokens[j - 1].string,
+                _offset(tokens[first].start), _offset(tokens[j - 1].end),
+                line,
+            ),
+        )
+        first = None
+
+    return _ImportFrom(
+        _offset(tokens[i].start), _offset(tokens[newline].end),
+        tuple(aliases),
+    )
+
+
+def _remove_aliases(stmt: _ImportFrom, remove: Set[int]) -> List[_Edit]:
+    aliases = stmt.aliases
+    if len(remove) == len(aliases):
+        return [_Edit(stmt.start, stmt.end, '')]
+
+    # an alias alone on its line goes with its line, the others go up to
+    # the next alias (with the comma) or, after the last alias which is
+    # kept, with the comma before them
+    deletions = []
+    for i in remove:
+        line = aliases[i].line
+        if line is not None:
+            deletions.append(line)
+    rest = [
+        i for i, alias in enumerate(aliases)
+        if i not in remove or alias.line is None
+    ]
+    last_kept = max(i for i in rest if i not in remove)
+    for i, j in zip(rest, rest[1:]):
+        if i in remove and i < last_kept:
+            deletions.append((aliases[i].start, aliases[j].start))
+    if rest[-1] > last_kept:
+        deletions.append((aliases[last_kept].end, aliases[rest[-1]].end))
+
+    edits: List[_Edit] = []
+    for start, end in sorted(deletions):
+        if edits and start <= edits[-1].end:
+            edits[-1] = _Edit(edits[-1].start, max(end, edits[-1].end), '')
+        else:
+            edits.append(_Edit(start, end, ''))
+    return edits
+
+
+def _annotations(tree: ast.AST) -> Generator[ast.AST, None, None]:
+    for node in ast.walk(tree):
+        if isinstance(node, ast.arg) and node.annotation is not None:
+            yield node.annotation
+        elif (
+                isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and
+                node.returns is not None
+        ):
+            yield node.returns
+        elif isinstance(node, ast.AnnAssign):
+            yield node.annotation
+
+
+def _fix_source(source: str, min_version: Version) -> str:
+    """guard the imports of TYP001 and quote the attributes of TYP006
+
+    only annotations are changed: an import is only moved when all of its
+    uses are in annotations, they are quoted.  the rest is left as is.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return source
+
+    visitor = Visitor(min_version)
+    visitor.visit(tree)
+    checks = _checks(min_version)
+    masks = _symbol_table().masks
+    imports = {
+        name for name in visitor.imports
+        if name != '*' and checks.min_mask & ~masks.get(name, 0)
+    }
+    attributes = {
+        name for name in visitor.attributes
+        if checks.min_mask & ~masks.get(name, 0)
+    }
+    if not imports and not attributes:
+        return source
+
+    in_annotation = {
+        id(node)
+        for annotation in _annotations(tree)
+        for node in ast.walk(annotation)
+    }
+    annotation_names: Dict[str, List[ast.Name]]
+    annotation_names = collections.defaultdict(list)
+    annotation_attributes: Set[Tuple[int, int]] = set()
+    used_elsewhere: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if id(node) in in_annotation:
+                annotation_names[node.id].append(node)
+            else:
+                used_elsewhere.add(node.id)
+        elif isinstance(node, ast.Attribute) and id(node) in in_annotation:
+            annotation_attributes.add((node.lineno, node.col_offset))
+
+    lines = io.StringIO(source).readlines()
+    tokens = list(tokenize.generate_tokens(iter(lines).__next__))
+    offsets = _line_offsets(lines)
+    names = {
+        tok.start: i for i, tok in enumerate(tokens)
+        if tok.type == tokenize.NAME
+    }
+    noqa = {
+        tok.start[0] for tok in tokens
+        if tok.type == tokenize.COMMENT and _NOQA_RE.search(tok.string)
+    }
+
+    def _token(line: int, col: int) -> int:
+        return names[(line, _char_col(lines[line - 1], col))]
+
+    def _quote_edits(nodes: Iterable[ast.expr]) -> Optional[List[_Edit]]:
+        """None when any of them cannot be quoted"""
+        edits = []
+        for node in nodes:
+            if node.lineno in noqa:
+                return None
+            i = _token(node.lineno, node.col_offset)
+            edit = _quote_edit(source, offsets, tokens, i)
+            if edit is None:
+                return None
+            edits.append(edit)
+        return edits
+
+    quotes: List[_Edit] = []
+    for name in sorted(attributes):
+        for line, col in _iter_positions(visitor.attributes[name]):
+            # unlike in annotations, quoting changes what the code does
+            if (line, col) not in annotation_attributes or line in noqa:
+                continue
+            edit = _quote_edit(source, offsets, tokens, _token(line, col))
+            if edit is not None:
+                quotes.append(edit)
+
+    edits: List[_Edit] = []
+    moved: Set[Tuple[str, str]] = set()
+    statements = {
+        pos
+        for name in imports
+        for pos in _iter_positions(visitor.imports[name])
+    }
+    for line, col in sorted(statements):
+        stmt = _import_from(offsets, tokens, _token(line, col))
+        if stmt is None or _NOQA_RE.search(source, stmt.start, stmt.end):
+            continue
+
+        remove: Set[int] = set()
+        for i, alias in enumerate(stmt.aliases):
+            if alias.name not in imports or alias.bound in used_elsewhere:
+                continue
+            alias_quotes = _quote_edits(annotation_names[alias.bound])
+            if alias_quotes is not None:
+                remove.add(i)
+                moved.add((alias.name, alias.bound))
+                quotes.extend(alias_quotes)
+
+        if remove:
+            edits.extend(_remove_aliases(stmt, remove))
+
+    # quoting the outer expression quotes any inside of it too
+    end = 0
+    for edit in sorted(quotes):
+        if edit.start >= end:
+            edits.append(edit)
+            end = edit.end
+
+    if moved:
+        newline = '\r\n' if lines[0].endswith('\r\n') else '\n'
+        block = []
+        if min_version < Version(3, 5, 2):
+            block.append('if False:  # TYPE_CHECKING')
+        else:
+            if 'TYPE_CHECKING' not in visitor.from_imported_names:
+                block.append('from typing import TYPE_CHECKING')
+            block.append('if TYPE_CHECKING:')
+        for name, bound in sorted(moved):
+            if bound != name:
+                block.append(f'    from typing import {name} as {bound}')
+            else:
+                block.append(f'    from typing import {name}')
+        text = newline.join(block) + newline
+        # after the last `from typing import`, `TYPE_CHECKING` may be there
+        last = max(
+            pos
+            for positions in visitor.imports.values()
+            for pos in _iter_positions(positions)
+        )
+        end_tok = tokens[_statement_end(tokens, _token(*last))]
+        # the NEWLINE token of a last line without one is past the end
+        after = min(offsets[end_tok.end[0]] + end_tok.end[1], len(source))
+        edits.append(_Edit(after, after, text))
+
+    parts: List[str] = []
+    pos = 0
+    for edit in sorted(edits):
+        parts.append(source[pos:edit.start])
+        # after a last line without a newline
+        if edit.start == len(source) and edit.text:
+            if not ''.join(parts).endswith(('\n', '\r')):
+                parts.append(newline)
+        parts.append(edit.text)
+        pos = edit.end
+    parts.append(source[pos:])
+    return ''.join(parts)
+
+
+def _replace_file(path: str, contents: bytes) -> None:
+    # the file a symlink points to is replaced, not the symlink itself
+    path = os.path.realpath(path)
+    st = os.stat(path)
+    _write_atomic(
+        path, contents, stat.S_IMODE(st.st_mode), (st.st_uid, st.st_gid),
+    )
+
+
+def _fix_file(filename: str) -> Tuple[str, List[_Finding], bool]:
+    """fix `filename` in place, then check it
+
+    the results are those left after fixing, followed by whether the file
+    was rewritten.
+    """
+    try:
+        with open(filename, 'rb') as f:
+            contents = f.read()
+    except OSError as e:
+        return filename, [_os_error(e)], False
+
+    if b'typing' in contents:
+        min_version = _checked_min_version(filename)
+        try:
+            bio = io.BytesIO(contents)
+            encoding, _ = tokenize.detect_encoding(bio.readline)
+            source = contents.decode(encoding)
+        except (SyntaxError, UnicodeDecodeError):
+            pass  # reported by the check
+        else:
+            fixed = _fix_source(source, min_version)
+            if fixed != source:
+                contents = fixed.encode(encoding)
+                _replace_file(filename, contents)
+                return filename, _check_source(filename, contents), True
+
+    return filename, _check_source(filename, contents), False
+
+
+def _daemon_response(request_b: bytes) -> Dict[str, Any]:
+    try:
+        request = json.loads(request_b)
+    except ValueError as e:
+        return {'error': f'invalid json: {e}'}
+    if (
+            not isinstance(request, dict) or
+            not isinstance(request.get('filename'), str) or
+            not isinstance(request.get('source', ''), str)
+    ):
+        return {'error': 'expected {"filename": str, "source": str?}'}
+
+    filename = request['filename']
+    if 'source' in request:
+        results = _check_source(filename, request['source'])
+    else:
+        _, results = _check_file(filename)
+    return {
+        'filename': filename,
+        'results': [
+            [line, col, _floors_message(msg, missing, Plugin._floors)]
+            for line, col, msg, _, missing in results
+        ],
+    }
+
+
+def _daemon_handle(
+        rfile: io.BufferedIOBase,
+        wfile: io.BufferedIOBase,
+) -> None:
+    """a json request per line => a json response per line"""
+    for request_b in rfile:
+        try:
+            response = _daemon_response(request_b)
+        except Exception as e:  # one bad file does not end the connection
+            response = {'error': f'{type(e).__name__}: {e}'}
+        wfile.write(json.dumps(response).encode() + b'\n')
+
+
+def _remove_stale_socket(path: str) -> None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode):
+        return
+    # left behind by a daemon which did not exit cleanly
+    import socket
+
+    with socket.socket(socket.AF_UNIX) as sock:
+        try:
+            sock.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path)
+
+
+def _daemon_server(path: str) -> 'socketserver.ThreadingUnixStreamServer':
+    import socketserver
+
+    class _DaemonHandler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            _daemon_handle(self.rfile, self.wfile)
+
+    _remove_stale_socket(path)
+    # the daemon reads files on behalf of its clients, only allow our user
+    umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(path, _DaemonHandler)
+    finally:
+        os.umask(umask)
+    server.daemon_threads = True
+    return server
+
+
+def _format_default(filename: str, finding: _Finding) -> str:
+    msg = _floors_message(finding.msg, finding.missing, Plugin._floors)
+    return f'{filename}:{finding.line}:{finding.col + 1}: {msg}'
+
+
+@functools.lru_cache(maxsize=None)
+def _version_strings(mask: int) -> Tuple[str, ...]:
+    return tuple(str(v) for v in _mask_versions(mask))
+
+
+def _format_jsonl(filename: str, finding: _Finding) -> str:
+    code, _, text = finding.msg.partition(' ')
+    return json.dumps({
+        'filename': filename,
+        'line': finding.line,
+        'col': finding.col + 1,
+        'code': code,
+        'symbol': finding.symbol,
+        'missing': (
+            _version_strings(finding.missing) if finding.missing else None
+        ),
+        'floors': (
+            [
+                str(v)
+                for v in _finding_floors(Plugin._floors, finding.missing)
+            ]
+            if Plugin._floors else None
+        ),
+        'message': text,
+    })
+
+
+FORMATS: Dict[str, Callable[[str, _Finding], str]] = {
+    'default': _format_default,
+    'jsonl': _format_jsonl,
+}
+
+T = TypeVar('T')
+
+
+def _imap(
+        func: Callable[[str], T],
+        filenames: Iterable[str],
+        jobs: int,
+) -> Generator[T, None, None]:
+    """func(filename) for each of filenames, in any order"""
+    import multiprocessing
+
+    if jobs > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        with multiprocessing.get_context('fork').Pool(jobs) as pool:
+            yield from pool.imap_unordered(func, filenames, chunksize=8)
+    else:
+        yield from map(func, filenames)
+
+
+# where flake8 looks for its configuration, in order
+FLAKE8_CONFIG_FILES = ('setup.cfg', 'tox.ini', '.flake8')
+
+
+def _flake8_config(directory: str) -> Dict[str, str]:
+    """the `[flake8]` section flake8 would use when run from `directory`
+
+    the first of the configuration files with that section, walking up.
+    """
+    directory = os.path.abspath(directory)
+    while True:
+        for filename in FLAKE8_CONFIG_FILES:
+            cfg = configparser.RawConfigParser()
+            cfg.read(os.path.join(directory, filename), encoding='UTF-8')
+            if cfg.has_section('flake8'):
+                return dict(cfg.items('flake8'))
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return {}
+        directory = parent
+
+
+def _config_flag(s: str) -> bool:
+    return configparser.RawConfigParser.BOOLEAN_STATES[s.lower()]
+
+
+class _ArgumentParserOptions:
+    """adapts Plugin.add_options to a plain ArgumentParser"""
+
+    def __init__(self, parser: 'argparse.ArgumentParser') -> None:
+        self._parser = parser
+        # dest => type, of the options flake8 also reads from its config
+        self._config_types: Dict[str, Callable[[str], Any]] = {}
+
+    def add_option(
+            self,
+            *args: str,
+            type: Optional[str] = None,
+            parse_from_config: bool = False,
+            **kwargs: Any,
+    ) -> None:
+        if type is not None:
+            kwargs['type'] = {'str': str, 'int': int}[type]
+        action = self._parser.add_argument(*args, **kwargs)
+        if parse_from_config:
+            flag = action.nargs == 0
+            convert = _config_flag if flag else kwargs.get('type', str)
+            self._config_types[action.dest] = convert
+
+    def set_config_defaults(self, config: Dict[str, str]) -> None:
+        """the `[flake8]` settings of our options replace their defaults"""
+        defaults = {}
+        for key, value in config.items():
+            # flake8 accepts both `min-python-version` and `min_python_version`
+            dest = key.replace('-', '_')
+            if dest not in self._config_types:  # flake8's or another plugin's
+                continue
+            try:
+                defaults[dest] = self._config_types[dest](value)
+            except (KeyError, ValueError):
+                self._parser.error(f'[flake8] {key}: invalid value {value!r}')
+        self._parser.set_defaults(**defaults)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    import argparse
+    import subprocess
+
+    parser = argparse.ArgumentParser(
+        prog=f'python -m {__name__}',
+        description='check that typing imports are properly guarded',
+    )
+    parser.add_argument('paths', nargs='*', default=['.'])
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=os.cpu_count() or 1,
+        help='number of processes to check files with (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--diff-base', metavar='REV',
+        help=(
+            'only check python files which changed since the git revision '
+            'REV.  everything is checked if a file which affects the '
+            f'minimum python version ({", ".join(sorted(CONFIG_FILES))}) '
+            'changed'
+        ),
+    )
+    parser.add_argument(
+        '--format', choices=tuple(FORMATS), default='default',
+        help=(
+            'output format, `jsonl` is a json object per line for each '
+            'result (default: %(default)s)'
+        ),
+    )
+    parser.add_argument(
+        '--fix', action='store_true',
+        help=(
+            'rewrite the files in place: move the imports of TYP001 into a '
+            '`TYPE_CHECKING` block and quote the attributes of TYP006, '
+            'where only annotations need to change'
+        ),
+    )
+    parser.add_argument(
+        '--serve', metavar='SOCKET',
+        help=(
+            'run as a daemon, checking the files requested over the unix '
+            'socket SOCKET'
+        ),
+    )
+    parser.add_argument(
+        '--profile-summary', metavar='FILE',
+        help='summarize a --typing-imports-profile FILE and exit',
+    )
+    options = _ArgumentParserOptions(parser)
+    Plugin.add_options(options)
+    try:
+        config = _flake8_config(os.getcwd())
+    except (configparser.Error, UnicodeDecodeError) as e:
+        parser.error(f'flake8 configuration: {e}')
+    options.set_config_defaults(config)
+    args = parser.parse_args(argv)
+
+    if args.profile_summary:
+        print(profile_summary(args.profile_summary), end='')
+        return 0
+
+    Plugin.parse_options(args)
+    # build the shared state up front so forked workers inherit it
+    _symbol_table()
+
+    if args.serve:
+        _checks(Plugin._min_python_version)
+        with _daemon_server(args.serve) as server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.remove(args.serve)
+        return 0
+
+    filenames: Optional[Iterable[str]] = None
+    if args.diff_base is not None:
+        try:
+            filenames = _changed_filenames(args.diff_base, args.paths)
+        except subprocess.CalledProcessError as e:
+            parser.error(f'--diff-base: {e.stderr.decode().strip()}')
+        except OSError as e:
+            parser.error(f'--diff-base: {e}')
+    if filenames is None:
+        filenames = _iter_filenames(args.paths)
+
+    ret = 0
+
+    format_finding = FORMATS[args.format]
+
+    def _report(filename: str, results: List[_Finding]) -> None:
+        nonlocal ret
+        for finding in results:
+            print(format_finding(filename, finding))
+            ret = 1
+        sys.stdout.flush()
+
+    if args.fix:
+        for filename, results, fixed in _imap(_fix_file, filenames, args.jobs):
+            if fixed:
+                print(f'Rewriting {filename}', file=sys.stderr)
+                ret = 1
+            _report(filename, results)
+    else:
+        for filename, results in _imap(_check_file, filenames, args.jobs):
+            _report(filename, results)
+
+    return ret
+
+
+if __name__ == '__main__':
+    # `python -m`: run the importable module rather than this `__main__`
+    # copy, which neither has our name nor the installed distribution's
+    from flake8_typing_imports import main as _main
+    exit(_main())
@@ -0,0 +1,115 @@
+"""helpers for asyncio code"""
+import asyncio
+import functools
+import time
+import typing
+from typing import AsyncGenerator
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Coroutine
+from typing import List
+from typing import Optional
+from typing import overload
+from typing import TypeVar
+
+T = TypeVar('T')
+U = TypeVar('U')
+
+
+async def gather_limited(
+        aws: typing.Iterable[Awaitable[T]],
+        limit: int,
+) -> List[T]:
+    sem = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with sem:
+            return await aw
+
+    return list(await asyncio.gather(*(run(aw) for aw in aws)))
+
+
+async def aenumerate(
+        it: AsyncIterable[T],
+        start: int = 0,
+) -> AsyncGenerator[typing.Tuple[int, T], None]:
+    i = start
+    async for x in it:
+        yield i, x
+        i += 1
+
+
+async def achunks(it: AsyncIterator[T], n: int) -> AsyncIterator[List[T]]:
+    chunk: List[T] = []
+    async for x in it:
+        chunk.append(x)
+        if len(chunk) == n:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+@overload
+async def first(it: AsyncIterable[T]) -> Optional[T]: ...
+@overload  # noqa: E302
+async def first(it: AsyncIterable[T], default: T) -> T: ...
+async def first(  # noqa: E302
+        it: AsyncIterable[T],
+        default: typing.Optional[T] = None,
+) -> Optional[T]:
+    async for x in it:
+        return x
+    return default
+
+
+def retry(
+        attempts: int,
+        delay: float = .1,
+) -> Callable[
+    [Callable[..., Coroutine[typing.Any, typing.Any, T]]],
+    Callable[..., Coroutine[typing.Any, typing.Any, T]],
+]:
+    def decorator(
+            func: Callable[..., Coroutine[typing.Any, typing.Any, T]],
+    ) -> Callable[..., Coroutine[typing.Any, typing.Any, T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> T:
+            for attempt in range(attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception:
+                    if attempt == attempts - 1:
+                        raise
+                    await asyncio.sleep(delay * 2 ** attempt)
+            raise AssertionError('unreachable')
+        return wrapper
+    return decorator
+
+
+class Timer:
+    def __init__(self) -> None:
+        self.elapsed: typing.Optional[float] = None
+        self._start = 0.
+
+    async def __aenter__(self) -> 'Timer':
+        self._start = time.monotonic()
+        return self
+
+    async def __aexit__(self, *exc: typing.Any) -> None:
+        self.elapsed = time.monotonic() - self._start
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(elapsed={self.elapsed!r})'
+
+
+def amap(
+        func: Callable[[T], Awaitable[U]],
+        it: AsyncIterable[T],
+) -> typing.AsyncIterator[U]:
+    async def gen() -> typing.AsyncIterator[U]:
+        async for x in it:
+            yield await func(x)
+    return gen()
@@ -0,0 +1,1571 @@
+# GENERATED by protocol-compiler, DO NOT EDIT
+"""message types for the rpc protocol"""
+import enum
+import typing
+
+
+class Message0:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Optional[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message0':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message0Alias = typing.Dict
+
+
+class Message1:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Deque[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Dict]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message1':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message1Alias = typing.Callable
+
+
+class Message2:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Any[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.List]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message2':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message2Alias = typing.DefaultDict
+
+
+class Message3:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Type[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Optional]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message3':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message3Alias = typing.OrderedDict
+
+
+class Message4:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.ClassVar[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Union]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message4':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message4Alias = typing.Union
+
+
+class Message5:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Union[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Tuple]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message5':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message5Alias = typing.Counter
+
+
+class Message6:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.DefaultDict[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Callable]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message6':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message6Alias = typing.ClassVar
+
+
+class Message7:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Dict[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Type]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message7':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message7Alias = typing.List
+
+
+class Message8:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.ChainMap[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.ChainMap]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message8':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message8Alias = typing.Type
+
+
+class Message9:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Collection[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Counter]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message9':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message9Alias = typing.NoReturn
+
+
+class Message10:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Tuple[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Deque]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message10':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message10Alias = typing.Any
+
+
+class Message11:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.NoReturn[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.DefaultDict]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message11':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message11Alias = typing.Tuple
+
+
+class Message12:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.List[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.NoReturn]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message12':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message12Alias = typing.Deque
+
+
+class Message13:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Counter[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Text]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message13':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message13Alias = typing.Collection
+
+
+class Message14:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.OrderedDict[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.ClassVar]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message14':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message14Alias = typing.Optional
+
+
+class Message15:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Callable[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Collection]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message15':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message15Alias = typing.ChainMap
+
+
+class Message16:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Text[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.OrderedDict]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message16':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message16Alias = typing.Text
+
+
+class Message17:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Optional[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message17':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message17Alias = typing.Dict
+
+
+class Message18:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Deque[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Dict]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message18':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message18Alias = typing.Callable
+
+
+class Message19:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Any[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.List]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message19':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message19Alias = typing.DefaultDict
+
+
+class Message20:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Type[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Optional]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message20':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message20Alias = typing.OrderedDict
+
+
+class Message21:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.ClassVar[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Union]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message21':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message21Alias = typing.Union
+
+
+class Message22:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Union[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Tuple]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message22':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message22Alias = typing.Counter
+
+
+class Message23:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.DefaultDict[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Callable]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message23':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message23Alias = typing.ClassVar
+
+
+class Message24:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Dict[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Type]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message24':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message24Alias = typing.List
+
+
+class Message25:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.ChainMap[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.ChainMap]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message25':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message25Alias = typing.Type
+
+
+class Message26:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Collection[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Counter]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message26':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message26Alias = typing.NoReturn
+
+
+class Message27:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Tuple[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Deque]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message27':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message27Alias = typing.Any
+
+
+class Message28:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.NoReturn[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.DefaultDict]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message28':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message28Alias = typing.Tuple
+
+
+class Message29:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.List[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.NoReturn]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message29':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message29Alias = typing.Deque
+
+
+class Message30:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Counter[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Text]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message30':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message30Alias = typing.Collection
+
+
+class Message31:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.OrderedDict[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.ClassVar]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message31':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message31Alias = typing.Optional
+
+
+class Message32:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Callable[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Collection]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message32':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message32Alias = typing.ChainMap
+
+
+class Message33:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Text[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.OrderedDict]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message33':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message33Alias = typing.Text
+
+
+class Message34:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Optional[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message34':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message34Alias = typing.Dict
+
+
+class Message35:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Deque[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Dict]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message35':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message35Alias = typing.Callable
+
+
+class Message36:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Any[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.List]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message36':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message36Alias = typing.DefaultDict
+
+
+class Message37:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Type[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Optional]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message37':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message37Alias = typing.OrderedDict
+
+
+class Message38:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.ClassVar[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Union]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message38':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message38Alias = typing.Union
+
+
+class Message39:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Union[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Tuple]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message39':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message39Alias = typing.Counter
+
+
+class Message40:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.DefaultDict[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Callable]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message40':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message40Alias = typing.ClassVar
+
+
+class Message41:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Dict[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Type]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message41':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message41Alias = typing.List
+
+
+class Message42:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.ChainMap[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.ChainMap]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message42':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message42Alias = typing.Type
+
+
+class Message43:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Collection[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Counter]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message43':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message43Alias = typing.NoReturn
+
+
+class Message44:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Tuple[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Deque]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message44':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message44Alias = typing.Any
+
+
+class Message45:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.NoReturn[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.DefaultDict]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message45':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message45Alias = typing.Tuple
+
+
+class Message46:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.List[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.NoReturn]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message46':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message46Alias = typing.Deque
+
+
+class Message47:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Counter[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Text]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message47':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message47Alias = typing.Collection
+
+
+class Message48:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.OrderedDict[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.ClassVar]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message48':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message48Alias = typing.Optional
+
+
+class Message49:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Callable[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Collection]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message49':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message49Alias = typing.ChainMap
+
+
+class Message50:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Text[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.OrderedDict]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message50':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message50Alias = typing.Text
+
+
+class Message51:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Optional[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message51':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message51Alias = typing.Dict
+
+
+class Message52:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Deque[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Dict]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message52':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message52Alias = typing.Callable
+
+
+class Message53:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Any[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.List]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message53':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message53Alias = typing.DefaultDict
+
+
+class Message54:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Type[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Optional]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message54':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message54Alias = typing.OrderedDict
+
+
+class Message55:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.ClassVar[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Union]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message55':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message55Alias = typing.Union
+
+
+class Message56:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Union[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Tuple]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message56':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message56Alias = typing.Counter
+
+
+class Message57:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.DefaultDict[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Callable]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message57':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message57Alias = typing.ClassVar
+
+
+class Message58:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.Dict[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.Type]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message58':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message58Alias = typing.List
+
+
+class Message59:
+    __slots__ = ('f0', 'f1', 'f2')
+
+    def __init__(
+            self,
+            f0: typing.Optional[int] = None,
+            f1: 'typing.ChainMap[str, typing.Any]' = None,
+            f2: typing.Optional[typing.List[bytes]] = None,
+    ) -> None:
+        self.f0 = f0
+        self.f1 = f1
+        self.f2 = f2 or []
+
+    def to_dict(self) -> typing.Dict[str, typing.ChainMap]:
+        return {'f0': self.f0, 'f1': self.f1, 'f2': self.f2}
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> 'Message59':
+        return cls(d.get('f0'), d.get('f1'), d.get('f2'))
+
+
+Message59Alias = typing.Type
+
+
+class Kind(enum.IntEnum):
+    MESSAGE0 = 0
+    MESSAGE1 = 1
+    MESSAGE2 = 2
+    MESSAGE3 = 3
+    MESSAGE4 = 4
+    MESSAGE5 = 5
+    MESSAGE6 = 6
+    MESSAGE7 = 7
+    MESSAGE8 = 8
+    MESSAGE9 = 9
+    MESSAGE10 = 10
+    MESSAGE11 = 11
+    MESSAGE12 = 12
+    MESSAGE13 = 13
+    MESSAGE14 = 14
+    MESSAGE15 = 15
+    MESSAGE16 = 16
+    MESSAGE17 = 17
+    MESSAGE18 = 18
+    MESSAGE19 = 19
+    MESSAGE20 = 20
+    MESSAGE21 = 21
+    MESSAGE22 = 22
+    MESSAGE23 = 23
+    MESSAGE24 = 24
+    MESSAGE25 = 25
+    MESSAGE26 = 26
+    MESSAGE27 = 27
+    MESSAGE28 = 28
+    MESSAGE29 = 29
+    MESSAGE30 = 30
+    MESSAGE31 = 31
+    MESSAGE32 = 32
+    MESSAGE33 = 33
+    MESSAGE34 = 34
+    MESSAGE35 = 35
+    MESSAGE36 = 36
+    MESSAGE37 = 37
+    MESSAGE38 = 38
+    MESSAGE39 = 39
+    MESSAGE40 = 40
+    MESSAGE41 = 41
+    MESSAGE42 = 42
+    MESSAGE43 = 43
+    MESSAGE44 = 44
+    MESSAGE45 = 45
+    MESSAGE46 = 46
+    MESSAGE47 = 47
+    MESSAGE48 = 48
+    MESSAGE49 = 49
+    MESSAGE50 = 50
+    MESSAGE51 = 51
+    MESSAGE52 = 52
+    MESSAGE53 = 53
+    MESSAGE54 = 54
+    MESSAGE55 = 55
+    MESSAGE56 = 56
+    MESSAGE57 = 57
+    MESSAGE58 = 58
+    MESSAGE59 = 59
+
+
+TYPES: typing.Dict[Kind, typing.Type[typing.Any]] = {
+    Kind.MESSAGE0: Message0,
+    Kind.MESSAGE1: Message1,
+    Kind.MESSAGE2: Message2,
+    Kind.MESSAGE3: Message3,
+    Kind.MESSAGE4: Message4,
+    Kind.MESSAGE5: Message5,
+    Kind.MESSAGE6: Message6,
+    Kind.MESSAGE7: Message7,
+    Kind.MESSAGE8: Message8,
+    Kind.MESSAGE9: Message9,
+    Kind.MESSAGE10: Message10,
+    Kind.MESSAGE11: Message11,
+    Kind.MESSAGE12: Message12,
+    Kind.MESSAGE13: Message13,
+    Kind.MESSAGE14: Message14,
+    Kind.MESSAGE15: Message15,
+    Kind.MESSAGE16: Message16,
+    Kind.MESSAGE17: Message17,
+    Kind.MESSAGE18: Message18,
+    Kind.MESSAGE19: Message19,
+    Kind.MESSAGE20: Message20,
+    Kind.MESSAGE21: Message21,
+    Kind.MESSAGE22: Message22,
+    Kind.MESSAGE23: Message23,
+    Kind.MESSAGE24: Message24,
+    Kind.MESSAGE25: Message25,
+    Kind.MESSAGE26: Message26,
+    Kind.MESSAGE27: Message27,
+    Kind.MESSAGE28: Message28,
+    Kind.MESSAGE29: Message29,
+    Kind.MESSAGE30: Message30,
+    Kind.MESSAGE31: Message31,
+    Kind.MESSAGE32: Message32,
+    Kind.MESSAGE33: Message33,
+    Kind.MESSAGE34: Message34,
+    Kind.MESSAGE35: Message35,
+    Kind.MESSAGE36: Message36,
+    Kind.MESSAGE37: Message37,
+    Kind.MESSAGE38: Message38,
+    Kind.MESSAGE39: Message39,
+    Kind.MESSAGE40: Message40,
+    Kind.MESSAGE41: Message41,
+    Kind.MESSAGE42: Message42,
+    Kind.MESSAGE43: Message43,
+    Kind.MESSAGE44: Message44,
+    Kind.MESSAGE45: Message45,
+    Kind.MESSAGE46: Message46,
+    Kind.MESSAGE47: Message47,
+    Kind.MESSAGE48: Message48,
+    Kind.MESSAGE49: Message49,
+    Kind.MESSAGE50: Message50,
+    Kind.MESSAGE51: Message51,
+    Kind.MESSAGE52: Message52,
+    Kind.MESSAGE53: Message53,
+    Kind.MESSAGE54: Message54,
+    Kind.MESSAGE55: Message55,
+    Kind.MESSAGE56: Message56,
+    Kind.MESSAGE57: Message57,
+    Kind.MESSAGE58: Message58,
+    Kind.MESSAGE59: Message59,
+}
@@ -0,0 +1,188 @@
+"""a small typed http client, in the style of many real world libraries"""
+import collections
+import contextlib
+import json
+import socket
+import sys
+import urllib.parse
+from typing import Any
+from typing import AsyncContextManager
+from typing import ContextManager
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import NoReturn
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import Union
+
+if TYPE_CHECKING:
+    from typing import Protocol
+
+    class _Readable(Protocol):
+        def read(self, n: int = -1) -> bytes: ...
+
+Headers = Dict[str, str]
+Params = Union[Mapping[str, str], List[Tuple[str, str]]]
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, reason: str, body: bytes) -> None:
+        super().__init__(status, reason)
+        self.status = status
+        self.reason = reason
+        self.body = body
+
+    def __str__(self) -> str:
+        return f'{self.status} {self.reason}'
+
+
+class Response:
+    def __init__(
+            self,
+            status: int,
+            reason: str,
+            headers: Headers,
+            body: bytes,
+    ) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode('UTF-8'))
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise HTTPError(self.status, self.reason, self.body)
+
+
+def _fail(msg: str) -> NoReturn:
+    raise ValueError(msg)
+
+
+def _parse_status_line(line: bytes) -> Tuple[int, str]:
+    try:
+        _, status, reason = line.decode('latin-1').split(' ', 2)
+    except ValueError:
+        _fail(f'bad status line: {line!r}')
+    return int(status), reason.strip()
+
+
+def _parse_headers(lines: Iterator[bytes]) -> Headers:
+    headers: Headers = {}
+    for line in lines:
+        if not line.strip():
+            break
+        k, _, v = line.decode('latin-1').partition(':')
+        headers[k.strip().lower()] = v.strip()
+    return headers
+
+
+class ConnectionPool:
+    def __init__(self, maxsize: int = 10) -> None:
+        self.maxsize = maxsize
+        self._idle: Dict[Tuple[str, int], Deque[socket.socket]] = {}
+
+    @contextlib.contextmanager
+    def connection(self, host: str, port: int) -> Iterator[socket.socket]:
+        key = (host, port)
+        idle = self._idle.setdefault(key, collections.deque())
+        sock = idle.popleft() if idle else socket.create_connection(key)
+        try:
+            yield sock
+        except BaseException:
+            sock.close()
+            raise
+        else:
+            if len(idle) < self.maxsize:
+                idle.append(sock)
+            else:
+                sock.close()
+
+    def close(self) -> None:
+        for idle in self._idle.values():
+            while idle:
+                idle.pop().close()
+
+
+class Client:
+    def __init__(
+            self,
+            base_url: str,
+            *,
+            headers: Optional[Headers] = None,
+            pool: Optional[ConnectionPool] = None,
+    ) -> None:
+        self.base_url = base_url.rstrip('/')
+        self.headers = dict(headers or {})
+        self.pool = pool or ConnectionPool()
+
+    def _url(self, path: str, params: Optional[Params]) -> Tuple[str, int, str]:
+        url = urllib.parse.urlsplit(f'{self.base_url}/{path.lstrip("/")}')
+        target = url.path or '/'
+        if params:
+            target += '?' + urllib.parse.urlencode(params)
+        return url.hostname or 'localhost', url.port or 80, target
+
+    def request(
+            self,
+            method: str,
+            path: str,
+            *,
+            params: Optional[Params] = None,
+            body: Optional[bytes] = None,
+            headers: Optional[Headers] = None,
+    ) -> Response:
+        host, port, target = self._url(path, params)
+        all_headers = {**self.headers, **(headers or {}), 'host': host}
+        if body is not None:
+            all_headers['content-length'] = str(len(body))
+        head = ''.join(f'{k}: {v}\r\n' for k, v in all_headers.items())
+        data = f'{method} {target} HTTP/1.1\r\n{head}\r\n'.encode('latin-1')
+
+        with self.pool.connection(host, port) as sock:
+            sock.sendall(data + (body or b''))
+            f = sock.makefile('rb')
+            status, reason = _parse_status_line(f.readline())
+            resp_headers = _parse_headers(iter(f.readline, b''))
+            length = int(resp_headers.get('content-length', '0'))
+            return Response(status, reason, resp_headers, f.read(length))
+
+    def get(self, path: str, **kwargs: Any) -> Response:
+        return self.request('GET', path, **kwargs)
+
+    def post_json(self, path: str, obj: Any, **kwargs: Any) -> Response:
+        body = json.dumps(obj).encode()
+        headers = {'content-type': 'application/json'}
+        return self.request('POST', path, body=body, headers=headers, **kwargs)
+
+    def session(self) -> ContextManager['Client']:
+        return contextlib.closing(self)
+
+    def async_session(self) -> AsyncContextManager['Client']:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+def main() -> int:
+    client = Client(sys.argv[1])
+    with client.session():
+        resp = client.get(sys.argv[2])
+        resp.raise_for_status()
+        print(json.dumps(resp.json(), indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
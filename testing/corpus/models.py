@@ -0,0 +1,104 @@
+"""records for an inventory service, mostly typing.NamedTuple"""
+import datetime
+import decimal
+import enum
+import typing
+from typing import ClassVar
+from typing import FrozenSet
+from typing import NamedTuple
+from typing import Optional
+
+
+class Currency(enum.Enum):
+    EUR = 'EUR'
+    USD = 'USD'
+
+
+class Money(NamedTuple):
+    amount: decimal.Decimal
+    currency: Currency = Currency.EUR
+
+    def __add__(self, other: 'Money') -> 'Money':  # type: ignore
+        if other.currency is not self.currency:
+            raise ValueError('currency mismatch')
+        return Money(self.amount + other.amount, self.currency)
+
+    def __str__(self) -> str:
+        return f'{self.amount:.2f} {self.currency.value}'
+
+
+class Sku(NamedTuple):
+    vendor: str
+    number: int
+
+    def __str__(self) -> str:
+        return f'{self.vendor}-{self.number:06d}'
+
+
+def parse_sku(s: str) -> Sku:
+    vendor, _, number = s.partition('-')
+    return Sku(vendor, int(number))
+
+
+class Item(typing.NamedTuple):
+    sku: Sku
+    name: str
+    price: Money
+    tags: FrozenSet[str] = frozenset()
+    discontinued: Optional[datetime.date] = None
+
+    def is_available(self, today: datetime.date) -> bool:
+        return self.discontinued is None or self.discontinued > today
+
+    def with_price(self, price: Money) -> 'Item':
+        return self._replace(price=price)
+
+
+class StockLevel(NamedTuple):
+    sku: Sku
+    warehouse: str
+    quantity: int
+
+
+class Warehouse:
+    kind: ClassVar[str] = 'warehouse'
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._stock: typing.Dict[Sku, int] = {}
+
+    def receive(self, sku: Sku, quantity: int) -> StockLevel:
+        self._stock[sku] = self._stock.get(sku, 0) + quantity
+        return StockLevel(sku, self.name, self._stock[sku])
+
+    def ship(self, sku: Sku, quantity: int) -> StockLevel:
+        have = self._stock.get(sku, 0)
+        if have < quantity:
+            raise ValueError(f'only {have} of {sku} in {self.name}')
+        self._stock[sku] = have - quantity
+        return StockLevel(sku, self.name, self._stock[sku])
+
+    def levels(self) -> typing.Iterator[StockLevel]:
+        for sku, quantity in sorted(self._stock.items()):
+            yield StockLevel(sku, self.name, quantity)
+
+
+def make_catalog() -> typing.Callable[[str], Optional[Item]]:
+    class Entry(NamedTuple):
+        item: Item
+        added: datetime.date = datetime.date.today()
+
+    entries: typing.Dict[str, Entry] = {}
+
+    def lookup(key: str) -> Optional[Item]:
+        entry = entries.get(key)
+        return entry.item if entry is not None else None
+
+    return lookup
+
+
+def total(items: typing.Iterable[Item]) -> Money:
+    ret = Money(decimal.Decimal(0))
+    for item in items:
+        ret = ret + item.price
+    return ret
@@ -0,0 +1,47 @@
+"""command line text statistics, without any type annotations"""
+import argparse
+import collections
+import re
+import sys
+
+WORD_RE = re.compile(r"[\w']+")
+
+
+def words(f):
+    for line in f:
+        for match in WORD_RE.finditer(line):
+            yield match.group().lower()
+
+
+def stats(f, top=10):
+    counts = collections.Counter(words(f))
+    total = sum(counts.values())
+    return {
+        'total': total,
+        'unique': len(counts),
+        'top': counts.most_common(top),
+    }
+
+
+def format_stats(st):
+    lines = [f'{st["total"]} words, {st["unique"]} unique']
+    width = max((len(w) for w, _ in st['top']), default=0)
+    for word, n in st['top']:
+        lines.append(f'  {word:<{width}}  {n}')
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('files', nargs='*', type=argparse.FileType())
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args(argv)
+    for f in args.files or [sys.stdin]:
+        with f:
+            print(f'{f.name}:')
+            print(format_stats(stats(f, args.top)))
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
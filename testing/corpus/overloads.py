@@ -0,0 +1,54 @@
+"""parsing helpers with overloads, written to support python 3.5"""
+import re
+import sys
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Match
+from typing import Optional
+from typing import overload
+from typing import Pattern
+from typing import Type
+from typing import TypeVar
+from typing import Union
+
+if sys.version_info < (3, 5, 2):  # pragma: no cover
+    def overload(f: Any) -> Any:
+        return f
+
+T = TypeVar('T')
+Regex = Union[Pattern, str]
+_INT_RE = re.compile(r'-?\d+')
+
+
+def _compile(regex: 'Union[Pattern, str]') -> Pattern:
+    if isinstance(regex, str):
+        return re.compile(regex)
+    return regex
+
+
+def first_match(regex: Union[Pattern, str], s: str) -> Optional[Match]:
+    return _compile(regex).search(s)
+
+
+def groups(m: Union[Match, None]) -> List[str]:
+    return list(m.groups()) if m is not None else []
+
+
+@overload
+def parse(s: str) -> str: ...
+@overload  # noqa: E302
+def parse(s: str, tp: Type[T]) -> T: ...
+def parse(s: str, tp: Callable[[str], Any] = str) -> Any:  # noqa: E302
+    return tp(s)
+
+
+@overload
+def ints(s: str) -> List[int]: ...
+@overload  # noqa: E302
+def ints(s: str, default: int) -> List[int]: ...
+def ints(s: str, default: Optional[int] = None) -> List[int]:  # noqa: E302
+    found = [int(m.group()) for m in _INT_RE.finditer(s)]
+    if not found and default is not None:
+        return [default]
+    return found
@@ -0,0 +1,210 @@
+import importlib.machinery
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+
+import flake8_typing_imports
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BUILD_GENERATED = os.path.join(os.path.dirname(HERE), 'bin', 'build-generated')
+
+
+def _import_build_generated():
+    loader = importlib.machinery.SourceFileLoader(
+        'build_generated', BUILD_GENERATED,
+    )
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+build_generated = _import_build_generated()
+
+
+@pytest.fixture
+def blob(tmpdir):
+    subprocess.check_call(('git', 'init', '-q', str(tmpdir)))
+    tmpdir.join('typing.py').write('class Generic: pass\n')
+    cmd = ('git', '-C', str(tmpdir), 'hash-object', '-w', 'typing.py')
+    return subprocess.check_output(cmd).decode().strip()
+
+
+def _names_cached(tmpdir, blob):
+    version = sys.version_info[:3]
+    cache_dir = str(tmpdir.join('cache'))
+    return build_generated.get_names_cached(
+        str(tmpdir), cache_dir, version, blob, static=False,
+    )
+
+
+def test_get_names_cached(tmpdir, blob):
+    with mock.patch.object(
+            build_generated, 'get_defined_names', return_value={'Generic'},
+    ) as get_defined_names:
+        assert _names_cached(tmpdir, blob) == {'Generic'}
+        assert _names_cached(tmpdir, blob) == {'Generic'}
+    get_defined_names.assert_called_once()
+    entry, = tmpdir.join('cache').listdir()
+    assert build_generated._cache_version() in entry.basename
+
+
+def test_get_names_cached_other_extractor(tmpdir, blob):
+    with mock.patch.object(
+            build_generated, 'get_defined_names', return_value={'Generic'},
+    ):
+        _names_cached(tmpdir, blob)
+    # the names cached by another version of this script are not reused
+    with mock.patch.object(
+            build_generated, '_cache_version', return_value='other',
+    ):
+        with mock.patch.object(
+                build_generated, 'get_defined_names', return_value={'Any'},
+        ):
+            assert _names_cached(tmpdir, blob) == {'Any'}
+    assert len(tmpdir.join('cache').listdir()) == 2
+
+
+def test_get_names_cached_undecodable_entry(tmpdir, blob):
+    with mock.patch.object(
+            build_generated, 'get_defined_names', return_value={'Generic'},
+    ):
+        _names_cached(tmpdir, blob)
+        entry, = tmpdir.join('cache').listdir()
+        entry.write('["Gen')
+        assert _names_cached(tmpdir, blob) == {'Generic'}
+    assert entry.read() == '["Generic"]'
+
+
+def _static(src, version=(3, 8, 2)):
+    return build_generated.get_defined_names_static(version, src.encode())
+
+
+def test_static_all():
+    src = (
+        'import collections\n'
+        'from collections.abc import Hashable, Sized\n'
+        '__all__ = ["Any", "Sized", 3]\n'
+        '__all__ += ["Text"]\n'
+        '__all__.append("Hashable")\n'
+        '__all__.extend(("NamedTuple", f"{x}"))\n'
+        'class Any: pass\n'
+        'Text = str\n'
+        'def NamedTuple(): pass\n'
+    )
+    assert _static(src) == {'Any', 'Hashable', 'NamedTuple', 'Sized', 'Text'}
+
+
+def test_static_not_in_all():
+    src = (
+        'from abc import abstractmethod\n'
+        '__all__ = []\n'
+        'class Generic: pass\n'
+        'class _Private: pass\n'
+        'class GenericMeta(type): pass\n'
+        'T_co = TypeVar("T_co")\n'
+        'KT = TypeVar("KT")\n'
+        'Tuple = _alias(tuple)\n'
+        'List = _GenericAlias[list]\n'
+        'Pattern = type(stdlib_re.compile(""))\n'
+        'ByteString = bytes\n'
+    )
+    assert _static(src) == {'Generic', 'List', 'Tuple'}
+
+
+def test_static_conditional_definitions():
+    src = (
+        'import sys\n'
+        '__all__ = []\n'
+        'if sys.version_info >= (3, 6):\n'
+        '    class Deque: pass\n'
+        'else:\n'
+        '    Deque = None\n'
+        '    __all__.append("ContextManager")\n'
+        '    ContextManager = object\n'
+        'try:\n'
+        '    class Coroutine: pass\n'
+        'except ImportError:\n'
+        '    def Awaitable(): pass\n'
+        'else:\n'
+        '    Text = _alias(str)\n'
+        'finally:\n'
+        '    Type = _alias(type)\n'
+        'with ctx:\n'
+        '    NoReturn = _Special()\n'
+    )
+    assert _static(src) == {
+        'Awaitable', 'ContextManager', 'Coroutine', 'Deque', 'NoReturn',
+        'Text', 'Type',
+    }
+
+
+def test_static_io_and_re():
+    src = (
+        '__all__ = ["io", "re", "IO"]\n'
+        'class IO: pass\n'
+        'class io:\n'
+        '    __all__ = ["IO", "TextIO"]\n'
+        'class re:\n'
+        '    __all__ = ["Match", "Pattern"]\n'
+    )
+    assert _static(src) == {'IO', 'Match', 'Pattern', 'TextIO'}
+
+
+def test_static_del():
+    src = (
+        '__all__ = ["Gone"]\n'
+        'import sys as _sys\n'
+        'class Gone: pass\n'
+        'class Helper: pass\n'
+        'class Back: pass\n'
+        'del Gone, Helper, Back, _sys, __all__[0]\n'
+        'class Back: pass\n'
+    )
+    assert _static(src) == {'Back'}
+
+
+def test_static_final_before_3_5_3():
+    src = '__all__ = []\nclass Final: pass\n'
+    assert _static(src, (3, 5, 2)) == set()
+    assert _static(src, (3, 5, 3)) == {'Final'}
+
+
+def test_static_same_as_exec():
+    # the typing.py of the running python, with the program executing it
+    version = sys.version_info[:3]
+    with open(importlib.util.find_spec('typing').origin, 'rb') as f:
+        src = f.read()
+    proc = subprocess.run(
+        (sys.executable, '-c', build_generated.PROG),
+        input=src, stdout=subprocess.PIPE, check=True,
+    )
+    expected = build_generated._fixup(version, set(json.loads(proc.stdout)))
+    assert build_generated.get_defined_names_static(version, src) == expected
+
+
+@pytest.mark.skipif(
+    'CPYTHON_REPO' not in os.environ,
+    reason='needs a clone of cpython with its tags in CPYTHON_REPO',
+)
+def test_static_reproduces_the_table():  # pragma: no cover (needs cpython)
+    repo = os.environ['CPYTHON_REPO']
+    versions = flake8_typing_imports.VERSION_TUPLES
+    tags = ['v{}.{}.{}'.format(*version) for version in versions]
+    blobs = build_generated.get_blobs(repo, tags)
+    names = [
+        (
+            version,
+            build_generated.get_names_cached(repo, None, version, blob, True),
+        )
+        for version, blob in zip(versions, blobs)
+    ]
+    with open(flake8_typing_imports.__file__) as f:
+        _, table, _ = build_generated.split_generated(f.read())
+    # byte for byte, as `bin/build-generated --static` would write it
+    assert build_generated.generate(names) == table
@@ -0,0 +1,196 @@
+"""golden results and a cost budget for the modules in testing/corpus
+
+after an intended change in results or cost, regenerate the expectations
+with `python -m tests.corpus_test` and review the diff.  peak memory is
+recorded per python version: regenerate with each interpreter under test.
+"""
+import ast
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from unittest import mock
+
+import pytest
+
+import flake8_typing_imports
+from flake8_typing_imports import Plugin
+from flake8_typing_imports import Version
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORPUS = os.path.join(os.path.dirname(HERE), 'testing', 'corpus')
+GOLDEN = os.path.join(CORPUS, 'golden.json')
+BUDGET = os.path.join(CORPUS, 'budget.json')
+FILES = sorted(f for f in os.listdir(CORPUS) if f.endswith('.py'))
+MIN_VERSIONS = (Version(3, 5, 0), Version(3, 6, 0), Version(3, 7, 0))
+
+# allowed growth over the recorded budget
+VISITS_TOLERANCE = 1.05
+PEAK_TOLERANCE = 1.5
+
+# allocation sizes differ between interpreters, the peaks are recorded per
+# python version
+PY_VERSION = '{}.{}'.format(*sys.version_info)
+
+# `ast.Index` / `ast.ExtSlice` wrap subscripts before python 3.9, they are
+# not counted so the visits are the same on every version
+if sys.version_info < (3, 9):  # pragma: no cover (<PY39)
+    _SLICE_WRAPPERS: Tuple[type, ...] = (ast.Index, ast.ExtSlice)
+else:  # pragma: no cover (PY39+)
+    _SLICE_WRAPPERS = ()
+
+
+class _Visitor(flake8_typing_imports._CountingVisitor):
+    __slots__ = ()
+
+    def _visit(self, node: ast.AST) -> None:
+        if isinstance(node, _SLICE_WRAPPERS):  # pragma: no cover (<PY39)
+            self.nodes -= 1
+        super()._visit(node)
+
+
+def _read(filename: str) -> str:
+    with open(os.path.join(CORPUS, filename), encoding='UTF-8') as f:
+        return f.read()
+
+
+def _results(filename: str, min_version: Version) -> List[str]:
+    src = _read(filename)
+    plugin = Plugin(ast.parse(src), src.splitlines(True))
+    with mock.patch.object(Plugin, '_min_python_version', min_version):
+        return [f'{line}:{col}: {msg}' for line, col, msg, _ in plugin.run()]
+
+
+def _visits(filename: str) -> int:
+    visitor = _Visitor(MIN_VERSIONS[0])
+    visitor.visit(ast.parse(_read(filename)))
+    return visitor.nodes
+
+
+def _peak_bytes(filename: str) -> int:  # pragma: no cover (subprocess)
+    src = _read(filename)
+    tree, lines = ast.parse(src), src.splitlines(True)
+    # warm the symbol table and the per-version caches first
+    for _ in Plugin(tree, lines).run():
+        pass
+    tracemalloc.start()
+    try:
+        for _ in Plugin(tree, lines).run():
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _peaks() -> Dict[str, int]:
+    # measured in a fresh interpreter: a tracer (coverage, a debugger)
+    # allocates as it goes and would be counted too
+    code = (
+        'import json\n'
+        'from tests.corpus_test import FILES, _peak_bytes\n'
+        'print(json.dumps({f: _peak_bytes(f) for f in FILES}))\n'
+    )
+    out = subprocess.check_output(
+        (sys.executable, '-c', code), cwd=os.path.dirname(HERE),
+    )
+    return json.loads(out)
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope='module')
+def golden():
+    return _load(GOLDEN)
+
+
+@pytest.fixture(scope='module')
+def budget():
+    return _load(BUDGET)
+
+
+def test_expectations_cover_corpus(golden, budget):
+    assert sorted(golden) == FILES
+    assert sorted(budget) == FILES
+
+
+@pytest.mark.parametrize('min_version', MIN_VERSIONS, ids=str)
+@pytest.mark.parametrize('filename', FILES)
+def test_golden(golden, filename, min_version):
+    expected = golden[filename][str(min_version)]
+    assert _results(filename, min_version) == expected
+
+
+@pytest.mark.parametrize('filename', FILES)
+def test_visits_budget(budget, filename):
+    visits = _visits(filename)
+    assert visits <= budget[filename]['visits'] * VISITS_TOLERANCE
+
+
+@pytest.fixture(scope='module')
+def peaks():
+    return _peaks()
+
+
+def _version_key(version: str) -> Tuple[int, ...]:
+    return tuple(int(part) for part in version.split('.'))
+
+
+def _peak_budget(recorded: Dict[str, int], version: str = PY_VERSION) -> int:
+    """the budget recorded for `version`, else the nearest older one"""
+    current = _version_key(version)
+    versions = sorted(recorded, key=_version_key)
+    older = [v for v in versions if _version_key(v) <= current]
+    return recorded[older[-1] if older else versions[0]]
+
+
+def test_peak_budget_fallback():
+    recorded = {'3.6': 1, '3.8': 2, '3.10': 3}
+    assert _peak_budget(recorded, '3.8') == 2
+    assert _peak_budget(recorded, '3.9') == 2
+    assert _peak_budget(recorded, '3.12') == 3
+    # older than anything recorded
+    assert _peak_budget(recorded, '3.5') == 1
+
+
+@pytest.mark.parametrize('filename', FILES)
+def test_peak_bytes_budget(budget, peaks, filename):
+    limit = _peak_budget(budget[filename]['peak_bytes'])
+    assert peaks[filename] <= limit * PEAK_TOLERANCE
+
+
+def main() -> int:  # pragma: no cover (regenerates the expectations)
+    golden = {
+        filename: {str(v): _results(filename, v) for v in MIN_VERSIONS}
+        for filename in FILES
+    }
+    peaks = _peaks()
+    # only this python's peaks are replaced, run it with each interpreter
+    try:
+        recorded = _load(BUDGET)
+    except FileNotFoundError:
+        recorded = {}
+    budget = {}
+    for filename in FILES:
+        peak_bytes = recorded.get(filename, {}).get('peak_bytes', {})
+        peak_bytes[PY_VERSION] = peaks[filename]
+        budget[filename] = {
+            'visits': _visits(filename), 'peak_bytes': peak_bytes,
+        }
+    for path, data in ((GOLDEN, golden), (BUDGET, budget)):
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -1,11 +1,28 @@
+import argparse
 import ast
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import subprocess
+import sys
+import threading
+import time
+import tokenize
+from typing import List
 from unittest import mock
 
 import pytest
 from flake8.options.manager import OptionManager
 
+import flake8_typing_imports
+from flake8_typing_imports import check_many
+from flake8_typing_imports import main
 from flake8_typing_imports import Plugin
 from flake8_typing_imports import Version
+from flake8_typing_imports import Visitor
 
 
 def version_ctx(v):
@@ -15,20 +32,35 @@ def version_ctx(v):
 @pytest.fixture(autouse=True)
 def reset_version(tmpdir):
     with version_ctx(Plugin._min_python_version), tmpdir.as_cwd():
-        yield
+        with mock.patch.multiple(
+                Plugin,
+                _cache_dir=Plugin._cache_dir,
+                _profile=Plugin._profile,
+                _version_ranges=Plugin._version_ranges,
+                _floors=Plugin._floors,
+        ):
+            with mock.patch.dict(flake8_typing_imports._project_cache):
+                with mock.patch.dict(
+                        flake8_typing_imports._project_dir_cache,
+                ):
+                    yield
 
 
-def test_option_parsing():
+def parse_options(*args):
     mgr = OptionManager('flake8', '0')
     Plugin.add_options(mgr)
-    options, _ = mgr.parse_args(['--min-python-version', '3.6.2'])
+    options, _ = mgr.parse_args(list(args))
     Plugin.parse_options(options)
+
+
+def test_option_parsing():
+    parse_options('--min-python-version', '3.6.2')
     assert Plugin._min_python_version == Version(3, 6, 2)
 
 
 def test_option_parsing_python_requires_setup_cfg(tmpdir):
     tmpdir.join('setup.cfg').write('[options]\npython_requires = >=3.6')
-    Plugin.parse_options(mock.Mock(min_python_version='3.5.0'))
+    parse_options('--min-python-version', '3.5.0')
     assert Plugin._min_python_version == Version(3, 6, 0)
 
 
@@ -37,18 +69,230 @@ def test_option_parsing_python_requires_more_complicated(tmpdir):
         '[options]\n'
         'python_requires = >=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*',
     )
-    Plugin.parse_options(mock.Mock(min_python_version='3.6.0'))
+    parse_options('--min-python-version', '3.6.0')
     assert Plugin._min_python_version == Version(3, 5, 0)
 
 
+@pytest.mark.parametrize(
+    ('requires', 'expected'),
+    (
+        ('>=3.6', Version(3, 6, 0)),
+        ('>= 3.5.2, <4', Version(3, 5, 2)),
+        ('>3.6', Version(3, 6, 1)),
+        ('~=3.6.1', Version(3, 6, 1)),
+        ('~=3.7', Version(3, 7, 0)),
+        ('>=3, !=3.5.*', Version(3, 6, 0)),
+        ('==3.7.*', Version(3, 7, 0)),
+        ('===3.6.2', Version(3, 6, 2)),
+        ('<=3.6', Version(3, 5, 0)),
+        ('<3.6, !=3.5.0', Version(3, 5, 1)),
+        ('>=3.6, ; garbage', Version(3, 6, 0)),
+    ),
+)
+def test_option_parsing_python_requires_specifiers(tmpdir, requires, expected):
+    tmpdir.join('setup.cfg').write(f'[options]\npython_requires = {requires}')
+    parse_options('--min-python-version', '3.5.0')
+    assert Plugin._min_python_version == expected
+
+
+@pytest.mark.parametrize(
+    ('filename', 'contents'),
+    (
+        ('pyproject.toml', '[project]\nrequires-python = ">=3.10"\n'),
+        ('setup.cfg', '[options]\npython_requires = >=3.10\n'),
+        (
+            'setup.py',
+            'from setuptools import setup\n'
+            'setup(name="x", python_requires=">=3.10")\n',
+        ),
+    ),
+)
+def test_option_parsing_python_requires_too_new(tmpdir, filename, contents):
+    tmpdir.join(filename).write(contents)
+    parse_options()
+    # newer than the table: nothing it knows about is missing
+    newest = Version(*flake8_typing_imports.VERSION_TUPLES[-1])
+    assert Plugin._min_python_version == newest
+    src = 'from typing import NoReturn, Type\n'
+    assert not list(Plugin(ast.parse(src), src.splitlines(True)).run())
+
+
+def test_min_version_per_project_too_new(tmpdir):
+    tmpdir.join('setup.cfg').write('[options]\npython_requires = >=3.5.1')
+    tmpdir.join('a', 'setup.cfg').write(
+        '[options]\npython_requires = >=3.10\n', ensure=True,
+    )
+    parse_options()
+    src = 'from typing import NoReturn\n'
+    assert not list(Plugin(ast.parse(src), [src], 'a/t.py').run())
+
+
+def test_option_parsing_python_requires_unsatisfiable(tmpdir):
+    tmpdir.join('setup.cfg').write(
+        '[options]\npython_requires = >3.6.1, <3.6.2\n',
+    )
+    parse_options()
+    assert Plugin._min_python_version == Version(3, 6, 1)
+
+
+def test_option_parsing_min_python_version_too_new():
+    with pytest.raises(ValueError) as excinfo:
+        parse_options('--min-python-version', '3.10')
+    msg, = excinfo.value.args
+    assert msg == 'min-python-version (3.10.0): unknown version'
+
+
+def test_option_parsing_setup_cfg_without_python_requires(tmpdir):
+    tmpdir.join('setup.cfg').write('[flake8]\nmax-line-length = 100\n')
+    parse_options('--min-python-version', '3.6.2')
+    assert Plugin._min_python_version == Version(3, 6, 2)
+
+
+def test_option_parsing_python_requires_pyproject(tmpdir):
+    tmpdir.join('pyproject.toml').write(
+        '[project]\nname = "x"\nrequires-python = ">=3.7"\n',
+    )
+    tmpdir.join('setup.cfg').write('[options]\npython_requires = >=3.6')
+    parse_options()
+    assert Plugin._min_python_version == Version(3, 7, 0)
+
+
+def test_option_parsing_pyproject_without_requires_python(tmpdir):
+    tmpdir.join('pyproject.toml').write('[tool.black]\nline-length = 79\n')
+    tmpdir.join('setup.cfg').write('[options]\npython_requires = >=3.6')
+    parse_options()
+    assert Plugin._min_python_version == Version(3, 6, 0)
+
+
+@pytest.mark.parametrize(
+    ('src', 'expected'),
+    (
+        (
+            'from setuptools import setup\n'
+            'setup(name="x", python_requires=">=3.6.1")\n',
+            Version(3, 6, 1),
+        ),
+        (
+            'import setuptools\n'
+            'setuptools.setup(name="x", python_requires=">=3.7")\n',
+            Version(3, 7, 0),
+        ),
+        (
+            'from setuptools import setup\n'
+            'setup(name="x", python_requires=REQUIRES)\n',
+            Version(3, 6, 2),
+        ),
+        (
+            'from setuptools import setup\n'
+            'setup(name="x", python_requires=3.7)\n',
+            Version(3, 6, 2),
+        ),
+        ('from setuptools import setup\nsetup(name="x")\n', Version(3, 6, 2)),
+    ),
+)
+def test_option_parsing_python_requires_setup_py(tmpdir, src, expected):
+    tmpdir.join('setup.py').write(src)
+    parse_options('--min-python-version', '3.6.2')
+    assert Plugin._min_python_version == expected
+
+
+def test_min_version_per_project(tmpdir):
+    tmpdir.join('setup.cfg').write('[options]\npython_requires = >=3.5.1')
+    tmpdir.join('a', 'setup.cfg').write(
+        '[options]\npython_requires = >=3.5.2\n', ensure=True,
+    )
+    # declares no python requirement: the configured version applies
+    tmpdir.join('b', 'setup.cfg').write('[metadata]\nname = b\n', ensure=True)
+    parse_options()
+
+    src = 'from typing import ContextManager\n'
+
+    def _versions(filename):
+        plugin = Plugin(ast.parse(src), src.splitlines(True), filename)
+        (_, _, msg, _), = plugin.run()
+        return msg.split('(not in ')[1]
+
+    assert _versions(str(tmpdir.join('t.py'))) == '3.5.1, 3.5.2, 3.5.3)'
+    assert _versions(os.path.join('a', 't.py')) == '3.5.2, 3.5.3)'
+    assert _versions(os.path.join('b', 'c', 't.py')) == '3.5.1, 3.5.2, 3.5.3)'
+
+    # the project files are re-read when they change
+    cfg = tmpdir.join('a', 'setup.cfg')
+    cfg.write('[options]\npython_requires = >=3.5.3\n')
+    cfg.setmtime(cfg.mtime() + 10)
+    assert _versions(os.path.join('a', 't.py')) == '3.5.3)'
+
+
+@pytest.mark.parametrize(
+    ('filename', 'contents'),
+    (
+        ('setup.py', b'print "x"\n'),
+        ('setup.py', b'x = 1\0\n'),
+        ('setup.cfg', b'[options\npython_requires = >=3.6\n'),
+        ('setup.cfg', b'[options]\npython_requires = >=3.6 \xff\n'),
+        ('pyproject.toml', b'[project\n'),
+    ),
+)
+def test_min_version_broken_project_file(tmpdir, filename, contents):
+    tmpdir.join(filename).write_binary(contents)
+    src = 'from typing import Type\n'
+    with version_ctx(Version(3, 5, 1)):
+        plugin = Plugin(ast.parse(src), [src], str(tmpdir.join('t.py')))
+        (_, _, msg, _), = plugin.run()
+    assert msg.endswith('(not in 3.5.1)')
+
+
+def test_min_version_stops_at_checkout_root(tmpdir):
+    tmpdir.join('setup.cfg').write('[options]\npython_requires = >=3.6')
+    tmpdir.join('repo', '.git').ensure(dir=True)
+    src = 'from typing import Type\n'
+    filename = str(tmpdir.join('repo', 'pkg', 't.py'))
+    with version_ctx(Version(3, 5, 1)):
+        (_, _, msg, _), = Plugin(ast.parse(src), [src], filename).run()
+    assert msg.endswith('(not in 3.5.1)')
+
+
+def test_min_version_project_files_created_later(tmpdir):
+    tmpdir.join('repo', '.git').ensure(dir=True)
+    pkg = tmpdir.join('repo', 'pkg').ensure(dir=True)
+    src = 'from typing import Type\n'
+    filename = str(pkg.join('t.py'))
+
+    def _run():
+        (_, _, msg, _), = Plugin(ast.parse(src), [src], filename).run()
+        return msg
+
+    with version_ctx(Version(3, 5, 0)):
+        assert _run().endswith('(not in 3.5.0, 3.5.1)')
+        # as a long running daemon sees them, without restarting
+        tmpdir.join('repo', 'setup.cfg').write(
+            '[options]\npython_requires = >=3.5.1\n',
+        )
+        tmpdir.join('repo').setmtime(tmpdir.join('repo').mtime() + 10)
+        assert _run().endswith('(not in 3.5.1)')
+        pkg.join('pyproject.toml').write('[project]\nname = "pkg"\n')
+        pkg.setmtime(pkg.mtime() + 10)
+        assert _run().endswith('(not in 3.5.0, 3.5.1)')
+
+
+def test_min_version_no_project(tmpdir):
+    src = 'from typing import Type\n'
+    filename = str(tmpdir.join('t.py'))
+    with mock.patch.object(flake8_typing_imports, 'PROJECT_FILES', ()):
+        with version_ctx(Version(3, 5, 1)):
+            assert list(Plugin(ast.parse(src), [src], filename).run())
+        with version_ctx(Version(3, 5, 2)):
+            assert not list(Plugin(ast.parse(src), [src], filename).run())
+
+
 def test_option_parsing_minimum_version():
-    Plugin.parse_options(mock.Mock(min_python_version='3.4'))
+    parse_options('--min-python-version', '3.4')
     assert Plugin._min_python_version == Version(3, 5, 0)
 
 
 def test_option_parsing_error_unknown():
     with pytest.raises(ValueError) as excinfo:
-        Plugin.parse_options(mock.Mock(min_python_version='9.9'))
+        parse_options('--min-python-version', '9.9')
     msg, = excinfo.value.args
     assert msg == 'min-python-version (9.9.0): unknown version'
 
@@ -57,6 +301,20 @@ def results(s):
     return {'{}:{}: {}'.format(*r) for r in Plugin(ast.parse(s)).run()}
 
 
+def test_prefilter_skips_files_without_typing():
+    src = 'import os\nfrom os import path\n'
+    with mock.patch.object(Visitor, 'visit') as visit_mock:
+        assert not list(Plugin(ast.parse(src), src.splitlines(True)).run())
+    visit_mock.assert_not_called()
+
+
+def test_prefilter_passes_files_with_typing():
+    src = 'from typing import Type\n'
+    with version_ctx(Version(3, 5, 0)):
+        ret = list(Plugin(ast.parse(src), src.splitlines(True)).run())
+    assert [msg.split()[0] for _, _, msg, _ in ret] == ['TYP001']
+
+
 def test_missing_guard():
     with version_ctx(Version(3, 5, 0)):
         assert results('from typing import Type') == {
@@ -188,6 +446,11 @@ def test_union_pattern_or_match(s):
             'def foo(bar: Union[Pattern]): pass\n',
             id='single Pattern',
         ),
+        pytest.param(
+            'from typing import Pattern, Union\n'
+            'def foo(bar: Union[Pattern:str]): pass\n',
+            id='a slice',
+        ),
         pytest.param(
             'from typing import Pattern, Union\n'
             'def foo(bar: "Union[Pattern, str]"): pass\n',
@@ -235,6 +498,19 @@ def test_namedtuple_defaults():
         assert results(s) == set()
 
 
+def test_namedtuple_nested_in_function():
+    s = (
+        'import typing\n'
+        'def f():\n'
+        '    class NT(typing.NamedTuple):\n'
+        '        x: int = 5\n'
+    )
+    with version_ctx(Version(3, 6, 0)):
+        assert results(s) == {
+            '4:8: TYP005 NamedTuple does not support defaults in 3.6.0',
+        }
+
+
 def test_namedtuple_check_noop():
     s = (
         'class C:\n'
@@ -244,6 +520,53 @@ def test_namedtuple_check_noop():
     assert not results(s)
 
 
+@pytest.mark.parametrize(
+    ('version', 'node_types'),
+    (
+        (
+            Version(3, 5, 0),
+            {ast.Subscript, ast.ClassDef, ast.FunctionDef, ast.AnnAssign,
+             ast.Attribute},
+        ),
+        (
+            Version(3, 6, 0),
+            {ast.ClassDef, ast.FunctionDef, ast.AnnAssign, ast.Attribute},
+        ),
+        (Version(3, 6, 1), {ast.Attribute}),
+    ),
+)
+def test_visitor_only_handles_active_rules(version, node_types):
+    s = (
+        'import sys, typing\n'
+        'from typing import NamedTuple, Pattern, Union, overload\n'
+        'if sys.version_info < (3, 5, 2):\n'
+        '    def overload(f): return f\n'
+        'class NT(NamedTuple):\n'
+        '    x: typing.Type = 5\n'
+        '    def f(self) -> Union[Pattern, str]: ...\n'
+    )
+    visitor = Visitor(version)
+    assert set(visitor._dispatch) == node_types
+    visitor.visit(ast.parse(s))
+
+    everything = Visitor()
+    everything.visit(ast.parse(s))
+    assert visitor.imports == everything.imports
+    assert visitor.attributes == everything.attributes
+    if version < Version(3, 6, 1):
+        assert visitor.namedtuple_methods == everything.namedtuple_methods
+        assert visitor.namedtuple_defaults == everything.namedtuple_defaults
+    else:
+        assert not visitor.namedtuple_methods
+        assert not visitor.namedtuple_defaults
+    if version < Version(3, 5, 2):
+        assert visitor.defined_overload
+        assert visitor.unions_pattern_or_match
+    else:
+        assert not visitor.defined_overload
+        assert not visitor.unions_pattern_or_match
+
+
 def test_attribute():
     s = (
         'import typing\n\n'
@@ -255,3 +578,1496 @@ def test_attribute():
             '3:11: TYP006 guard `typing` attribute by quoting: Type '
             '(not in 3.5.0, 3.5.1)',
         }
+
+
+def test_unknown_name_missing_from_all_versions():
+    with version_ctx(Version(3, 8, 1)):
+        assert results('from typing import DEFINITELY_WRONG') == {
+            '1:0: TYP001 guard import by `if TYPE_CHECKING:`: '
+            'DEFINITELY_WRONG (not in 3.8.1, 3.8.2)',
+        }
+
+
+def test_version_ranges():
+    parse_options('--typing-imports-version-ranges')
+    assert results('from typing import AsyncContextManager, Type, X') == {
+        '1:0: TYP001 guard import by `if False:  # TYPE_CHECKING`: '
+        'AsyncContextManager (not in 3.5.0-3.5.3, 3.6.0-3.6.1)',
+        '1:0: TYP001 guard import by `if False:  # TYPE_CHECKING`: '
+        'Type (not in 3.5.0-3.5.1)',
+        '1:0: TYP001 guard import by `if False:  # TYPE_CHECKING`: '
+        'X (not in 3.5.0-3.8.2)',
+    }
+    with version_ctx(Version(3, 5, 1)):
+        assert results('import typing\nx: typing.Type') == {
+            '2:3: TYP006 guard `typing` attribute by quoting: Type '
+            '(not in 3.5.1)',
+        }
+
+
+def test_option_parsing_floors(tmpdir):
+    tmpdir.join('setup.cfg').write('[options]\npython_requires = >=3.8')
+    parse_options('--typing-imports-floors', '3.7, 3.6.0,3.6,')
+    assert Plugin._floors == (Version(3, 6, 0), Version(3, 7, 0))
+    assert Plugin._min_python_version == Version(3, 6, 0)
+    parse_options()
+    assert Plugin._floors == ()
+    assert Plugin._min_python_version == Version(3, 8, 0)
+
+
+def test_option_parsing_floors_unknown_version():
+    with pytest.raises(ValueError):
+        parse_options('--typing-imports-floors', '3.6,9.9')
+
+
+FLOORS_SRC = (
+    'from typing import Deque, NoReturn, NamedTuple, Type, overload\n'
+    'import typing\n'
+    'x: typing.ContextManager\n'
+    'y: typing.Union[typing.Pattern, int]\n'
+    'class C(NamedTuple):\n'
+    '    x: int = 1\n'
+    '    def f(self): ...\n'
+)
+
+
+def test_floors():
+    parse_options('--typing-imports-floors', '3.5.0,3.6.0,3.7.0')
+    assert results(FLOORS_SRC) == {
+        '1:0: TYP001 guard import by `if False:  # TYPE_CHECKING`: '
+        'Deque (not in 3.5.0, 3.5.1, 3.5.2, 3.5.3, 3.6.0) '
+        '[floors: 3.5.0, 3.6.0]',
+        '1:0: TYP001 guard import by `if False:  # TYPE_CHECKING`: '
+        'NoReturn (not in 3.5.0, 3.5.1, 3.5.2, 3.5.3, 3.6.0, 3.6.1) '
+        '[floors: 3.5.0, 3.6.0]',
+        '1:0: TYP001 guard import by `if False:  # TYPE_CHECKING`: '
+        'Type (not in 3.5.0, 3.5.1) [floors: 3.5.0]',
+        '1:0: TYP002 @overload is broken in <3.5.2, add '
+        '`if sys.version_info < (3, 5, 2): def overload(f): return f` '
+        '[floors: 3.5.0]',
+        '3:3: TYP006 guard `typing` attribute by quoting: '
+        'ContextManager (not in 3.5.0, 3.5.1, 3.5.2, 3.5.3) [floors: 3.5.0]',
+        '4:3: TYP003 Union[Match, ...] or Union[Pattern, ...] must be '
+        'quoted in <3.5.2 [floors: 3.5.0]',
+        '6:4: TYP005 NamedTuple does not support defaults in 3.6.0 '
+        '[floors: 3.5.0, 3.6.0]',
+        '7:4: TYP004 NamedTuple does not support methods in 3.6.0 '
+        '[floors: 3.5.0, 3.6.0]',
+    }
+
+
+@pytest.mark.parametrize(
+    'src',
+    (
+        FLOORS_SRC,
+        'import typing\nx: typing.Text\ny: typing.OrderedDict\n',
+        'from typing import overload\n'
+        'if True:\n'
+        '    def overload(f): return f\n',
+    ),
+)
+def test_floors_same_as_each_min_version(src):
+    floors = (Version(3, 5, 0), Version(3, 6, 0), Version(3, 7, 0))
+    plugin = Plugin(ast.parse(src))
+    plugin._floors = floors
+    plugin._min_python_version = floors[0]
+    with mock.patch.object(
+            Visitor, 'visit', autospec=True, side_effect=Visitor.visit,
+    ) as visit_mock:
+        findings = list(plugin._file_findings())
+    assert visit_mock.call_count == 1
+    ret = {
+        (floor, line, col, msg.split()[0], symbol)
+        for line, col, msg, symbol, missing in findings
+        for floor in flake8_typing_imports._finding_floors(floors, missing)
+    }
+
+    expected = set()
+    for floor in floors:
+        with version_ctx(floor):
+            for line, col, msg, symbol, _ in Plugin(
+                    ast.parse(src),
+            )._file_findings():
+                expected.add((floor, line, col, msg.split()[0], symbol))
+    assert ret == expected
+
+
+def test_floors_ignore_project_min_version(tmpdir):
+    tmpdir.join('setup.cfg').write('[options]\npython_requires = >=3.7')
+    src = 'from typing import Type\n'
+    filename = str(tmpdir.join('t.py'))
+    plugin = Plugin(ast.parse(src), src.splitlines(True), filename)
+    assert not list(plugin.run())
+
+    parse_options('--typing-imports-floors', '3.5.0,3.7.0')
+    plugin = Plugin(ast.parse(src), src.splitlines(True), filename)
+    (_, _, msg, _), = plugin.run()
+    assert msg.endswith('(not in 3.5.0, 3.5.1) [floors: 3.5.0]')
+    checked_min_version = flake8_typing_imports._checked_min_version
+    assert checked_min_version(filename) == Version(3, 5, 0)
+
+
+def test_check_many_min_version_replaces_floors():
+    parse_options('--typing-imports-floors', '3.5.0,3.6.0')
+    src = 'from typing import Type\n'
+    (ret,), = check_many((src,))
+    assert ret[2].endswith('[floors: 3.5.0]')
+    (ret,), = check_many((src,), '3.5.1')
+    assert ret[2].endswith('(not in 3.5.1)')
+
+
+def test_messages_shared_between_files():
+    (_, _, msg1, _), = Plugin(ast.parse('from typing import Type')).run()
+    (_, _, msg2, _), = Plugin(ast.parse('from typing import Type')).run()
+    assert msg1 is msg2
+
+
+def test_version():
+    assert Plugin.version == Plugin(ast.parse('')).version
+    assert Version.parse(Plugin.version) > Version(1)
+
+
+def _import_profile(tmpdir):  # pragma: no cover (PY37+)
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=str(tmpdir))
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    cmd = (sys.executable, '-X', 'importtime', '-c', f'import {Plugin.name}')
+    # the first run populates the bytecode cache
+    subprocess.run(cmd, env=env, stderr=subprocess.DEVNULL, check=True)
+    proc = subprocess.run(
+        cmd, env=env, stderr=subprocess.PIPE, check=True,
+        universal_newlines=True,
+    )
+    # import time: self [us] | cumulative | imported package
+    ret: List[str] = []
+    for line in proc.stderr.splitlines()[1:]:
+        self_us, _, name = line[len('import time:'):].split('|')
+        if not name.startswith('  '):  # a top-level import: reset children
+            if name.strip() == Plugin.name:
+                return int(self_us), ret
+            ret = []
+        else:
+            ret.append(name.strip())
+    raise AssertionError(f'did not find {Plugin.name}:\n{proc.stderr}')
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7), reason='-X importtime is new in python 3.7',
+)
+def test_import_time_budget(tmpdir):  # pragma: no cover (PY37+)
+    # the best of a few runs, a busy machine only ever makes them slower
+    profiles = [_import_profile(tmpdir) for _ in range(3)]
+    self_us, children = min(profiles)
+    assert 'importlib.metadata' not in children
+    assert 'importlib_metadata' not in children
+    # only needed by the command line and the daemon
+    for mod in (
+            'argparse', 'multiprocessing', 'socket', 'socketserver',
+            'subprocess', 'tempfile',
+    ):
+        assert mod not in children
+    # a few ms on a developer machine, shared ci machines are much slower
+    assert self_us < 25000
+
+
+def test_cache_replays_results(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    parse_options('--typing-imports-cache-dir', str(cache_dir))
+    src = 'from typing import Type\n'
+    lines = src.splitlines(True)
+
+    ret = list(Plugin(ast.parse(src), lines).run())
+    assert [msg.split()[0] for _, _, msg, _ in ret] == ['TYP001']
+    assert len(cache_dir.listdir()) == 1
+
+    with mock.patch.object(Visitor, 'visit') as visit_mock:
+        assert list(Plugin(ast.parse(src), lines).run()) == ret
+    visit_mock.assert_not_called()
+
+
+def test_cache_keyed_by_min_version(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    parse_options('--typing-imports-cache-dir', str(cache_dir))
+    src = 'from typing import Type\n'
+    lines = src.splitlines(True)
+
+    assert list(Plugin(ast.parse(src), lines).run())
+    with version_ctx(Version(3, 5, 2)):
+        assert not list(Plugin(ast.parse(src), lines).run())
+
+
+def test_cache_keyed_by_version_ranges(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    parse_options('--typing-imports-cache-dir', str(cache_dir))
+    src = 'from typing import Type\n'
+    lines = src.splitlines(True)
+
+    (_, _, msg, _), = Plugin(ast.parse(src), lines).run()
+    assert msg.endswith('(not in 3.5.0, 3.5.1)')
+    with mock.patch.object(Plugin, '_version_ranges', True):
+        (_, _, msg, _), = Plugin(ast.parse(src), lines).run()
+    assert msg.endswith('(not in 3.5.0-3.5.1)')
+
+
+def test_cache_ignores_corrupt_entries(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    parse_options('--typing-imports-cache-dir', str(cache_dir))
+    src = 'import typing\n'
+    lines = src.splitlines(True)
+
+    assert not list(Plugin(ast.parse(src), lines).run())
+    entry, = cache_dir.visit(lambda p: p.isfile())
+    entry.write('{')
+    assert not list(Plugin(ast.parse(src), lines).run())
+    assert entry.read() == '[]'
+
+
+def test_cache_recomputes_old_format_entries(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    parse_options('--typing-imports-cache-dir', str(cache_dir))
+    src = 'from typing import Type\n'
+    lines = src.splitlines(True)
+
+    ret = list(Plugin(ast.parse(src), lines).run())
+    entry, = cache_dir.visit(lambda p: p.isfile())
+    entry.write(json.dumps([[1, 0, 'TYP001 stale']]))
+    assert list(Plugin(ast.parse(src), lines).run()) == ret
+    (*_, symbol, missing), = json.loads(entry.read())
+    assert (symbol, missing) == ('Type', 0b11)
+
+
+def test_cache_read_only_hit(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    parse_options('--typing-imports-cache-dir', str(cache_dir))
+    src = 'from typing import Type\n'
+    lines = src.splitlines(True)
+
+    list(Plugin(ast.parse(src), lines).run())
+    entry, = cache_dir.visit(lambda p: p.isfile())
+    entry.write(json.dumps([[1, 0, 'TYP001 cached', 'Type', 0b11]]))
+    with mock.patch.object(os, 'utime', side_effect=PermissionError):
+        (_, _, msg, _), = Plugin(ast.parse(src), lines).run()
+    assert msg == 'TYP001 cached'
+
+
+def test_cache_entries_follow_the_umask(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    src = 'import typing\n'
+    umask = os.umask(0o027)
+    try:
+        flake8_typing_imports._cache_file_mode.cache_clear()
+        parse_options('--typing-imports-cache-dir', str(cache_dir))
+        assert not list(Plugin(ast.parse(src), src.splitlines(True)).run())
+    finally:
+        os.umask(umask)
+        flake8_typing_imports._cache_file_mode.cache_clear()
+    entry, = cache_dir.visit(lambda p: p.isfile())
+    assert stat.S_IMODE(entry.stat().mode) == 0o640
+
+
+def test_cache_unwritable(tmpdir):
+    cache_dir = tmpdir.join('cache').ensure()  # a file, not a directory
+    parse_options('--typing-imports-cache-dir', str(cache_dir))
+    src = 'import typing\n'
+    assert not list(Plugin(ast.parse(src), src.splitlines(True)).run())
+
+
+def test_cache_write_failure_removes_temporary_file(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    parse_options('--typing-imports-cache-dir', str(cache_dir))
+    src = 'import typing\n'
+    with mock.patch.object(os, 'replace', side_effect=OSError):
+        assert not list(Plugin(ast.parse(src), src.splitlines(True)).run())
+    assert not list(cache_dir.visit(lambda p: p.isfile()))
+
+
+def test_cache_eviction(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    cache_dir.join('README').ensure()
+    for i, shard in enumerate(('aa', 'bb', 'cc')):
+        entry = cache_dir.join(shard, 'entry')
+        entry.write('x' * 10, ensure=True)
+        entry.setmtime(1000 + i)
+    # what it takes on disk, not its 10 bytes
+    size = os.stat(str(entry)).st_blocks * 512
+
+    parse_options(
+        '--typing-imports-cache-dir', str(cache_dir),
+        '--typing-imports-cache-size', str(2 * size),
+    )
+    assert not cache_dir.join('aa', 'entry').exists()
+    assert cache_dir.join('bb', 'entry').exists()
+    assert cache_dir.join('cc', 'entry').exists()
+
+
+def test_cache_eviction_interval(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    cache_dir.join('aa', 'entry').write('x' * 10, ensure=True)
+    marker = cache_dir.join(flake8_typing_imports.CACHE_EVICT_MARKER)
+    marker.ensure()
+    args = (
+        '--typing-imports-cache-dir', str(cache_dir),
+        '--typing-imports-cache-size', '0',
+    )
+
+    # evicted recently: not scanned again
+    with mock.patch.object(os, 'scandir') as scandir_mock:
+        parse_options(*args)
+    scandir_mock.assert_not_called()
+    assert cache_dir.join('aa', 'entry').exists()
+
+    marker.setmtime(
+        time.time() - flake8_typing_imports.CACHE_EVICT_INTERVAL - 1,
+    )
+    parse_options(*args)
+    assert not cache_dir.join('aa', 'entry').exists()
+    assert marker.mtime() > time.time() - 60
+
+
+def test_cache_eviction_read_only(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    cache_dir.join('aa', 'entry').write('x' * 10, ensure=True)
+    with mock.patch.object(os, 'utime', side_effect=PermissionError):
+        parse_options(
+            '--typing-imports-cache-dir', str(cache_dir),
+            '--typing-imports-cache-size', '0',
+        )
+    assert cache_dir.join('aa', 'entry').exists()
+
+
+def test_cache_eviction_concurrent_removal(tmpdir):
+    cache_dir = tmpdir.join('cache')
+    for shard in ('aa', 'bb'):
+        cache_dir.join(shard, 'entry').write('x' * 10, ensure=True)
+
+    stat = os.stat
+
+    def stat_side_effect(path):
+        if 'aa' in path:
+            raise FileNotFoundError(path)
+        return stat(path)
+
+    with mock.patch.object(os, 'stat', side_effect=stat_side_effect):
+        with mock.patch.object(os, 'remove', side_effect=FileNotFoundError):
+            parse_options(
+                '--typing-imports-cache-dir', str(cache_dir),
+                '--typing-imports-cache-size', '0',
+            )
+
+
+def test_main_ok(tmpdir, capsys):
+    tmpdir.join('a.py').write('import os\n')
+    tmpdir.join('b.py').write('from typing import Type\n')
+    assert main(['--min-python-version', '3.5.2', '-j', '1']) == 0
+    assert capsys.readouterr().out == ''
+
+
+def test_main_reports_errors(tmpdir, capsys):
+    tmpdir.join('a.py').write('from typing import Type\n')
+    tmpdir.join('pkg', 'b.py').write(
+        'import typing\nx: typing.Type\n', ensure=True,
+    )
+    tmpdir.join('pkg', 'README').write('typing')
+    tmpdir.join('.tox', 'c.py').write('from typing import Type\n', ensure=True)
+    assert main(['-j', '1', '.', 'missing.py']) == 1
+    out, _ = capsys.readouterr()
+    assert out.splitlines() == [
+        './a.py:1:1: TYP001 guard import by `if False:  # TYPE_CHECKING`: '
+        'Type (not in 3.5.0, 3.5.1)',
+        './pkg/b.py:2:4: TYP006 guard `typing` attribute by quoting: '
+        'Type (not in 3.5.0, 3.5.1)',
+        "missing.py:1:1: E902 FileNotFoundError: [Errno 2] No such file or "
+        "directory: 'missing.py'",
+    ]
+
+
+def test_main_flake8_config(tmpdir, capsys):
+    tmpdir.join('setup.cfg').write(
+        '[flake8]\n'
+        'max-line-length = 100\n'
+        'min_python_version = 3.6.0\n'
+        'typing-imports-version-ranges = true\n',
+    )
+    tmpdir.join('a.py').write('from typing import NoReturn\n')
+    assert main(['-j', '1', 'a.py']) == 1
+    out, _ = capsys.readouterr()
+    assert out == (
+        'a.py:1:1: TYP001 guard import by `if TYPE_CHECKING:`: '
+        'NoReturn (not in 3.6.0-3.6.1)\n'
+    )
+
+
+def test_main_flake8_config_as_flake8_finds_it(tmpdir, capsys):
+    tmpdir.join('setup.cfg').write('[metadata]\nname = x\n')
+    tmpdir.join('tox.ini').write('[flake8]\nmin-python-version = 3.6.0\n')
+    tmpdir.join('.flake8').write('[flake8]\nmin-python-version = 3.5.0\n')
+    src = 'from typing import NoReturn\n'
+    tmpdir.join('pkg', 'a.py').write(src, ensure=True)
+    with tmpdir.join('pkg').as_cwd():
+        assert main(['-j', '1', 'a.py']) == 1
+        out, _ = capsys.readouterr()
+        assert out.endswith('NoReturn (not in 3.6.0, 3.6.1)\n')
+        # the command line takes precedence
+        assert main(['-j', '1', '--min-python-version', '3.6.2', 'a.py']) == 0
+
+
+@pytest.mark.parametrize(
+    ('contents', 'expected'),
+    (
+        (
+            '[flake8]\ntyping-imports-cache-size = big\n',
+            "[flake8] typing-imports-cache-size: invalid value 'big'",
+        ),
+        (
+            '[flake8]\ntyping_imports_version_ranges = maybe\n',
+            "[flake8] typing_imports_version_ranges: invalid value 'maybe'",
+        ),
+        ('[flake8\n', 'flake8 configuration: '),
+    ),
+)
+def test_main_flake8_config_invalid(tmpdir, capsys, contents, expected):
+    tmpdir.join('tox.ini').write(contents)
+    with pytest.raises(SystemExit):
+        main(['-j', '1'])
+    _, err = capsys.readouterr()
+    assert expected in err
+
+
+def test_argument_parser_options_not_from_config():
+    parser = argparse.ArgumentParser()
+    options = flake8_typing_imports._ArgumentParserOptions(parser)
+    options.add_option('--from-config', parse_from_config=True)
+    options.add_option('--not-from-config')
+    options.set_config_defaults({'from-config': 'a', 'not-from-config': 'b'})
+    args = parser.parse_args([])
+    assert (args.from_config, args.not_from_config) == ('a', None)
+
+
+def test_main_module(tmpdir):
+    tmpdir.join('a.py').write('from typing import NoReturn\n')
+    cmd = (sys.executable, '-m', Plugin.name)
+    out = subprocess.check_output((*cmd, '--help'))
+    assert out.startswith(b'usage: python -m flake8_typing_imports ')
+
+    proc = subprocess.run(
+        (
+            *cmd, '--typing-imports-cache-dir', 'cache',
+            '--min-python-version', '3.6.0', 'a.py',
+        ),
+        stdout=subprocess.PIPE,
+    )
+    assert proc.returncode == 1
+    assert proc.stdout.startswith(b'a.py:1:1: TYP001 ')
+    assert tmpdir.join('cache').listdir()
+
+
+def test_main_version_ranges(tmpdir, capsys):
+    tmpdir.join('a.py').write('from typing import Type\n')
+    assert main(['-j', '1', '--typing-imports-version-ranges', 'a.py']) == 1
+    out, _ = capsys.readouterr()
+    assert out == (
+        'a.py:1:1: TYP001 guard import by `if False:  # TYPE_CHECKING`: '
+        'Type (not in 3.5.0-3.5.1)\n'
+    )
+
+
+def test_main_syntax_error(tmpdir, capsys):
+    tmpdir.join('a.py').write('import typing\nx = (\n')
+    assert main(['-j', '1', 'a.py']) == 1
+    out, _ = capsys.readouterr()
+    # the reported column differs between python versions
+    assert out.startswith('a.py:2:')
+    assert ' E999 SyntaxError: ' in out
+
+
+def test_main_null_bytes(tmpdir, capsys):
+    tmpdir.join('a.py').write_binary(b'import typing\nx = 1\0\n')
+    tmpdir.join('b.py').write('from typing import Type\n')
+    assert main(['-j', '1', 'a.py', 'b.py']) == 1
+    out, _ = capsys.readouterr()
+    a, b = out.splitlines()
+    # a ValueError before python 3.11
+    assert a.startswith('a.py:') and ' E999 ' in a
+    assert b.startswith('b.py:1:1: TYP001 ')
+
+
+def test_check_source_value_error():
+    src = 'import typing\nx = "\ud800"\n'
+    (line, col, msg, _, _), = flake8_typing_imports._check_source('t.py', src)
+    assert (line, col) == (1, 0)
+    assert msg.startswith('E999 UnicodeEncodeError: ')
+
+
+def test_main_format_jsonl(tmpdir, capsys):
+    tmpdir.join('a.py').write('from typing import Type\n')
+    tmpdir.join('b.py').write(
+        'from typing import overload\n'
+        '@overload\n'
+        'def f(x: int) -> int: ...\n',
+    )
+    ret = main(['-j', '1', '--format', 'jsonl', 'a.py', 'b.py', 'missing.py'])
+    assert ret == 1
+    out, _ = capsys.readouterr()
+    assert [json.loads(line) for line in out.splitlines()] == [
+        {
+            'filename': 'a.py',
+            'line': 1,
+            'col': 1,
+            'code': 'TYP001',
+            'symbol': 'Type',
+            'missing': ['3.5.0', '3.5.1'],
+            'floors': None,
+            'message': 'guard import by `if False:  # TYPE_CHECKING`: '
+                       'Type (not in 3.5.0, 3.5.1)',
+        },
+        {
+            'filename': 'b.py',
+            'line': 1,
+            'col': 1,
+            'code': 'TYP002',
+            'symbol': 'overload',
+            'missing': ['3.5.0', '3.5.1'],
+            'floors': None,
+            'message': '@overload is broken in <3.5.2, add '
+                       '`if sys.version_info < (3, 5, 2): '
+                       'def overload(f): return f`',
+        },
+        {
+            'filename': 'missing.py',
+            'line': 1,
+            'col': 1,
+            'code': 'E902',
+            'symbol': None,
+            'missing': None,
+            'floors': None,
+            'message': "FileNotFoundError: [Errno 2] No such file or "
+                       "directory: 'missing.py'",
+        },
+    ]
+
+
+def test_main_floors(tmpdir, capsys):
+    tmpdir.join('a.py').write('from typing import NoReturn\n')
+    tmpdir.join('b.py').write('import typing\nx = (\n')
+    argv = ['-j', '1', '--typing-imports-floors', '3.6.0,3.7.0', 'a.py']
+    assert main(argv) == 1
+    out, _ = capsys.readouterr()
+    assert out == (
+        'a.py:1:1: TYP001 guard import by `if TYPE_CHECKING:`: NoReturn '
+        '(not in 3.6.0, 3.6.1) [floors: 3.6.0]\n'
+    )
+
+    assert main([*argv, 'b.py', '--format', 'jsonl']) == 1
+    out, _ = capsys.readouterr()
+    a, b = (json.loads(line) for line in out.splitlines())
+    assert a['floors'] == ['3.6.0']
+    assert a['message'].endswith('(not in 3.6.0, 3.6.1)')
+    assert b['code'] == 'E999'
+    assert b['floors'] == ['3.6.0', '3.7.0']
+
+
+def test_main_parallel(tmpdir, capsys):
+    for i in range(10):
+        tmpdir.join(f'f{i}.py').write('from typing import Type\n')
+    assert main(['-j', '2']) == 1
+    out, _ = capsys.readouterr()
+    assert sorted(line.split(':', 1)[0] for line in out.splitlines()) == [
+        f'./f{i}.py' for i in range(10)
+    ]
+
+
+def test_profile(tmpdir, capsys):
+    profile = tmpdir.join('profile.jsonl')
+    parse_options('--typing-imports-profile', str(profile))
+    src = (
+        'import typing\n'
+        'from typing import Type\n'
+        'x: typing.Type\n'
+    )
+    with version_ctx(Version(3, 5, 0)):
+        ret = list(Plugin(ast.parse(src), src.splitlines(True), 't.py').run())
+        assert not list(Plugin(ast.parse('import typing\n')).run())
+        with mock.patch.object(Plugin, '_profile', None):
+            unprofiled = Plugin(ast.parse(src), src.splitlines(True), 't.py')
+            assert ret == list(unprofiled.run())
+    assert len(ret) == 2
+
+    first, second = profile.readlines()
+    record = json.loads(first)
+    assert record['filename'] == 't.py'
+    assert record['nodes'] > 0
+    # the messages are formatted by the checks, but timed apart from them
+    assert record['format_s'] > 0
+    assert record['errors_s'] > 0
+    assert set(record['codes']) == {'TYP001', 'TYP006'}
+    assert json.loads(second)['filename'] == '-'
+
+    assert main(['--profile-summary', str(profile)]) == 0
+    out, _ = capsys.readouterr()
+    assert out.startswith('files: 2\n')
+    assert '    TYP001: ' in out
+    assert ' t.py (' in out
+
+
+def test_profile_from_environment(tmpdir):
+    profile = str(tmpdir.join('profile.jsonl'))
+    env = {'FLAKE8_TYPING_IMPORTS_PROFILE': profile}
+    with mock.patch.dict(os.environ, env):
+        parse_options()
+    assert Plugin._profile == profile
+
+
+def test_check_many():
+    ret = list(
+        check_many(
+            (
+                'import os\n',
+                b'import os\n',
+                b'from typing import Type\n',
+                ast.parse('import typing\nx: typing.Type\n'),
+            ),
+            min_version='3.5.1',
+        ),
+    )
+    typ001 = 'TYP001 guard import by `if False:  # TYPE_CHECKING`: Type'
+    typ006 = 'TYP006 guard `typing` attribute by quoting: Type'
+    assert ret == [
+        [],
+        [],
+        [(1, 0, f'{typ001} (not in 3.5.1)')],
+        [(2, 3, f'{typ006} (not in 3.5.1)')],
+    ]
+
+
+def test_check_many_syntax_errors():
+    ret = list(
+        check_many(
+            (
+                'import typing\nx = (\n',
+                b'import typing\nx = 1\0\n',
+                'from typing import Type\n',
+            ),
+            min_version='3.5.1',
+        ),
+    )
+    (syntax_error,), (null_bytes,), typ001 = ret
+    assert syntax_error[0] == 2
+    assert syntax_error[2].startswith('E999 SyntaxError: ')
+    # a ValueError before python 3.11
+    assert null_bytes[2].startswith('E999 ')
+    assert [msg.split()[0] for _, _, msg in typ001] == ['TYP001']
+
+
+def test_check_many_min_version():
+    src = 'from typing import Type\n'
+    assert list(check_many((src,), Version(3, 5, 2))) == [[]]
+    with version_ctx(Version(3, 5, 2)):
+        assert list(check_many((src,))) == [[]]
+    with pytest.raises(ValueError):
+        list(check_many((src,), '9.9'))
+
+
+def _check_both(source, parse=True):
+    with mock.patch.object(flake8_typing_imports, 'STREAM_THRESHOLD', 0):
+        streamed = flake8_typing_imports._check_source('t.py', source)
+    if parse:
+        parsed = flake8_typing_imports._check_source(
+            't.py', source, stream=False,
+        )
+    else:
+        parsed = None
+    return streamed, parsed
+
+
+@pytest.mark.parametrize(
+    's', (
+        pytest.param(
+            'from typing import Type, X as Y\n'
+            'from typing import *\n'
+            'from typing import (\n    A,\n    B,\n)\n',
+            id='imports',
+        ),
+        pytest.param(
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import X\n'
+            'if TYPE_CHECKING: from typing import Y\n'
+            'def f():\n'
+            '    from typing import Z\n',
+            id='guarded imports',
+        ),
+        pytest.param(
+            'from typing.io import X\n'
+            'from .typing import Y\n'
+            'from os import typing\n'
+            'import typing.Z\n',
+            id='other imports',
+        ),
+        pytest.param(
+            'import typing\n'
+            'x: typing.Type = typing.X\n'
+            '@typing.X\n'
+            'def f(a: typing.X = typing.Y) -> typing.X:\n'
+            '    return (yield from typing.Z)\n'
+            'class C(typing.X, metaclass=typing.Y): pass\n'
+            'x = {typing.X: (typing.Y, [typing.Z][0])}\n'
+            'a.b(typing.X)\n'
+            'typing.X(a.b)[typing.Y]\n'
+            'x = typing.X if typing.Y else typing.Z\n'
+            'x = typing\n',
+            id='attributes',
+        ),
+        pytest.param(
+            'import typing\n'
+            'typing.X.Y\n'
+            'typing.X().y\n'
+            'f(typing.X, [typing.Y]).z\n'
+            '(typing.X).y\n'
+            '[typing.X][0].y\n'
+            'a.typing.X\n'
+            'x = f"{typing.X}".join\n',
+            id='attributes inside attributes',
+        ),
+        pytest.param(
+            'import typing\n'
+            'x = f"{typing.X!r:>{typing.Y}}"\n'
+            'y = "typing.Z"\n'
+            'z = f"{x}"\n',
+            id='strings',
+        ),
+        pytest.param(
+            'from typing import X; import typing\n'
+            "x = ('éé', typing.Final)\n"
+            "y = ('''é\néé''', typing.Y)\n"
+            'z: é[typing.Z]  # 😀\n',
+            id='non-ascii',
+        ),
+    ),
+)
+def test_stream_same_as_ast(s):
+    with version_ctx(Version(3, 6, 1)):
+        streamed, parsed = _check_both(s)
+    assert streamed == parsed
+
+
+def test_stream_needs_ast_for_surrogates():
+    src = 'import typing\nx = ("\ud800", typing.X)\n'
+    tokens = tokenize.generate_tokens(io.StringIO(src).readline)
+    with version_ctx(Version(3, 6, 1)):
+        assert flake8_typing_imports._check_tokens('t.py', tokens) is None
+
+
+def test_check_file_large_without_typing(tmpdir):
+    f = tmpdir.join('t.py')
+    # the substring spans two of the chunks read
+    f.write('# ' + 'x' * (64 * 1024 - 5) + 'typing\n')
+    with open(str(f), 'rb') as fb:
+        assert flake8_typing_imports._file_contains(fb, b'typing')
+
+    f.write('x = 1  # typ\n' + 'ing\n' * 4)
+    with mock.patch.object(flake8_typing_imports, 'STREAM_THRESHOLD', 0):
+        with mock.patch.object(tokenize, 'tokenize') as tokenize_mock:
+            assert flake8_typing_imports._check_file(str(f)) == (str(f), [])
+    tokenize_mock.assert_not_called()
+
+
+def test_stream_does_not_parse():
+    src = b'import typing\nx: typing.AsyncContextManager\n'
+    with version_ctx(Version(3, 6, 1)):
+        with mock.patch.object(ast, 'parse', side_effect=AssertionError):
+            streamed, _ = _check_both(src, parse=False)
+    assert [finding[:3] for finding in streamed] == [
+        (
+            2, 3,
+            'TYP006 guard `typing` attribute by quoting: '
+            'AsyncContextManager (not in 3.6.1)',
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    's', (
+        pytest.param('import typing; from typing import X\n', id='after ;'),
+        pytest.param('import typing\nx = (\n', id='incomplete'),
+        pytest.param('import typing\nx = typing.X)\n', id='unmatched'),
+        pytest.param('import typing\nx = $\n', id='invalid token'),
+    ),
+)
+def test_stream_needs_ast(s):
+    tokens = tokenize.generate_tokens(io.StringIO(s).readline)
+    with version_ctx(Version(3, 6, 1)):
+        assert flake8_typing_imports._check_tokens('t.py', tokens) is None
+        streamed, parsed = _check_both(s)
+    assert streamed == parsed
+
+
+def test_stream_needs_ast_for_old_checks():
+    src = 'from typing import overload\n'
+    tokens = tokenize.generate_tokens(io.StringIO(src).readline)
+    with version_ctx(Version(3, 5, 0)):
+        assert flake8_typing_imports._check_tokens('t.py', tokens) is None
+        streamed, parsed = _check_both(src)
+    assert streamed == parsed
+    assert [finding.msg.split()[0] for finding in streamed] == ['TYP002']
+
+
+def test_stream_undecodable(tmpdir, capsys):
+    src = b'import typing\nx = "\xff"\n#' + b'x' * 1024 * 1024 + b'\n'
+    assert len(src) >= flake8_typing_imports.STREAM_THRESHOLD
+    tmpdir.join('a.py').write_binary(src)
+    tmpdir.join('b.py').write('from typing import NoReturn\n')
+    # the old checks need the ast, the newer ones are checked from tokens
+    args = ['-j', '1', '--min-python-version', '3.6.1', 'a.py', 'b.py']
+    assert main(args) == 1
+    out, _ = capsys.readouterr()
+    a, b = out.splitlines()
+    assert a.startswith('a.py:') and ' E999 SyntaxError: ' in a
+    assert b.startswith('b.py:1:1: TYP001 ')
+
+    (finding,), = check_many((src,), '3.6.1')
+    assert finding[2].startswith('E999 SyntaxError: ')
+
+
+def test_main_stream(tmpdir, capsys):
+    tmpdir.join('a.py').write('import typing\nx: typing.Type\n')
+    tmpdir.join('setup.cfg').write('[options]\npython_requires = >=3.5\n')
+    tmpdir.join('new', 'b.py').write(
+        'import typing\nx: typing.X\n', ensure=True,
+    )
+    tmpdir.join('new', 'setup.cfg').write(
+        '[options]\npython_requires = >=3.7\n',
+    )
+    args = ['-j', '1', 'a.py', os.path.join('new', 'b.py')]
+    assert main(args) == 1
+    expected = capsys.readouterr()
+    with mock.patch.object(flake8_typing_imports, 'STREAM_THRESHOLD', 0):
+        assert main(args) == 1
+    assert capsys.readouterr() == expected
+
+
+@pytest.fixture
+def git_repo(tmpdir):
+    def git(*args):
+        subprocess.check_call(
+            ('git', '-c', 'user.name=u', '-c', 'user.email=e', *args),
+            stdout=subprocess.DEVNULL,
+        )
+
+    src = 'from typing import Type\n'
+    tmpdir.join('a.py').write(src)
+    tmpdir.join('pkg', 'b.py').write(src, ensure=True)
+    tmpdir.join('pkg', 'c.py').write(src)
+    git('init', '-q', '.')
+    git('add', '.')
+    git('commit', '-q', '-m', 'initial')
+    yield git
+
+
+def test_main_diff_base(tmpdir, git_repo, capsys):
+    tmpdir.join('pkg', 'b.py').write('from typing import Type  # changed\n')
+    tmpdir.join('pkg', 'd.py').write('from typing import Type\n')
+    tmpdir.join('pkg', 'README.md').write('from typing import Type\n')
+    tmpdir.join('pkg', 'c.py').remove()
+    tmpdir.join('.tox', 'e.py').write('from typing import Type\n', ensure=True)
+    expected = [os.path.join('pkg', 'b.py'), os.path.join('pkg', 'd.py')]
+
+    assert main(['-j', '1', '--diff-base', 'HEAD']) == 1
+    out, _ = capsys.readouterr()
+    assert [line.split(':')[0] for line in out.splitlines()] == expected
+
+    assert main(['-j', '1', '--diff-base', 'HEAD', 'pkg']) == 1
+    out, _ = capsys.readouterr()
+    assert [line.split(':')[0] for line in out.splitlines()] == expected
+
+    assert main(['-j', '1', '--diff-base', 'HEAD', 'a.py']) == 0
+    assert main(['-j', '1', '--diff-base', 'HEAD', 'pkg/d.py']) == 1
+
+
+def test_main_diff_base_paths_outside_current_directory(
+        tmpdir, git_repo, capsys,
+):
+    tmpdir.join('pkg', 'd.py').write('from typing import Type\n')
+    tmpdir.join('a.py').write('from typing import Type  # changed\n')
+    expected = [os.path.join('..', 'a.py'), 'd.py']
+
+    with tmpdir.join('pkg').as_cwd():
+        assert main(['-j', '1', '--diff-base', 'HEAD', '..']) == 1
+        out, _ = capsys.readouterr()
+        assert [line.split(':')[0] for line in out.splitlines()] == expected
+
+        assert main(['-j', '1', '--diff-base', 'HEAD', str(tmpdir)]) == 1
+        out, _ = capsys.readouterr()
+        assert [line.split(':')[0] for line in out.splitlines()] == expected
+
+        argv = ['-j', '1', '--diff-base', 'HEAD', str(tmpdir.join('a.py'))]
+        assert main(argv) == 1
+        out, _ = capsys.readouterr()
+        assert [line.split(':')[0] for line in out.splitlines()] == [
+            os.path.join('..', 'a.py'),
+        ]
+
+
+def test_main_diff_base_unknown_revision(tmpdir, git_repo, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(['-j', '1', '--diff-base', 'does-not-exist'])
+    assert excinfo.value.code == 2
+    _, err = capsys.readouterr()
+    assert "--diff-base: fatal: bad revision 'does-not-exist'" in err
+
+
+def test_main_diff_base_without_git(tmpdir, capsys):
+    with mock.patch.object(
+            subprocess, 'run',
+            side_effect=FileNotFoundError(2, 'No such file or directory'),
+    ):
+        with pytest.raises(SystemExit):
+            main(['-j', '1', '--diff-base', 'HEAD'])
+    _, err = capsys.readouterr()
+    assert '--diff-base: [Errno 2] No such file or directory' in err
+
+
+def test_main_diff_base_config_changed(tmpdir, git_repo, capsys):
+    tmpdir.join('setup.cfg').write('[options]\npython_requires = >=3.5\n')
+    assert main(['-j', '1', '--diff-base', 'HEAD', 'pkg']) == 1
+    out, _ = capsys.readouterr()
+    assert [line.split(':')[0] for line in out.splitlines()] == [
+        os.path.join('pkg', 'b.py'), os.path.join('pkg', 'c.py'),
+    ]
+
+
+@pytest.fixture
+def daemon(tmpdir):
+    path = str(tmpdir.join('sock'))
+    with flake8_typing_imports._daemon_server(path) as server:
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={'poll_interval': .01},
+        )
+        thread.start()
+        try:
+            yield path
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+def _daemon_requests(path, *requests):
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(path)
+        for request in requests:
+            sock.sendall(request + b'\n')
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile('rb') as f:
+            return [json.loads(line) for line in f]
+
+
+def test_daemon(tmpdir, daemon):
+    assert stat.S_IMODE(os.stat(daemon).st_mode) == 0o600
+    tmpdir.join('a.py').write('from typing import Type\n')
+    requests = (
+        {'filename': str(tmpdir.join('a.py'))},
+        {'filename': 'b.py', 'source': 'import typing\nx: typing.Type\n'},
+        {'filename': 'c.py', 'source': 'import os\n'},
+        {'filename': 'd.py', 'source': 'import typing\nx = (\n'},
+        {'filename': 'missing.py'},
+    )
+    ret = _daemon_requests(
+        daemon, *(json.dumps(request).encode() for request in requests)
+    )
+    (_, _, msg), = ret.pop(3)['results']
+    assert msg.startswith('E999 SyntaxError: ')
+    assert ret == [
+        {
+            'filename': str(tmpdir.join('a.py')),
+            'results': [[
+                1, 0,
+                'TYP001 guard import by `if False:  # TYPE_CHECKING`: '
+                'Type (not in 3.5.0, 3.5.1)',
+            ]],
+        },
+        {
+            'filename': 'b.py',
+            'results': [[
+                2, 3,
+                'TYP006 guard `typing` attribute by quoting: '
+                'Type (not in 3.5.0, 3.5.1)',
+            ]],
+        },
+        {'filename': 'c.py', 'results': []},
+        {
+            'filename': 'missing.py',
+            'results': [[
+                1, 0,
+                "E902 FileNotFoundError: [Errno 2] No such file or directory: "
+                "'missing.py'",
+            ]],
+        },
+    ]
+
+
+def test_daemon_invalid_requests(daemon):
+    ret = _daemon_requests(
+        daemon,
+        b'{',
+        b'[]',
+        b'{"filename": 3}',
+        b'{"filename": "a.py", "source": null}',
+    )
+    assert ret[0]['error'].startswith('invalid json: ')
+    expected = {'error': 'expected {"filename": str, "source": str?}'}
+    assert ret[1:] == [expected] * 3
+
+
+def test_daemon_error_keeps_the_connection(tmpdir, daemon):
+    tmpdir.join('a.py').write('from typing import Type\n')
+    check_file = flake8_typing_imports._check_file
+
+    def check_file_side_effect(filename):
+        if filename == 'bad.py':
+            raise RuntimeError('bad')
+        return check_file(filename)
+
+    with mock.patch.object(
+            flake8_typing_imports, '_check_file',
+            side_effect=check_file_side_effect,
+    ):
+        ret = _daemon_requests(
+            daemon,
+            b'{"filename": "bad.py"}',
+            json.dumps({'filename': str(tmpdir.join('a.py'))}).encode(),
+        )
+    first, second = ret
+    assert first == {'error': 'RuntimeError: bad'}
+    (_, _, msg), = second['results']
+    assert msg.startswith('TYP001 ')
+
+
+def test_daemon_replaces_stale_socket(tmpdir):
+    path = str(tmpdir.join('sock'))
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.bind(path)
+    with flake8_typing_imports._daemon_server(path):
+        pass
+
+
+def test_daemon_does_not_replace_other_files(tmpdir):
+    tmpdir.join('sock').write('important')
+    with pytest.raises(OSError):
+        flake8_typing_imports._daemon_server(str(tmpdir.join('sock')))
+    assert tmpdir.join('sock').read() == 'important'
+
+
+def test_daemon_does_not_replace_running_daemon(daemon):
+    with pytest.raises(OSError):
+        flake8_typing_imports._daemon_server(daemon)
+    assert _daemon_requests(daemon, b'{"filename": "a.py", "source": ""}')
+
+
+def test_main_serve(tmpdir):
+    with mock.patch.object(
+            socketserver.BaseServer, 'serve_forever',
+            side_effect=KeyboardInterrupt,
+    ):
+        assert main(['--serve', str(tmpdir.join('sock'))]) == 0
+    assert not tmpdir.join('sock').exists()
+
+
+@pytest.mark.parametrize(
+    ('s', 'expected'),
+    (
+        pytest.param(
+            'from typing import NoReturn\n'
+            '\n'
+            '\n'
+            'def f() -> NoReturn:\n'
+            '    raise SystemExit\n',
+
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import NoReturn\n'
+            '\n'
+            '\n'
+            "def f() -> 'NoReturn':\n"
+            '    raise SystemExit\n',
+
+            id='whole statement',
+        ),
+        pytest.param(
+            'from typing import Deque, List, Optional\n'
+            'x: Optional[Deque[List[int]]]\n',
+
+            'from typing import List, Optional\n'
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import Deque\n'
+            "x: Optional['Deque[List[int]]']\n",
+
+            id='first alias',
+        ),
+        pytest.param(
+            'from typing import List, Deque\nx: Deque[int]\n',
+
+            'from typing import List\n'
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import Deque\n'
+            "x: 'Deque[int]'\n",
+
+            id='last alias',
+        ),
+        pytest.param(
+            'from typing import (\n'
+            '    Deque,\n'
+            '    List,  # hello\n'
+            '    NoReturn,\n'
+            ')\n'
+            'x: Deque[List[NoReturn]]\n',
+
+            'from typing import (\n'
+            '    List,  # hello\n'
+            ')\n'
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import Deque\n'
+            '    from typing import NoReturn\n'
+            "x: 'Deque[List[NoReturn]]'\n",
+
+            id='aliases on their own lines',
+        ),
+        pytest.param(
+            'from typing import (  # hi\n'
+            '    Deque, List\n'
+            ')\n'
+            'x: Deque[int]\n',
+
+            'from typing import (  # hi\n'
+            '    List\n'
+            ')\n'
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import Deque\n'
+            "x: 'Deque[int]'\n",
+
+            id='parenthesized aliases sharing a line',
+        ),
+        pytest.param(
+            'from typing import (\n'
+            '    List, Deque,\n'
+            '    NoReturn,\n'
+            '    Any,\n'
+            ')\n'
+            'x: Deque[NoReturn]\n',
+
+            'from typing import (\n'
+            '    List, Any,\n'
+            ')\n'
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import Deque\n'
+            '    from typing import NoReturn\n'
+            "x: 'Deque[NoReturn]'\n",
+
+            id='parenthesized aliases on and sharing lines',
+        ),
+        pytest.param(
+            'from typing import Deque as D\n'
+            'from typing import TYPE_CHECKING\n'
+            'x: D[int]\n',
+
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import Deque as D\n'
+            "x: 'D[int]'\n",
+
+            id='as, after the existing TYPE_CHECKING',
+        ),
+        pytest.param(
+            'import typing\n'
+            'def f(x: typing.Deque[Literal["a"]]) -> typing.NoReturn: ...\n'
+            'y: typing.Deque[typing.Deque[int]]\n',
+
+            'import typing\n'
+            "def f(x: 'typing.Deque[Literal[\"a\"]]') -> 'typing.NoReturn': "
+            '...\n'
+            "y: 'typing.Deque[typing.Deque[int]]'\n",
+
+            id='attributes',
+        ),
+        pytest.param(
+            'from typing import Deque\nx: Deque[typing.Deque[int]]\n',
+
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import Deque\n'
+            "x: 'Deque[typing.Deque[int]]'\n",
+
+            id='attribute inside a moved name',
+        ),
+        pytest.param(
+            'def f(x: Deque): ...\nfrom typing import List, Deque',
+
+            "def f(x: 'Deque'): ...\n"
+            'from typing import List\n'
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import Deque\n',
+
+            id='no newline at end of file',
+        ),
+        pytest.param(
+            'x: Deque\nfrom typing import Deque',
+
+            "x: 'Deque'\n"
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import Deque\n',
+
+            id='whole statement without newline at end of file',
+        ),
+        pytest.param(
+            'from typing import NoReturn\r\ndef f() -> NoReturn: ...\r\n',
+
+            'from typing import TYPE_CHECKING\r\n'
+            'if TYPE_CHECKING:\r\n'
+            '    from typing import NoReturn\r\n'
+            "def f() -> 'NoReturn': ...\r\n",
+
+            id='crlf',
+        ),
+        pytest.param(
+            'from typing import Deque\n\xe9: Deque[int] = 1\n',
+
+            'from typing import TYPE_CHECKING\n'
+            'if TYPE_CHECKING:\n'
+            '    from typing import Deque\n'
+            "\xe9: 'Deque[int]' = 1\n",
+
+            id='non-ascii columns',
+        ),
+    ),
+)
+def test_fix_source(s, expected):
+    ret = flake8_typing_imports._fix_source(s, Version(3, 6, 0))
+    assert ret == expected
+
+
+def test_fix_source_before_type_checking():
+    s = 'from typing import NoReturn\ndef f() -> NoReturn: ...\n'
+    ret = flake8_typing_imports._fix_source(s, Version(3, 5, 0))
+    assert ret == (
+        'if False:  # TYPE_CHECKING\n'
+        '    from typing import NoReturn\n'
+        "def f() -> 'NoReturn': ...\n"
+    )
+
+
+@pytest.mark.parametrize(
+    's',
+    (
+        pytest.param('from typing import Any\nx: Any\n', id='nothing to fix'),
+        pytest.param('import typing\nx = (\n', id='syntax error'),
+        pytest.param('import typing\nx = "\ud800"\n', id='value error'),
+        pytest.param('from typing import *\n', id='star import'),
+        pytest.param(
+            'from typing import NoReturn\nx = NoReturn\n',
+            id='used outside of annotations',
+        ),
+        pytest.param(
+            'import typing\nx = typing.Deque[int]\n',
+            id='attribute outside of annotations',
+        ),
+        pytest.param(
+            'x = 1; from typing import NoReturn\ndef f() -> NoReturn: ...\n',
+            id='after another statement',
+        ),
+        pytest.param(
+            'from typing import NoReturn; import os\n'
+            'def f() -> NoReturn: ...\n',
+            id='before another statement',
+        ),
+        pytest.param(
+            'from typing import NoReturn  # noqa\ndef f() -> NoReturn: ...\n',
+            id='import noqa',
+        ),
+        pytest.param(
+            'from typing import NoReturn\n'
+            'def f() -> NoReturn: ...  # noqa: TYP001\n',
+            id='use noqa',
+        ),
+        pytest.param(
+            'import typing\nx: typing.Deque[int]  # NOQA\n',
+            id='attribute noqa',
+        ),
+        pytest.param(
+            'from typing import Deque\ndef f(x: Deque[\n    int,\n]): ...\n',
+            id='multiple lines',
+        ),
+        pytest.param(
+            'import typing\nx: typing.Deque[\n    int,\n]\n',
+            id='attribute on multiple lines',
+        ),
+        pytest.param(
+            'from typing import Deque\nx: Deque[Literal[\'a\', "b"]]\n',
+            id='both quotes',
+        ),
+        pytest.param(
+            "from typing import Deque\nx: Deque[Literal['\\n']]\n",
+            id='backslash',
+        ),
+    ),
+)
+def test_fix_source_noop(s):
+    assert flake8_typing_imports._fix_source(s, Version(3, 6, 0)) == s
+
+
+def test_fix_source_leaves_the_rest():
+    src = (
+        'from typing import Deque, NoReturn\n'
+        'import typing\n'
+        'x = NoReturn\n'
+        'def f(x: Deque[int]) -> typing.ChainMap[str, int]: ...\n'
+    )
+    fixed = flake8_typing_imports._fix_source(src, Version(3, 6, 0))
+    assert list(check_many([fixed], '3.6.0')) == [
+        [
+            (
+                1, 0,
+                'TYP001 guard import by `if TYPE_CHECKING:`: NoReturn '
+                '(not in 3.6.0, 3.6.1)',
+            ),
+        ],
+    ]
+    assert flake8_typing_imports._fix_source(fixed, Version(3, 6, 0)) == fixed
+
+
+def test_main_fix(tmpdir, capsys):
+    tmpdir.join('setup.cfg').write('[options]\npython_requires = >=3.6')
+    tmpdir.join('a.py').write(
+        'from typing import NoReturn\n'
+        'x = NoReturn\n'
+        'def f() -> NoReturn: ...\n'
+        'def g() -> typing.ChainMap[str, int]: ...\n',
+    )
+    tmpdir.join('a.py').chmod(0o755)
+    tmpdir.join('b.py').write('from typing import Any\n')
+    tmpdir.join('c.py').write('import os\n')
+    assert main(['-j', '1', '--fix', 'a.py', 'b.py', 'c.py']) == 1
+    out, err = capsys.readouterr()
+    assert out == (
+        'a.py:1:1: TYP001 guard import by `if TYPE_CHECKING:`: NoReturn '
+        '(not in 3.6.0, 3.6.1)\n'
+    )
+    assert err == 'Rewriting a.py\n'
+    assert tmpdir.join('a.py').read() == (
+        'from typing import NoReturn\n'
+        'x = NoReturn\n'
+        'def f() -> NoReturn: ...\n'
+        "def g() -> 'typing.ChainMap[str, int]': ...\n"
+    )
+    assert stat.S_IMODE(tmpdir.join('a.py').stat().mode) == 0o755
+    assert tmpdir.join('b.py').read() == 'from typing import Any\n'
+    assert sorted(p.basename for p in tmpdir.listdir()) == [
+        'a.py', 'b.py', 'c.py', 'setup.cfg',
+    ]
+
+
+def test_main_fix_everything(tmpdir, capsys):
+    tmpdir.join('a.py').write('import typing\nx: typing.Type[int]\n')
+    assert main(['-j', '1', '--fix', 'a.py']) == 1
+    assert capsys.readouterr() == ('', 'Rewriting a.py\n')
+    assert main(['-j', '1', '--fix', 'a.py']) == 0
+    assert capsys.readouterr() == ('', '')
+
+
+def test_main_fix_parallel(tmpdir, capsys):
+    for i in range(10):
+        tmpdir.join(f'f{i}.py').write('import typing\nx: typing.Type[int]\n')
+    assert main(['-j', '2', '--fix']) == 1
+    _, err = capsys.readouterr()
+    assert sorted(err.splitlines()) == [
+        f'Rewriting ./f{i}.py' for i in range(10)
+    ]
+    for i in range(10):
+        assert tmpdir.join(f'f{i}.py').read() == (
+            "import typing\nx: 'typing.Type[int]'\n"
+        )
+
+
+def test_main_fix_symlink(tmpdir, capsys):
+    tmpdir.join('src', 'a.py').write(
+        'import typing\nx: typing.Type[int]\n', ensure=True,
+    )
+    tmpdir.join('src', 'a.py').chmod(0o640)
+    tmpdir.join('a.py').mksymlinkto(os.path.join('src', 'a.py'))
+    assert main(['-j', '1', '--min-python-version', '3.5.0', '--fix', 'a.py'])
+    assert capsys.readouterr().err == 'Rewriting a.py\n'
+    assert tmpdir.join('a.py').islink()
+    assert tmpdir.join('src', 'a.py').read() == (
+        "import typing\nx: 'typing.Type[int]'\n"
+    )
+    assert stat.S_IMODE(tmpdir.join('src', 'a.py').stat().mode) == 0o640
+
+
+def test_fix_file_keeps_owner(tmpdir):
+    tmpdir.join('a.py').write('import typing\nx: typing.Type[int]\n')
+    st = tmpdir.join('a.py').stat()
+    with mock.patch.object(os, 'chown') as chown_mock:
+        _, _, fixed = flake8_typing_imports._fix_file('a.py')
+    assert fixed
+    (_, uid, gid), _ = chown_mock.call_args
+    assert (uid, gid) == (st.uid, st.gid)
+
+
+def test_fix_file_cannot_keep_owner(tmpdir):
+    tmpdir.join('a.py').write('import typing\nx: typing.Type[int]\n')
+    with mock.patch.object(os, 'chown', side_effect=PermissionError):
+        _, results, fixed = flake8_typing_imports._fix_file('a.py')
+    assert (results, fixed) == ([], True)
+    assert tmpdir.join('a.py').read() == (
+        "import typing\nx: 'typing.Type[int]'\n"
+    )
+
+
+def test_fix_file_keeps_encoding(tmpdir):
+    src = '# -*- coding: latin-1 -*-\nimport typing\n\xe9: typing.Type[int]\n'
+    tmpdir.join('a.py').write_binary(src.encode('latin-1'))
+    _, results, fixed = flake8_typing_imports._fix_file('a.py')
+    assert (results, fixed) == ([], True)
+    assert tmpdir.join('a.py').read_binary() == (
+        b"# -*- coding: latin-1 -*-\nimport typing\n\xe9: 'typing.Type[int]'\n"
+    )
+
+
+@pytest.mark.parametrize(
+    'contents',
+    (
+        b'# -*- coding: wat -*-\nimport typing\n',
+        b'import typing\nx = "\xe9"\n',
+    ),
+)
+def test_fix_file_cannot_decode(tmpdir, contents):
+    tmpdir.join('a.py').write_binary(contents)
+    _, results, fixed = flake8_typing_imports._fix_file('a.py')
+    assert [f.msg.split(':')[0] for f in results] == ['E999 SyntaxError']
+    assert not fixed
+    assert tmpdir.join('a.py').read_binary() == contents
+
+
+def test_fix_file_missing(tmpdir):
+    _, results, fixed = flake8_typing_imports._fix_file('missing.py')
+    assert results == [
+        (
+            1, 0,
+            "E902 FileNotFoundError: [Errno 2] No such file or directory: "
+            "'missing.py'",
+            None, 0,
+        ),
+    ]
+    assert not fixed
+
+
+def test_fix_file_write_failure_removes_temporary_file(tmpdir):
+    tmpdir.join('a.py').write('import typing\nx: typing.Type[int]\n')
+    with mock.patch.object(os, 'replace', side_effect=OSError):
+        with pytest.raises(OSError):
+            flake8_typing_imports._fix_file('a.py')
+    assert tmpdir.listdir() == [tmpdir.join('a.py')]
+    assert tmpdir.join('a.py').read() == 'import typing\nx: typing.Type[int]\n'